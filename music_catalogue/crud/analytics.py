@@ -0,0 +1,257 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from music_catalogue.crud.supabase_client import get_supabase
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.utils.batching import chunked, gather_bounded
+from supabase import PostgrestAPIError
+
+# Number of rows read per request when scanning a whole table
+SCAN_PAGE_SIZE = 1000
+# Number of IDs filtered on in each scan, to keep request URLs short
+FILTER_CHUNK_SIZE = 100
+# Number of artists or works whose precomputed neighbours are replaced in each write
+WRITE_CHUNK_SIZE = 500
+# Maximum number of writes in flight at once
+WRITE_MAX_CONCURRENT_CHUNKS = 4
+
+
+async def _scan(
+    table: str, columns: str, *order_by: str, in_: Optional[Tuple[str, Sequence[str]]] = None
+) -> List[Dict]:
+    supabase = await get_supabase()
+    rows: List[Dict] = []
+    while True:
+        # Order by unique columns so pages don't overlap or skip rows
+        query = supabase.table(table).select(columns)
+        if in_ is not None:
+            query = query.in_(*in_)
+        for column in order_by:
+            query = query.order(column)
+        res = await query.range(len(rows), len(rows) + SCAN_PAGE_SIZE - 1).execute()
+        rows.extend(res.data)
+        if len(res.data) < SCAN_PAGE_SIZE:
+            return rows
+
+
+async def get_artist_ids() -> List[str]:
+    """
+    Get the UUID of every artist
+
+    Returns:
+        List[str]: The artist UUIDs
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        return [row["artist_id"] for row in await _scan("artists", "artist_id", "artist_id")]
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_persons() -> List[Dict]:
+    """
+    Get the names and life dates of every person, for the duplicate persons job
+
+    Returns:
+        List[Dict]: Rows with the person_id, legal_name, alternative_names, birth_date and death_date of each person
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        return await _scan("persons", "person_id, legal_name, alternative_names, birth_date, death_date", "person_id")
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_artist_credits() -> List[Dict]:
+    """
+    Get every work and version each artist is credited on or is the primary artist of
+
+    Returns:
+        List[Dict]: Rows with the artist_id, work_id and version_id of each discography entry
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        return await _scan("artist_discography", "artist_id, work_id, version_id", "entry_id")
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_artist_persons() -> List[Tuple[str, str]]:
+    """
+    Get the persons behind each artist: the person of a solo artist and the members of a group
+
+    Returns:
+        List[Tuple[str, str]]: (artist ID, person ID) pairs
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        artist_rows, membership_rows = await asyncio.gather(
+            _scan("artists", "artist_id, person_id", "artist_id"),
+            _scan("artist_memberships", "group_id, person_id", "membership_id"),
+        )
+
+        return [(row["artist_id"], row["person_id"]) for row in artist_rows if row.get("person_id")] + [
+            (row["group_id"], row["person_id"])
+            for row in membership_rows
+            if row.get("group_id") and row.get("person_id")
+        ]
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def _replace_chunk(function: str, ids_param: str, ids: Sequence[str], rows_by_id: Dict[str, List[Dict]]) -> None:
+    supabase = await get_supabase()
+    await supabase.rpc(
+        function,
+        {ids_param: list(ids), "payload": [row for id in ids for row in rows_by_id.get(id, [])]},
+    ).execute()
+
+
+async def _replace_all(function: str, ids_param: str, ids: List[str], rows_by_id: Dict[str, List[Dict]]) -> None:
+    await gather_bounded(
+        (_replace_chunk(function, ids_param, chunk, rows_by_id) for chunk in chunked(ids, WRITE_CHUNK_SIZE)),
+        WRITE_MAX_CONCURRENT_CHUNKS,
+    )
+
+
+async def replace_related_artists(artist_ids: List[str], related_by_artist: Dict[str, List[Dict]]) -> None:
+    """
+    Replace the stored related artists of several artists, one transaction per chunk of artists
+
+    Args:
+        artist_ids (List[str]): The UUIDs of every artist to replace the related artists of. Artists without rows in
+            related_by_artist are left without related artists
+        related_by_artist (Dict[str, List[Dict]]): The artist_related rows of each artist
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        await _replace_all("replace_artist_related", "artist_ids", artist_ids, related_by_artist)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_work_features() -> Tuple[List[Dict], List[Dict]]:
+    """
+    Get the fields of every work the similar works job compares, and the genres of every work
+
+    Returns:
+        Tuple[List[Dict], List[Dict]]: The work rows, and the work_id and genre_id of every work genre
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        return await asyncio.gather(
+            _scan("works", "work_id, title, language, themes, sentiment, origin_year_start", "work_id"),
+            _scan("work_genres", "work_id, genre_id", "work_id", "genre_id"),
+        )
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_works_without_similarities() -> List[str]:
+    """
+    Get the works the similar works job hasn't computed similar works for yet, such as newly created ones
+
+    Returns:
+        List[str]: The work UUIDs
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        return [row["work_id"] for row in await _scan("works_without_similarities", "work_id", "work_id")]
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_work_similarity_floors() -> Dict[str, Tuple[int, float]]:
+    """
+    Get the number of stored similar works and the lowest stored similarity of every work with similar works
+
+    Returns:
+        Dict[str, Tuple[int, float]]: The number of similar works and lowest score of each work UUID
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        rows = await _scan("work_similarity_floors", "work_id, neighbour_count, min_score", "work_id")
+
+        return {row["work_id"]: (row["neighbour_count"], row["min_score"]) for row in rows}
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_works_listing(similar_work_ids: List[str]) -> List[str]:
+    """
+    Get the works that have any of several works among their stored similar works
+
+    Args:
+        similar_work_ids (List[str]): The UUIDs of the similar works to look for
+
+    Returns:
+        List[str]: The UUIDs of the works listing any of them, without duplicates
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        chunks = await asyncio.gather(
+            *(
+                _scan("work_similarities", "work_id", "work_id", "similar_work_id", in_=("similar_work_id", chunk))
+                for chunk in chunked(similar_work_ids, FILTER_CHUNK_SIZE)
+            )
+        )
+
+        return list(dict.fromkeys(row["work_id"] for rows in chunks for row in rows))
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def replace_work_similarities(work_ids: List[str], similar_by_work: Dict[str, List[Dict]]) -> None:
+    """
+    Replace the stored similar works of several works, one transaction per chunk of works
+
+    Args:
+        work_ids (List[str]): The UUIDs of every work to replace the similar works of, which are marked as computed.
+            Works without rows in similar_by_work are left without similar works
+        similar_by_work (Dict[str, List[Dict]]): The work_similarities rows of each work
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        await _replace_all("replace_work_similarities", "work_ids", work_ids, similar_by_work)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
@@ -1,13 +1,35 @@
 from typing import List, Optional
 
 from music_catalogue.crud.supabase_client import get_supabase
-from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.inputs.artist_create import ArtistCreate
-from music_catalogue.models.responses.artists import Artist, ArtistMembership
-from music_catalogue.models.utils import _parse, _parse_list
-from music_catalogue.models.validation import validate_uuid
+from music_catalogue.models.exceptions import APIError, ConflictError
+from music_catalogue.models.inputs.artist_create import ArtistCreate, ArtistUpdate
+from music_catalogue.models.inputs.entity_merge import EntityMerge
+from music_catalogue.models.responses.artists import Artist, ArtistMembership, DiscographyEntry, RelatedArtist
+from music_catalogue.models.responses.batch import BatchResult, Page
+from music_catalogue.models.utils import _parse, _parse_list, _to_batch_result
+from music_catalogue.models.validation import validate_uuid, validate_uuid_list, validate_year
+from music_catalogue.utils.batching import chunked, gather_bounded
+from music_catalogue.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_year_cursor,
+    encode_year_cursor,
+    validate_page_size,
+)
 from supabase import PostgrestAPIError
 
+# Default number of artists sent in each bulk upsert
+BULK_CHUNK_SIZE = 500
+# Maximum number of bulk upsert chunks in flight at once
+BULK_MAX_CONCURRENT_CHUNKS = 4
+# Maximum number of related artists stored per artist by the related artists batch job
+MAX_RELATED_ARTISTS = 20
+
+_ARTIST_DETAIL_SELECT = """
+    *,
+    artist_memberships(*, person:persons(*)),
+    credits(*, works(*), versions(*))
+"""
+
 
 async def get_by_id(id: str) -> Optional[Artist]:
     """
@@ -28,19 +50,7 @@ async def get_by_id(id: str) -> Optional[Artist]:
         validate_uuid(id)
 
         supabase = await get_supabase()
-        res = await (
-            supabase.table("artists")
-            .select(
-                """
-                *,
-                artist_memberships(*, person:persons(*)),
-                credits(*, works(*), versions(*))
-            """
-            )
-            .eq("artist_id", id)
-            .single()
-            .execute()
-        )
+        res = await supabase.table("artists").select(_ARTIST_DETAIL_SELECT).eq("artist_id", id).single().execute()
 
         return _parse(Artist, res.data)
     except PostgrestAPIError as e:
@@ -51,6 +61,37 @@ async def get_by_id(id: str) -> Optional[Artist]:
         raise e
 
 
+async def get_by_ids(ids: List[str]) -> BatchResult[Artist]:
+    """
+    Get several artists by their UUIDs in a single query
+
+    Args:
+        ids (List[str]): The UUIDs of the artists to retrieve
+
+    Returns:
+        BatchResult[Artist]: The artists found, in the order requested, and the IDs that don't exist
+
+    Raises:
+        ValidationError: If any UUID format is invalid or too many IDs are requested
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID formats and batch size, and raise if invalid
+        ids = validate_uuid_list(ids)
+
+        if not ids:
+            return _to_batch_result(Artist, ids, [])
+
+        supabase = await get_supabase()
+        res = await supabase.table("artists").select(_ARTIST_DETAIL_SELECT).in_("artist_id", ids).execute()
+
+        return _to_batch_result(Artist, ids, _parse_list(Artist, res.data))
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
 async def search(query: str) -> List[Artist]:
     """
     Search for an artist based on a text query
@@ -87,6 +128,147 @@ async def search(query: str) -> List[Artist]:
         raise e
 
 
+async def get_members(id: str, year: Optional[int] = None) -> List[ArtistMembership]:
+    """
+    Get the members of a group artist, optionally only the ones active in a given year
+
+    Args:
+        id (str): The UUID of the group artist
+        year (int, optional): Only include memberships active in this year. Memberships with unknown years are included
+
+    Returns:
+        List[ArtistMembership]: The memberships of the group with their persons, ordered by start year
+
+    Raises:
+        ValidationError: If the UUID format or year is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+
+        supabase = await get_supabase()
+        query = supabase.table("artist_memberships").select("*, person:persons(*)").eq("group_id", id)
+        if year is not None:
+            validate_year(year)
+            query = query.filter("active_years", "ov", f"[{year},{year}]")
+        res = await query.order("start_year").execute()
+
+        return _parse_list(ArtistMembership, res.data)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_related(id: str, limit: int = MAX_RELATED_ARTISTS) -> List[RelatedArtist]:
+    """
+    Get the artists most related to an artist by shared works, versions and members, as last computed by the related
+    artists batch job
+
+    Args:
+        id (str): The UUID of the artist
+        limit (int, optional): The maximum number of related artists returned
+
+    Returns:
+        List[RelatedArtist]: The related artists, from most to least related
+
+    Raises:
+        ValidationError: If the UUID format or limit is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+        if not 1 <= limit <= MAX_RELATED_ARTISTS:
+            raise ValueError(f"Invalid limit {limit}: must be between 1 and {MAX_RELATED_ARTISTS}")
+
+        supabase = await get_supabase()
+        res = await (
+            supabase.table("artist_related")
+            .select(
+                "rank, score, shared_works, shared_versions, shared_members, "
+                "related:artists!fk_artist_related_related(*)"
+            )
+            .eq("artist_id", id)
+            .order("rank")
+            .limit(limit)
+            .execute()
+        )
+
+        return _parse_list(RelatedArtist, res.data)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_discography(
+    id: str,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    roles: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Page[DiscographyEntry]:
+    """
+    Get a page of the works and versions an artist is credited on, ordered by year with undated entries last
+
+    Args:
+        id (str): The UUID of the artist
+        year_from (int, optional): The earliest year to include
+        year_to (int, optional): The latest year to include
+        roles (List[str], optional): Only include entries with one of these roles
+        cursor (str, optional): The cursor returned with the previous page
+        page_size (int, optional): The maximum number of entries in the page
+
+    Returns:
+        Page[DiscographyEntry]: The entries in the page and the cursor for the next one, if there are more
+
+    Raises:
+        ValidationError: If the UUID format, years, cursor or page size are invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+        validate_page_size(page_size)
+        for year in (year_from, year_to):
+            if year is not None:
+                validate_year(year)
+        if year_from is not None and year_to is not None and year_from > year_to:
+            raise ValueError("Invalid years: Start year should be before or equal to end year.")
+
+        after_sort_year, after_entry_id = decode_year_cursor(cursor) if cursor else (None, None)
+
+        supabase = await get_supabase()
+        # Ask for one extra entry to know whether there is a next page
+        res = await supabase.rpc(
+            "artist_discography_page",
+            {
+                "target_artist_id": id,
+                "year_from": year_from,
+                "year_to": year_to,
+                "roles": roles or None,
+                "after_sort_year": after_sort_year,
+                "after_entry_id": after_entry_id,
+                "page_size": page_size + 1,
+            },
+        ).execute()
+
+        rows = res.data or []
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_year_cursor(rows[-1]["sort_year"], rows[-1]["entry_id"])
+
+        return Page[DiscographyEntry](results=_parse_list(DiscographyEntry, rows), next_cursor=next_cursor)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
 async def create(artist_data: ArtistCreate) -> Artist:
     """
     Create a new artist record and its optional nested members
@@ -101,6 +283,7 @@ async def create(artist_data: ArtistCreate) -> Artist:
         ValidationError: If the input data is invalid
         APIError: If Supabase throws an error
     """
+    artist = None
     try:
         supabase = await get_supabase()
 
@@ -135,3 +318,133 @@ async def create(artist_data: ArtistCreate) -> Artist:
         raise APIError(str(e)) from None
     except Exception as e:
         raise e
+
+
+async def merge(id: str, merge_data: EntityMerge) -> Optional[Artist]:
+    """
+    Merge duplicate artists into an artist in one transaction, repointing every reference to them and deleting them.
+    The artist keeps its values, only filling in the missing ones from the duplicates, whose display names become
+    alternative names. A solo artist without a person gets a duplicate's person, a group never does
+
+    Args:
+        id (str): The UUID of the artist to keep
+        merge_data (EntityMerge): The UUIDs of the duplicate artists to merge into it
+
+    Returns:
+        Optional[Artist]: The merged artist, if it exists
+
+    Raises:
+        ValidationError: If the UUID format is invalid, the artist is among its duplicates, or a duplicate doesn't exist
+            or is of another artist type
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+        if id in merge_data.duplicate_ids:
+            raise ValueError(f"Can't merge artist {id} into itself")
+
+        supabase = await get_supabase()
+        res = await supabase.rpc(
+            "merge_artists", {"target_artist_id": id, "duplicate_artist_ids": merge_data.duplicate_ids}
+        ).execute()
+
+        if not res.data:
+            return None
+
+        return _parse(Artist, res.data[0])
+    except PostgrestAPIError as e:
+        # Raised by the merge function when a duplicate doesn't exist or is an artist of another type
+        if e.code in ("P0002", "22023"):
+            raise ValueError(e.message) from None
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def update(id: str, artist_data: ArtistUpdate) -> Optional[Artist]:
+    """
+    Update the fields given for an artist, leaving the rest and its memberships untouched
+
+    Args:
+        id (str): The UUID of the artist to update
+        artist_data (ArtistUpdate): The fields to change. Only the fields set are written
+
+    Returns:
+        Optional[Artist]: The updated artist, if it exists
+
+    Raises:
+        ValidationError: If the UUID format or the input data is invalid, or the years are out of order once written
+        ConflictError: If the artist's person already has an artist with the new display name
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+
+        supabase = await get_supabase()
+        # The write returns the updated artist in the detail select shape
+        res = await (
+            supabase.table("artists")
+            .update(artist_data.model_dump(mode="json", exclude_unset=True))
+            .eq("artist_id", id)
+            .select(_ARTIST_DETAIL_SELECT)
+            .execute()
+        )
+
+        if not res.data:
+            return None
+
+        return _parse(Artist, res.data[0])
+    except PostgrestAPIError as e:
+        # Raised by the years check, which also covers years that were already stored
+        if e.code == "23514":
+            raise ValueError("Invalid years: Start year should be before or equal to end year.") from None
+        if e.code == "23505":
+            raise ConflictError(f"The person of artist {id} already has an artist with this display name") from None
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def _upsert_chunk(artists_data: List[ArtistCreate]) -> List[Artist]:
+    supabase = await get_supabase()
+    res = await supabase.rpc(
+        "upsert_artists",
+        {"payload": [artist_data.model_dump(exclude_none=True, exclude={"members"}) for artist_data in artists_data]},
+    ).execute()
+
+    return _parse_list(Artist, res.data)
+
+
+async def upsert_many(artists_data: List[ArtistCreate], chunk_size: int = BULK_CHUNK_SIZE) -> List[Artist]:
+    """
+    Resolves or creates several artist records by their person and display name, sending one upsert per chunk of
+    artists. Existing artists keep their values and only have the missing ones filled in
+
+    Args:
+        artists_data (List[ArtistCreate]): The raw data for the artist records, already validated
+        chunk_size (int, optional): The maximum number of artists sent in each upsert
+
+    Returns:
+        List[Artist]: The existing or new artist for each input, in the same order as given
+
+    Raises:
+        ValidationError: If any artist has no person ID or the chunk size is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Groups have no person, so they have no natural key to resolve them by
+        for artist_data in artists_data:
+            if not artist_data.person_id:
+                raise ValueError(f"Artist {artist_data.display_name} can't be upserted without a person ID")
+
+        chunk_results = await gather_bounded(
+            (_upsert_chunk(chunk) for chunk in chunked(artists_data, chunk_size)), BULK_MAX_CONCURRENT_CHUNKS
+        )
+
+        return [artist for chunk_result in chunk_results for artist in chunk_result]
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
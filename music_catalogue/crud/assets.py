@@ -49,3 +49,56 @@ async def get_external_links_raw(entity_type: EntityType, entity_id: str) -> Lis
         raise APIError(str(e)) from None
     except Exception as e:
         raise e
+
+
+async def get_external_links_raw_by_entity_ids(
+    entity_type: EntityType, entity_ids: List[str]
+) -> Dict[str, List[Dict[str, any]]]:
+    """
+    Get all external links for several entities of the same type in one query and returns the raw data grouped by
+    entity ID, without parsing
+
+    Args:
+        entity_type (EntityType): The type of entity to recover external links for
+        entity_ids (List[str]): The UUIDs of the entities to retrieve for
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: The external links found, keyed by entity ID
+
+    Raises:
+        ValidationError: If any UUID format is invalid
+        APIError: If Supabase throws an error
+    """
+
+    try:
+        if not entity_ids:
+            return {}
+        [validate_uuid(entity_id) for entity_id in entity_ids]
+
+        supabase = await get_supabase()
+        res = await (
+            supabase.table("external_links")
+            .select(
+                """
+                    link_id,
+                    entity_id,
+                    label,
+                    url,
+                    source_verified
+                """
+            )
+            .eq("entity_type", entity_type.value)
+            .in_("entity_id", entity_ids)
+            .execute()
+        )
+
+        links_by_entity: Dict[str, List[Dict[str, any]]] = {}
+        for link in res.data or []:
+            links_by_entity.setdefault(link["entity_id"], []).append(link)
+
+        return links_by_entity
+
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
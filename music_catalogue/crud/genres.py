@@ -0,0 +1,107 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from music_catalogue.crud.supabase_client import get_supabase
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.works import Genre
+from music_catalogue.models.utils import _parse_list
+from supabase import PostgrestAPIError
+
+# How long a loaded registry is considered fresh before the next read reloads it. Genres are only written outside the
+# API, so the registry is refreshed by this TTL, the periodic refresh and reloads on unknown IDs, never on writes
+REGISTRY_TTL_SECONDS = 300
+# Minimum time between reloads triggered by unknown genre IDs, to avoid reload storms
+MISS_RELOAD_INTERVAL_SECONDS = 5
+
+_registry: Dict[str, Genre] = {}
+_loaded_at: Optional[float] = None
+_lock = asyncio.Lock()
+
+
+async def load() -> Dict[str, Genre]:
+    """
+    Load every genre from Supabase into the in-memory registry, replacing its contents
+
+    Returns:
+        Dict[str, Genre]: The registry, keyed by genre ID
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    global _registry, _loaded_at
+    try:
+        supabase = await get_supabase()
+        res = await supabase.table("genres").select("genre_id, name, description").order("name").execute()
+
+        _registry = {genre.id: genre for genre in _parse_list(Genre, res.data)}
+        _loaded_at = time.monotonic()
+
+        return _registry
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def _ensure_loaded(max_age: float = REGISTRY_TTL_SECONDS) -> None:
+    if _loaded_at is not None and time.monotonic() - _loaded_at < max_age:
+        return
+    async with _lock:
+        # Another coroutine may have reloaded the registry while this one waited for the lock
+        if _loaded_at is None or time.monotonic() - _loaded_at >= max_age:
+            await load()
+
+
+async def get_all() -> List[Genre]:
+    """
+    Get all genres from the in-memory registry
+
+    Returns:
+        List[Genre]: Every known genre, ordered by name
+
+    Raises:
+        APIError: If the registry needs a reload and Supabase throws an error
+    """
+    await _ensure_loaded()
+    return list(_registry.values())
+
+
+async def resolve(genre_ids: List[str]) -> List[Genre]:
+    """
+    Resolve a list of genre IDs to genres from the in-memory registry
+
+    Args:
+        genre_ids (List[str]): The UUIDs of the genres to resolve
+
+    Returns:
+        List[Genre]: The genres found, in the same order as the IDs given. Unknown IDs are skipped
+
+    Raises:
+        APIError: If the registry needs a reload and Supabase throws an error
+    """
+    if not genre_ids:
+        return []
+
+    await _ensure_loaded()
+
+    # An unknown ID means a genre was added since the last load, so refresh early
+    if any(genre_id not in _registry for genre_id in genre_ids):
+        await _ensure_loaded(max_age=MISS_RELOAD_INTERVAL_SECONDS)
+
+    return [_registry[genre_id] for genre_id in genre_ids if genre_id in _registry]
+
+
+async def refresh_periodically(interval: float = REGISTRY_TTL_SECONDS) -> None:
+    """
+    Reload the registry on a fixed interval until cancelled. Failed reloads keep the previous contents
+
+    Args:
+        interval (float, optional): Seconds to wait between reloads
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load()
+        except APIError:
+            continue
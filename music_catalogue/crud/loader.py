@@ -0,0 +1,155 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from music_catalogue.crud.supabase_client import get_supabase
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.artists import Artist
+from music_catalogue.models.responses.persons import Person
+from music_catalogue.models.responses.works import Release, Version, Work
+from music_catalogue.models.types import EntityType
+from music_catalogue.models.utils import _parse
+from music_catalogue.models.validation import validate_uuid
+from supabase import PostgrestAPIError
+
+# Table, ID column, select and model used to load each entity type
+_LOADER_SOURCES = {
+    EntityType.PERSON: ("persons", "person_id", "*", Person),
+    EntityType.ARTIST: ("artists", "artist_id", "*", Artist),
+    EntityType.WORK: ("works", "work_id", "*", Work),
+    EntityType.VERSION: (
+        "versions",
+        "version_id",
+        "*, primary_artist:artists!fk_versions_primary_artist(*)",
+        Version,
+    ),
+    EntityType.RELEASE: ("releases", "release_id", "*, title:release_title", Release),
+}
+
+
+class EntityLoader:
+    """
+    Request-scoped entity loader. Calls to `load` made within the same event loop tick are collapsed into a single
+    `in_()` query per entity type, and every result is memoized for the lifetime of the loader.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[Tuple[EntityType, str], asyncio.Future] = {}
+        self._queue: Dict[EntityType, Dict[str, asyncio.Future]] = {}
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def load(self, entity_type: EntityType, id: str) -> "asyncio.Future[Optional[Any]]":
+        """
+        Load an entity by its UUID, batching with every other load issued in the same tick
+
+        Args:
+            entity_type (EntityType): The type of entity to load
+            id (str): The UUID of the entity
+
+        Returns:
+            Future[Optional[Any]]: Resolves to the entity, or None if it doesn't exist
+
+        Raises:
+            ValidationError: If the entity type can't be loaded or the UUID format is invalid
+            APIError: If Supabase throws an error, raised when awaiting the result
+        """
+        if entity_type not in _LOADER_SOURCES:
+            raise ValueError(f"Entities of type {entity_type.value} can't be loaded")
+        validate_uuid(id)
+
+        key = (entity_type, id)
+        if key in self._cache:
+            return self._cache[key]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+
+        # The first load of a tick schedules the dispatch, which runs once every coroutine already scheduled has had
+        # the chance to queue its own loads
+        if not self._queue:
+            loop.call_soon(self._schedule_dispatch)
+        self._queue.setdefault(entity_type, {})[id] = future
+
+        return future
+
+    async def load_many(self, entity_type: EntityType, ids: List[str]) -> List[Optional[Any]]:
+        """
+        Load several entities of the same type by their UUIDs
+
+        Args:
+            entity_type (EntityType): The type of entity to load
+            ids (List[str]): The UUIDs of the entities
+
+        Returns:
+            List[Optional[Any]]: The entities in the same order as the IDs given, with None for the ones not found
+
+        Raises:
+            ValidationError: If the entity type can't be loaded or any UUID format is invalid
+            APIError: If Supabase throws an error
+        """
+        return list(await asyncio.gather(*(self.load(entity_type, id) for id in ids)))
+
+    def _schedule_dispatch(self) -> None:
+        queue, self._queue = self._queue, {}
+        for entity_type, futures in queue.items():
+            task = asyncio.get_running_loop().create_task(self._fetch(entity_type, futures))
+            # Keep a reference so the task isn't garbage collected before it finishes
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _fetch(self, entity_type: EntityType, futures: Dict[str, asyncio.Future]) -> None:
+        table, id_column, select, model_cls = _LOADER_SOURCES[entity_type]
+        try:
+            supabase = await get_supabase()
+            res = await supabase.table(table).select(select).in_(id_column, list(futures.keys())).execute()
+
+            entities = {item[id_column]: _parse(model_cls, item) for item in res.data or []}
+            for id, future in futures.items():
+                if not future.done():
+                    future.set_result(entities.get(id))
+        except BaseException as e:
+            # Cancellation is a BaseException too, and must still settle every waiting load instead of leaving it hanging
+            error = APIError(str(e)) if isinstance(e, PostgrestAPIError) else e
+            for id, future in futures.items():
+                # Failed loads aren't memoized so a later load can retry them
+                self._cache.pop((entity_type, id), None)
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+            if not isinstance(e, Exception):
+                raise
+
+
+_current_loader: ContextVar[Optional[EntityLoader]] = ContextVar("entity_loader", default=None)
+
+
+def get_loader() -> EntityLoader:
+    """
+    Get the entity loader for the current request. Outside a request scope, such as in batch jobs, a new loader is
+    returned each time without binding it to the context, so its results never outlive the caller
+
+    Returns:
+        EntityLoader: The loader bound to the current request, or a new unbound loader
+    """
+    loader = _current_loader.get()
+    return loader if loader is not None else EntityLoader()
+
+
+@contextmanager
+def request_scope() -> Iterator[EntityLoader]:
+    """
+    Bind a fresh entity loader to the current context, discarding it on exit
+
+    Yields:
+        EntityLoader: The loader for the scope
+    """
+    token = _current_loader.set(EntityLoader())
+    try:
+        yield _current_loader.get()
+    finally:
+        _current_loader.reset(token)
@@ -1,13 +1,31 @@
 from typing import List, Optional
+from uuid import uuid4
 
 from music_catalogue.crud.supabase_client import get_supabase
 from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.inputs.person_create import PersonCreate
-from music_catalogue.models.responses.persons import Person
-from music_catalogue.models.utils import _parse, _parse_list
-from music_catalogue.models.validation import validate_uuid
+from music_catalogue.models.inputs.entity_merge import EntityMerge
+from music_catalogue.models.inputs.person_create import PersonCreate, PersonUpdate
+from music_catalogue.models.inputs.person_resolve import PersonResolve
+from music_catalogue.models.responses.artists import ArtistMembership
+from music_catalogue.models.responses.batch import BatchResult, BulkItemResult, Page
+from music_catalogue.models.responses.persons import Person, PersonCandidate, PersonNameResolution, PersonWork
+from music_catalogue.models.types import BulkItemStatus
+from music_catalogue.models.utils import _parse, _parse_list, _to_batch_result
+from music_catalogue.models.validation import validate_uuid, validate_uuid_list, validate_year
+from music_catalogue.utils.batching import chunked, gather_bounded
+from music_catalogue.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_year_cursor,
+    encode_year_cursor,
+    validate_page_size,
+)
 from supabase import PostgrestAPIError
 
+# Default number of persons sent in each bulk insert
+BULK_CHUNK_SIZE = 500
+# Maximum number of bulk insert chunks in flight at once
+BULK_MAX_CONCURRENT_CHUNKS = 4
+
 
 async def get_by_id(id: str) -> Optional[Person]:
     """
@@ -39,6 +57,37 @@ async def get_by_id(id: str) -> Optional[Person]:
         raise e
 
 
+async def get_by_ids(ids: List[str]) -> BatchResult[Person]:
+    """
+    Get several persons by their UUIDs in a single query
+
+    Args:
+        ids (List[str]): The UUIDs of the persons to retrieve
+
+    Returns:
+        BatchResult[Person]: The persons found, in the order requested, and the IDs that don't exist
+
+    Raises:
+        ValidationError: If any UUID format is invalid or too many IDs are requested
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID formats and batch size, and raise if invalid
+        ids = validate_uuid_list(ids)
+
+        if not ids:
+            return _to_batch_result(Person, ids, [])
+
+        supabase = await get_supabase()
+        res = await supabase.table("persons").select("*").in_("person_id", ids).execute()
+
+        return _to_batch_result(Person, ids, _parse_list(Person, res.data))
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
 async def search(query: str) -> List[Person]:
     """
     Search for a person based on a text query
@@ -65,6 +114,88 @@ async def search(query: str) -> List[Person]:
         raise e
 
 
+async def get_memberships(id: str, year: Optional[int] = None) -> List[ArtistMembership]:
+    """
+    Get the groups a person has been a member of, optionally only the ones they were in during a given year
+
+    Args:
+        id (str): The UUID of the person
+        year (int, optional): Only include memberships active in this year. Memberships with unknown years are included
+
+    Returns:
+        List[ArtistMembership]: The memberships of the person with their group artists, ordered by start year
+
+    Raises:
+        ValidationError: If the UUID format or year is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+
+        supabase = await get_supabase()
+        query = supabase.table("artist_memberships").select("*, artist:artists(*)").eq("person_id", id)
+        if year is not None:
+            validate_year(year)
+            query = query.filter("active_years", "ov", f"[{year},{year}]")
+        res = await query.order("start_year").execute()
+
+        return _parse_list(ArtistMembership, res.data)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_works(id: str, cursor: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE) -> Page[PersonWork]:
+    """
+    Get a page of the works a person is credited on, directly or through their solo and group artists, ordered by the
+    year the work was started with undated works last
+
+    Args:
+        id (str): The UUID of the person
+        cursor (str, optional): The cursor returned with the previous page
+        page_size (int, optional): The maximum number of works in the page
+
+    Returns:
+        Page[PersonWork]: The works in the page and the cursor for the next one, if there are more
+
+    Raises:
+        ValidationError: If the UUID format, cursor or page size are invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+        validate_page_size(page_size)
+
+        after_sort_year, after_work_id = decode_year_cursor(cursor) if cursor else (None, None)
+
+        supabase = await get_supabase()
+        # Ask for one extra work to know whether there is a next page
+        res = await supabase.rpc(
+            "person_works_page",
+            {
+                "target_person_id": id,
+                "after_sort_year": after_sort_year,
+                "after_work_id": after_work_id,
+                "page_size": page_size + 1,
+            },
+        ).execute()
+
+        rows = res.data or []
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_year_cursor(rows[-1]["sort_year"], rows[-1]["work_id"])
+
+        return Page[PersonWork](results=_parse_list(PersonWork, rows), next_cursor=next_cursor)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
 async def create(person_data: PersonCreate) -> Person:
     """
     Creates a new person record
@@ -85,3 +216,227 @@ async def create(person_data: PersonCreate) -> Person:
         raise APIError(str(e)) from None
     except Exception as e:
         raise e
+
+
+async def merge(id: str, merge_data: EntityMerge) -> Optional[Person]:
+    """
+    Merge duplicate persons into a person in one transaction, repointing every reference to them and deleting them.
+    The person keeps its values, only filling in the missing ones from the duplicates, whose legal names become
+    alternative names. Artists of the merged persons with the same display name are merged too
+
+    Args:
+        id (str): The UUID of the person to keep
+        merge_data (EntityMerge): The UUIDs of the duplicate persons to merge into it
+
+    Returns:
+        Optional[Person]: The merged person, if it exists
+
+    Raises:
+        ValidationError: If the UUID format is invalid, the person is among its duplicates, a duplicate doesn't exist, or
+            artists of the persons with the same display name are of different types
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+        if id in merge_data.duplicate_ids:
+            raise ValueError(f"Can't merge person {id} into itself")
+
+        supabase = await get_supabase()
+        res = await supabase.rpc(
+            "merge_persons", {"target_person_id": id, "duplicate_person_ids": merge_data.duplicate_ids}
+        ).execute()
+
+        if not res.data:
+            return None
+
+        return _parse(Person, res.data[0])
+    except PostgrestAPIError as e:
+        # Raised by the merge function when a duplicate doesn't exist or is an artist of another type
+        if e.code in ("P0002", "22023"):
+            raise ValueError(e.message) from None
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def update(id: str, person_data: PersonUpdate) -> Optional[Person]:
+    """
+    Update the fields given for a person, leaving the rest untouched
+
+    Args:
+        id (str): The UUID of the person to update
+        person_data (PersonUpdate): The fields to change. Only the fields set are written
+
+    Returns:
+        Optional[Person]: The updated person, if it exists
+
+    Raises:
+        ValidationError: If the UUID format or the input data is invalid, or the dates are out of order once written
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+
+        supabase = await get_supabase()
+        # The write returns the updated person, so there's no need to read it back
+        res = await (
+            supabase.table("persons")
+            .update(person_data.model_dump(mode="json", exclude_unset=True))
+            .eq("person_id", id)
+            .execute()
+        )
+
+        if not res.data:
+            return None
+
+        return _parse(Person, res.data[0])
+    except PostgrestAPIError as e:
+        # Raised by the life dates check, which also covers dates that were already stored
+        if e.code == "23514":
+            raise ValueError("Invalid dates: Birth date should be before or equal to death date.") from None
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def _create_chunk(start: int, people_data: List[PersonCreate]) -> List[BulkItemResult[Person]]:
+    # Generate the IDs here so each returned row is matched to its input by ID instead of by position
+    person_ids = [str(uuid4()) for _ in people_data]
+    try:
+        supabase = await get_supabase()
+        res = await (
+            supabase.table("persons")
+            .insert(
+                [
+                    {**person_data.model_dump(exclude_none=True), "person_id": person_id}
+                    for person_id, person_data in zip(person_ids, people_data)
+                ]
+            )
+            .execute()
+        )
+
+        rows_by_id = {row["person_id"]: row for row in res.data or []}
+        return [
+            BulkItemResult[Person](index=start + offset, status=BulkItemStatus.CREATED, result=_parse(Person, row))
+            if (row := rows_by_id.get(person_id))
+            else BulkItemResult[Person](
+                index=start + offset, status=BulkItemStatus.FAILED, error="Person wasn't returned by the insert"
+            )
+            for offset, person_id in enumerate(person_ids)
+        ]
+    except Exception as e:
+        # Each chunk is a single insert statement, so a database error leaves none of its rows behind. Any other error,
+        # such as a timeout, is reported for the chunk too so the other chunks' results still reach the client
+        error = str(e) if isinstance(e, PostgrestAPIError) else f"Chunk failed with {type(e).__name__}: {e}"
+        return [
+            BulkItemResult[Person](index=start + offset, status=BulkItemStatus.FAILED, error=error)
+            for offset in range(len(people_data))
+        ]
+
+
+async def create_many(
+    people_data: List[PersonCreate], chunk_size: int = BULK_CHUNK_SIZE
+) -> List[BulkItemResult[Person]]:
+    """
+    Creates several person records, sending one insert per chunk of persons
+
+    Args:
+        people_data (List[PersonCreate]): The raw data for the person records, already validated
+        chunk_size (int, optional): The maximum number of persons sent in each insert
+
+    Returns:
+        List[BulkItemResult[Person]]: The outcome for each person, in the same order as given. Persons in a chunk
+        whose insert failed are reported as failed. None of that chunk is written when the database rejects it, while
+        a chunk that timed out may or may not have been written
+
+    Raises:
+        ValidationError: If the chunk size is invalid
+    """
+    try:
+        chunks = list(chunked(people_data, chunk_size))
+        chunk_results = await gather_bounded(
+            (_create_chunk(index * chunk_size, chunk) for index, chunk in enumerate(chunks)),
+            BULK_MAX_CONCURRENT_CHUNKS,
+        )
+
+        return [item for chunk_result in chunk_results for item in chunk_result]
+    except Exception as e:
+        raise e
+
+
+async def _upsert_chunk(people_data: List[PersonCreate]) -> List[Person]:
+    supabase = await get_supabase()
+    res = await supabase.rpc(
+        "upsert_persons", {"payload": [person_data.model_dump(exclude_none=True) for person_data in people_data]}
+    ).execute()
+
+    return _parse_list(Person, res.data)
+
+
+async def upsert_many(people_data: List[PersonCreate], chunk_size: int = BULK_CHUNK_SIZE) -> List[Person]:
+    """
+    Resolves or creates several person records by their normalized legal name and birth year, sending one upsert per
+    chunk of persons. A person matches an existing one with the same name whose birth year is the same or unknown.
+    Existing persons keep their values and only have the missing ones filled in
+
+    Args:
+        people_data (List[PersonCreate]): The raw data for the person records, already validated
+        chunk_size (int, optional): The maximum number of persons sent in each upsert
+
+    Returns:
+        List[Person]: The existing or new person for each input, in the same order as given
+
+    Raises:
+        ValidationError: If the chunk size is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        chunk_results = await gather_bounded(
+            (_upsert_chunk(chunk) for chunk in chunked(people_data, chunk_size)), BULK_MAX_CONCURRENT_CHUNKS
+        )
+
+        return [person for chunk_result in chunk_results for person in chunk_result]
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def resolve_names(resolve_data: PersonResolve) -> List[PersonNameResolution]:
+    """
+    Resolves a batch of free-text names to ranked candidate persons in a single query, matching exact normalized
+    legal names, alternative names and similar legal names
+
+    Args:
+        resolve_data (PersonResolve): The names to resolve and how many candidates to return for each
+
+    Returns:
+        List[PersonNameResolution]: The candidates for each name, in the same order as given, best match first
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        supabase = await get_supabase()
+        res = await supabase.rpc(
+            "resolve_person_names",
+            {
+                "names": resolve_data.names,
+                "candidate_limit": resolve_data.candidate_limit,
+                "min_score": resolve_data.min_score,
+            },
+        ).execute()
+
+        resolutions = [PersonNameResolution(name=name) for name in resolve_data.names]
+        for row in res.data or []:
+            # Names without candidates come back once with no person. Name indexes are 1-based
+            if row.get("person_id"):
+                resolutions[row["name_index"] - 1].candidates.append(_parse(PersonCandidate, row))
+
+        return resolutions
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
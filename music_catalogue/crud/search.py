@@ -1,18 +1,142 @@
-from typing import List, Optional
+import asyncio
+import re
+from typing import Dict, List, Optional, Tuple
 
 from music_catalogue.crud.supabase_client import get_supabase
 from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.responses.search import UnifiedSearchResult
+from music_catalogue.models.responses.search import (
+    ArtistSummary,
+    EntitySummary,
+    PersonSummary,
+    ReleaseSummary,
+    Suggestion,
+    UnifiedSearchResult,
+    VersionSummary,
+    WorkSummary,
+)
 from music_catalogue.models.types import EntityType
-from music_catalogue.models.utils import _parse_list
+from music_catalogue.models.utils import _parse, _parse_list
 from supabase import PostgrestAPIError
 
+# Labels of the catalogues of works queries are looked up in, such as CNW for Carl Nielsen's and BWV for Bach's. Only
+# these are taken as catalogue numbers, so "Symphony 5" still goes through full-text search
+_CATALOGUE_LABELS = (
+    "BWV",
+    "BuxWV",
+    "CNW",
+    "D",
+    "FS",
+    "Hob",
+    "HWV",
+    "JW",
+    "K",
+    "KV",
+    "L",
+    "Op",
+    "RV",
+    "S",
+    "Sz",
+    "TrV",
+    "TWV",
+    "WAB",
+    "WoO",
+    "WWV",
+    "Z",
+)
+# Queries that look like a catalogue number, such as "CNW 27", "Op. 40" or "BWV 1006a": a known label and a number
+_CATALOGUE_NUMBER = re.compile(
+    rf"^((?:{'|'.join(_CATALOGUE_LABELS)})\.?)\s*(\d+[A-Za-z]?(?:[/.:-]\d+[A-Za-z]?)*)$", re.IGNORECASE
+)
+
+# Default number of typeahead suggestions returned
+DEFAULT_SUGGESTIONS = 10
+# Shortest text suggestions are looked up for, as shorter prefixes match too much of the catalogue to be useful
+MIN_SUGGEST_LENGTH = 2
+# Suggestions are only useful while the user is typing, so give up on slower lookups instead of answering late
+SUGGEST_TIMEOUT_SECONDS = 0.3
+
+# Table, ID column, select and summary model used to hydrate each entity type found by unified search
+_SUMMARY_SOURCES = {
+    EntityType.WORK: (
+        "works",
+        "work_id",
+        """
+        work_id,
+        title,
+        origin_year_start,
+        origin_year_end,
+        credits(role, is_primary, person:persons(legal_name), artist:artists(display_name))
+        """,
+        WorkSummary,
+    ),
+    EntityType.VERSION: (
+        "versions",
+        "version_id",
+        """
+        version_id,
+        title,
+        version_type,
+        release_date,
+        release_year,
+        primary_artist:artists!fk_versions_primary_artist(display_name)
+        """,
+        VersionSummary,
+    ),
+    EntityType.RELEASE: (
+        "releases",
+        "release_id",
+        "release_id, release_title, release_category, release_date, label",
+        ReleaseSummary,
+    ),
+    EntityType.ARTIST: (
+        "artists",
+        "artist_id",
+        "artist_id, display_name, artist_type, start_year, end_year",
+        ArtistSummary,
+    ),
+    EntityType.PERSON: (
+        "persons",
+        "person_id",
+        "person_id, legal_name, birth_date, death_date",
+        PersonSummary,
+    ),
+}
+
+
+def parse_catalogue_number(query: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a query that looks like a catalogue number into its identifier label and value
+
+    Args:
+        query (str): The text query
+
+    Returns:
+        Optional[Tuple[str, str]]: The label and value, if the query is a catalogue number
+    """
+    match = _CATALOGUE_NUMBER.match(query.strip())
+    return (match.group(1), match.group(2)) if match else None
+
+
+async def _identifier_search(label: str, value: str, limit: Optional[int]) -> List[UnifiedSearchResult]:
+    supabase = await get_supabase()
+    # The function matches labels and values in any case, so "cnw 27" finds CNW 27
+    res = await supabase.rpc(
+        "search_work_identifiers", {"label_text": label, "value_text": value, "fetch_limit": limit}
+    ).execute()
+    return [
+        UnifiedSearchResult(
+            entity_type=EntityType.WORK, entity_id=item["work_id"], display_text=item["title"], rank=1.0
+        )
+        for item in res.data
+    ]
+
 
 async def unified_search(
     query: str, entity_types: Optional[List[EntityType]] = None, limit: Optional[int] = 20
 ) -> List[UnifiedSearchResult]:
     """
-    Perform search across entities based on a query
+    Perform search across entities based on a query. Queries that look like a catalogue number return the works with
+    that identifier, in any case, when there are any, without full-text search
 
     Args:
         query (str): The text query to search by
@@ -26,6 +150,13 @@ async def unified_search(
         APIError: If Supabase throws an error
     """
     try:
+        # An exact catalogue number hit beats anything full-text search would rank for it
+        catalogue_number = parse_catalogue_number(query)
+        if catalogue_number and (not entity_types or EntityType.WORK in entity_types):
+            results = await _identifier_search(*catalogue_number, limit)
+            if results:
+                return results
+
         supabase = await get_supabase()
         search_query = supabase.rpc(
             "unified_search",
@@ -36,7 +167,7 @@ async def unified_search(
         ).select("*")
 
         if entity_types:
-            query = search_query.in_("entity_type", entity_types)
+            search_query = search_query.in_("entity_type", [EntityType(t).value for t in entity_types])
 
         res = await search_query.execute()
 
@@ -45,3 +176,83 @@ async def unified_search(
         raise APIError(str(e)) from None
     except Exception as e:
         raise e
+
+
+async def suggest(
+    prefix: str, limit: int = DEFAULT_SUGGESTIONS, timeout: float = SUGGEST_TIMEOUT_SECONDS
+) -> List[Suggestion]:
+    """
+    Suggest entity display names completing a partially typed query, matching every word of it as a prefix
+
+    Args:
+        prefix (str): The text typed so far
+        limit (int, optional): The maximum number of suggestions to return
+        timeout (float, optional): The seconds to wait for suggestions before giving up
+
+    Returns:
+        List[Suggestion]: Suggestions across entity types, closest completions first. Empty if the prefix is shorter
+            than MIN_SUGGEST_LENGTH
+
+    Raises:
+        TimeoutError: If the suggestions take longer than the timeout
+        APIError: If Supabase throws an error
+    """
+    try:
+        supabase = await get_supabase()
+        res = await asyncio.wait_for(
+            supabase.rpc("suggest", {"prefix_text": prefix, "fetch_limit": limit}).execute(), timeout
+        )
+
+        return _parse_list(Suggestion, res.data)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def _get_summaries(entity_type: EntityType, ids: List[str]) -> Dict[str, EntitySummary]:
+    table, id_column, select, model_cls = _SUMMARY_SOURCES[entity_type]
+
+    supabase = await get_supabase()
+    res = await supabase.table(table).select(select).in_(id_column, ids).execute()
+
+    return {item[id_column]: _parse(model_cls, item) for item in res.data or []}
+
+
+async def hydrate_summaries(results: List[UnifiedSearchResult]) -> List[UnifiedSearchResult]:
+    """
+    Attach a compact summary of the matched entity to each unified search result. Summaries are loaded with one
+    query per entity type present in the results, regardless of how many results there are
+
+    Args:
+        results (List[UnifiedSearchResult]): The results to hydrate
+
+    Returns:
+        List[UnifiedSearchResult]: The same results, with their summaries set where the entity was found
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        ids_by_type: Dict[EntityType, List[str]] = {}
+        for result in results:
+            if result.entity_type in _SUMMARY_SOURCES:
+                ids_by_type.setdefault(result.entity_type, []).append(result.entity_id)
+
+        entity_types = list(ids_by_type.keys())
+        summaries = await asyncio.gather(
+            *(
+                _get_summaries(entity_type, list(dict.fromkeys(ids_by_type[entity_type])))
+                for entity_type in entity_types
+            )
+        )
+        summaries_by_type = dict(zip(entity_types, summaries))
+
+        for result in results:
+            result.summary = summaries_by_type.get(result.entity_type, {}).get(result.entity_id)
+
+        return results
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
@@ -0,0 +1,99 @@
+from typing import Dict, List, Optional
+
+from music_catalogue.crud.loader import get_loader
+from music_catalogue.crud.supabase_client import get_supabase
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.versions import VersionGraph
+from music_catalogue.models.types import EntityType
+from music_catalogue.models.validation import validate_uuid
+from supabase import PostgrestAPIError
+
+# Default number of derivation hops followed in each direction
+DEFAULT_LINEAGE_DEPTH = 10
+# Maximum number of derivation hops a request can ask for
+MAX_LINEAGE_DEPTH = 50
+
+
+def _validate_depth(max_depth: int) -> None:
+    if not 1 <= max_depth <= MAX_LINEAGE_DEPTH:
+        raise ValueError(f"Invalid depth {max_depth}: must be between 1 and {MAX_LINEAGE_DEPTH}")
+
+
+async def _graph_with_primary_artists(rows: List[Dict]) -> VersionGraph:
+    # Many versions of a graph share their primary artist, so resolve each artist once through the request's loader,
+    # which also batches them with any other artists loaded in the same tick
+    artist_ids = list(dict.fromkeys(row["primary_artist_id"] for row in rows if row.get("primary_artist_id")))
+    artists = await get_loader().load_many(EntityType.ARTIST, artist_ids)
+    names = {artist.id: artist.display_name for artist in artists if artist is not None}
+
+    return VersionGraph.from_rows(
+        [{**row, "primary_artist_name": names.get(row.get("primary_artist_id"))} for row in rows]
+    )
+
+
+async def get_lineage(id: str, max_depth: int = DEFAULT_LINEAGE_DEPTH) -> Optional[VersionGraph]:
+    """
+    Get the derivation graph of a version: the versions it's based on and the versions based on it
+
+    Args:
+        id (str): The UUID of the version
+        max_depth (int, optional): The maximum number of hops followed in each direction
+
+    Returns:
+        Optional[VersionGraph]: The versions in the lineage and the derivation edges between them, if the version exists
+
+    Raises:
+        ValidationError: If the UUID format or depth is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and depth, and raise if invalid
+        validate_uuid(id)
+        _validate_depth(max_depth)
+
+        supabase = await get_supabase()
+        res = await supabase.rpc("version_lineage", {"root_version_id": id, "max_depth": max_depth}).execute()
+
+        if not res.data:
+            return None
+
+        return await _graph_with_primary_artists(res.data)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_work_tree(work_id: str, max_depth: int = DEFAULT_LINEAGE_DEPTH) -> Optional[VersionGraph]:
+    """
+    Get the version tree of a work: every version of the work and the versions derived from them
+
+    Args:
+        work_id (str): The UUID of the work
+        max_depth (int, optional): The maximum number of hops followed from the work's root versions
+
+    Returns:
+        Optional[VersionGraph]: The versions in the tree and the derivation edges between them, if the work exists.
+            Empty for a work without versions
+
+    Raises:
+        ValidationError: If the UUID format or depth is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and depth, and raise if invalid
+        validate_uuid(work_id)
+        _validate_depth(max_depth)
+
+        supabase = await get_supabase()
+        res = await supabase.rpc("work_version_tree", {"target_work_id": work_id, "max_depth": max_depth}).execute()
+
+        # The tree of a work without versions is empty too, so only then check whether the work exists
+        if not res.data and await get_loader().load(EntityType.WORK, work_id) is None:
+            return None
+
+        return await _graph_with_primary_artists(res.data or [])
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
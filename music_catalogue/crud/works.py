@@ -1,15 +1,70 @@
-from typing import List, Optional
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
 
-from music_catalogue.crud import assets
+from music_catalogue.crud import assets, genres
 from music_catalogue.crud.supabase_client import get_supabase
 from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.inputs.work_create import WorkCreate
-from music_catalogue.models.responses.works import Work, WorkExternalLink
-from music_catalogue.models.types import EntityType
-from music_catalogue.models.utils import _parse, _parse_list
-from music_catalogue.models.validation import validate_uuid
+from music_catalogue.models.inputs.work_create import WorkCreate, WorkUpdate
+from music_catalogue.models.responses.batch import BatchResult, BulkItemResult
+from music_catalogue.models.responses.works import SimilarWork, Work, WorkExternalLink
+from music_catalogue.models.types import BulkItemStatus, EntityType
+from music_catalogue.models.utils import _parse, _parse_list, _to_batch_result
+from music_catalogue.models.validation import validate_uuid, validate_uuid_list
+from music_catalogue.utils.batching import chunked, gather_bounded
 from supabase import PostgrestAPIError
 
+# Default number of works sent in each bulk insert
+BULK_CHUNK_SIZE = 500
+# Maximum number of bulk insert chunks in flight at once
+BULK_MAX_CONCURRENT_CHUNKS = 2
+# Maximum number of similar works stored per work by the similar works batch job
+MAX_SIMILAR_WORKS = 20
+
+# TODO: Remove hardcoded value once user implementation is done
+_EXTERNAL_LINKS_ADDED_BY = "760c6a23-cf19-4e59-89aa-f6921943bc26"
+
+_WORK_DETAIL_SELECT = """
+    work_id,
+    title,
+    language,
+    titles,
+    description,
+    identifiers,
+    origin_year_start,
+    origin_year_end,
+    origin_country,
+    themes,
+    sentiment,
+    notes,
+    versions(
+        version_id,
+        title,
+        version_type,
+        primary_artist:artists!fk_versions_primary_artist(
+            artist_id, artist_type, display_name
+        ),
+        release_year,
+        completeness_level
+    ),
+    work_genres(genre_id),
+    credits(
+        credit_id,
+        artist:artists(artist_id, artist_type, display_name),
+        person:persons(person_id, legal_name),
+        role,
+        is_primary,
+        credit_order,
+        instruments,
+        notes
+    )
+"""
+
+
+def _genre_ids(work_data: Dict[str, Any]) -> List[str]:
+    # Work selects only embed genre IDs, which are resolved from the in-memory genre registry
+    return [item["genre_id"] for item in work_data.get("work_genres") or [] if item.get("genre_id")]
+
 
 async def get_by_id(id: str) -> Optional[Work]:
     """
@@ -30,53 +85,12 @@ async def get_by_id(id: str) -> Optional[Work]:
         validate_uuid(id)
 
         supabase = await get_supabase()
-        res = await (
-            supabase.table("works")
-            .select(
-                """
-                work_id,
-                title,
-                language,
-                titles,
-                description,
-                identifiers,
-                origin_year_start,
-                origin_year_end,
-                origin_country,
-                themes,
-                sentiment,
-                notes,
-                versions(
-                    version_id,
-                    title,
-                    version_type,
-                    primary_artist:artists!fk_versions_primary_artist(
-                        artist_id, display_name
-                    ),
-                    release_year,
-                    completeness_level
-                ),
-                work_genres(genres(genre_id, name)),
-                credits(
-                    credit_id,
-                    artist:artists(artist_id, display_name),
-                    person:persons(person_id, legal_name),
-                    role,
-                    is_primary,
-                    credit_order,
-                    instruments,
-                    notes
-                )
-            """
-            )
-            .eq("work_id", id)
-            .single()
-            .execute()
-        )
+        res = await supabase.table("works").select(_WORK_DETAIL_SELECT).eq("work_id", id).single().execute()
 
         work: Work = _parse(Work, res.data)
 
         if work:
+            work.genres = await genres.resolve(_genre_ids(res.data))
             external_links_raw = await assets.get_external_links_raw(EntityType.WORK, entity_id=work.id)
             work.external_links = _parse_list(WorkExternalLink, external_links_raw)
 
@@ -89,6 +103,119 @@ async def get_by_id(id: str) -> Optional[Work]:
         raise e
 
 
+async def get_similar(id: str, limit: int = MAX_SIMILAR_WORKS) -> List[SimilarWork]:
+    """
+    Get the works most similar to a work by title, themes, genres and metadata, as last computed by the similar works
+    batch job
+
+    Args:
+        id (str): The UUID of the work
+        limit (int, optional): The maximum number of similar works returned
+
+    Returns:
+        List[SimilarWork]: The similar works, from most to least similar
+
+    Raises:
+        ValidationError: If the UUID format or limit is invalid
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+        if not 1 <= limit <= MAX_SIMILAR_WORKS:
+            raise ValueError(f"Invalid limit {limit}: must be between 1 and {MAX_SIMILAR_WORKS}")
+
+        supabase = await get_supabase()
+        res = await (
+            supabase.table("work_similarities")
+            .select("rank, score, similar:works!fk_work_similarities_similar(*)")
+            .eq("work_id", id)
+            .order("rank")
+            .limit(limit)
+            .execute()
+        )
+
+        return _parse_list(SimilarWork, res.data)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_by_identifier(label: str, value: str) -> List[Work]:
+    """
+    Get the works with an exact catalogue identifier, such as label CNW and value 27
+
+    Args:
+        label (str): The label of the identifier, matched exactly
+        value (str): The value of the identifier, matched exactly
+
+    Returns:
+        List[Work]: The works with the identifier, usually only one
+
+    Raises:
+        APIError: If Supabase throws an error
+    """
+    try:
+        supabase = await get_supabase()
+        # Containment on the identifiers array is served by its jsonb_path_ops index
+        res = await (
+            supabase.table("works")
+            .select(_WORK_DETAIL_SELECT)
+            .contains("identifiers", json.dumps([{"label": label, "value": value}]))
+            .execute()
+        )
+
+        works_list = _parse_list(Work, res.data)
+        for work, work_data in zip(works_list, res.data):
+            work.genres = await genres.resolve(_genre_ids(work_data))
+
+        return works_list
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
+async def get_by_ids(ids: List[str]) -> BatchResult[Work]:
+    """
+    Get several works by their UUIDs in a single query
+
+    Args:
+        ids (List[str]): The UUIDs of the works to retrieve
+
+    Returns:
+        BatchResult[Work]: The works found, in the order requested, and the IDs that don't exist
+
+    Raises:
+        ValidationError: If any UUID format is invalid or too many IDs are requested
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID formats and batch size, and raise if invalid
+        ids = validate_uuid_list(ids)
+
+        if not ids:
+            return _to_batch_result(Work, ids, [])
+
+        supabase = await get_supabase()
+        res = await supabase.table("works").select(_WORK_DETAIL_SELECT).in_("work_id", ids).execute()
+
+        works_list = _parse_list(Work, res.data)
+        external_links_raw = await assets.get_external_links_raw_by_entity_ids(
+            EntityType.WORK, [work.id for work in works_list]
+        )
+        for work, work_data in zip(works_list, res.data):
+            work.genres = await genres.resolve(_genre_ids(work_data))
+            work.external_links = _parse_list(WorkExternalLink, external_links_raw.get(work.id))
+
+        return _to_batch_result(Work, ids, works_list)
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
+
+
 async def search(query: str) -> List[Work]:
     """
     Search for a work based on a text query
@@ -120,7 +247,7 @@ async def search(query: str) -> List[Work]:
                         artists(*, persons(*), artist_memberships(persons(*)))
                     )
                 ),
-                work_genres(genres(*)),
+                work_genres(genre_id),
                 credits(*, persons(*), artists(*, artist_memberships(*, persons(*))))
             """
             )
@@ -128,19 +255,25 @@ async def search(query: str) -> List[Work]:
             .execute()
         )
 
-        return _parse_list(Work, res.data)
+        works_list = _parse_list(Work, res.data)
+        for work, work_data in zip(works_list, res.data):
+            work.genres = await genres.resolve(_genre_ids(work_data))
+
+        return works_list
     except PostgrestAPIError as e:
         raise APIError(str(e)) from None
     except Exception as e:
         raise e
 
 
-async def create(work_data: WorkCreate) -> Work:
+async def create(work_data: WorkCreate, full: bool = False) -> Work:
     """
     Create a new work record and its optional nested relationships
 
     Args:
         work_data (WorkCreate): The raw data for the work and optional relationships
+        full (bool, optional): Whether to read the work back after creating it instead of building it from the
+            created records
 
     Returns:
         Work: A work object representing the new record created
@@ -152,82 +285,151 @@ async def create(work_data: WorkCreate) -> Work:
     try:
         supabase = await get_supabase()
 
-        # Create work
-        res = await (
-            supabase.table("works")
-            .insert(
-                work_data.model_dump(exclude_none=True, exclude={"genre_ids", "versions", "credits", "external_links"})
-            )
-            .execute()
-        )
+        # Create the work and all of its relationships in a single transaction. If any insert fails, the database
+        # rolls back the whole work so nothing is left behind
+        res = await supabase.rpc(
+            "create_work",
+            {
+                "payload": work_data.model_dump(mode="json", exclude_none=True),
+                "added_by": _EXTERNAL_LINKS_ADDED_BY,
+            },
+        ).execute()
 
-        work = _parse(Work, res.data[0])
+        work: Work = _parse(Work, res.data)
 
-        if not work.id:
+        if not work or not work.id:
             raise APIError("Unexpected error creating work. No ID returned")
 
-        # Create versions
-        if work_data.versions:
-            await (
-                supabase.table("versions")
-                .insert(
-                    [{"work_id": work.id, **version.model_dump(exclude_none=True)} for version in work_data.versions]
-                )
-                .execute()
-            )
+        if full:
+            # Get work by ID to include complete information
+            return await get_by_id(work.id)
 
-        # Create credits
-        if work_data.credits:
-            await (
-                supabase.table("credits")
-                .insert([{"work_id": work.id, **credit.model_dump(exclude_none=True)} for credit in work_data.credits])
-                .execute()
-            )
+        # The RPC returns the created records in the detail select shape, so only genres need resolving
+        work.genres = await genres.resolve(_genre_ids(res.data))
+        work.external_links = _parse_list(WorkExternalLink, res.data.get("external_links"))
 
-        # Assign genres
-        if work_data.genre_ids:
-            await (
-                supabase.table("work_genres")
-                .insert([{"work_id": work.id, "genre_id": genre_id} for genre_id in work_data.genre_ids])
-                .execute()
-            )
+        return work
 
-        # Create external links
-        if work_data.external_links:
-            await (
-                supabase.table("external_links")
-                .insert(
-                    [
-                        {
-                            "entity_type": EntityType.WORK.value,
-                            "entity_id": work.id,
-                            **link.model_dump(exclude_none=True),
-                            # TODO: Remove hardcoded value once user implementation is done
-                            "added_by": "760c6a23-cf19-4e59-89aa-f6921943bc26",
-                        }
-                        for link in work_data.external_links
-                    ]
-                )
-                .execute()
-            )
+    except PostgrestAPIError as e:
+        raise APIError(str(e)) from None
+    except Exception as e:
+        raise e
 
-        # Get work by ID to include complete information
-        return await get_by_id(work.id)
 
+async def update(id: str, work_data: WorkUpdate) -> Optional[Work]:
+    """
+    Update the fields given for a work, leaving the rest and its relationships untouched
+
+    Args:
+        id (str): The UUID of the work to update
+        work_data (WorkUpdate): The fields to change. Only the fields set are written
+
+    Returns:
+        Optional[Work]: The updated work, if it exists
+
+    Raises:
+        ValidationError: If the UUID format or the input data is invalid, or the origin years are out of order once
+            written
+        APIError: If Supabase throws an error
+    """
+    try:
+        # Check UUID format and raise if invalid
+        validate_uuid(id)
+
+        supabase = await get_supabase()
+
+        # The write returns the updated work in the detail select shape. External links aren't changed by an update,
+        # so they are read at the same time
+        res, external_links_raw = await asyncio.gather(
+            supabase.table("works")
+            .update(work_data.model_dump(mode="json", exclude_unset=True))
+            .eq("work_id", id)
+            .select(_WORK_DETAIL_SELECT)
+            .execute(),
+            assets.get_external_links_raw(EntityType.WORK, entity_id=id),
+        )
+
+        if not res.data:
+            return None
+
+        work: Work = _parse(Work, res.data[0])
+        work.genres = await genres.resolve(_genre_ids(res.data[0]))
+        work.external_links = _parse_list(WorkExternalLink, external_links_raw)
+
+        return work
     except PostgrestAPIError as e:
-        # Roll back work creation and its relationships if any relationship creation fails
-        if work and work.id:
-            await supabase.table("versions").delete().eq("work_id", work.id).execute()
-            await supabase.table("credits").delete().eq("work_id", work.id).execute()
-            await supabase.table("work_genres").delete().eq("work_id", work.id).execute()
-            await (
-                supabase.table("external_links")
-                .delete()
-                .eq("entity_type", EntityType.WORK)
-                .eq("entity_id", work.id)
-                .execute()
-            )
-            await supabase.table("works").delete().eq("work_id", work.id).execute()
+        # Raised by the origin years check, which also covers years that were already stored
+        if e.code == "23514":
+            raise ValueError("Invalid years: Start year should be before or equal to end year.") from None
         raise APIError(str(e)) from None
     except Exception as e:
         raise e
+
+
+async def _create_chunk(start: int, works_data: List[WorkCreate]) -> List[BulkItemResult[Work]]:
+    try:
+        supabase = await get_supabase()
+
+        # Create every work in the chunk and all of their relationships in a single transaction, so a failure leaves
+        # nothing of the chunk behind
+        res = await supabase.rpc(
+            "create_works",
+            {
+                "payload": [work_data.model_dump(mode="json", exclude_none=True) for work_data in works_data],
+                "added_by": _EXTERNAL_LINKS_ADDED_BY,
+            },
+        ).execute()
+
+        # The RPC returns the created records in the detail select shape, so only genres need resolving
+        works_by_index: Dict[int, Work] = {}
+        for row in res.data or []:
+            work: Work = _parse(Work, row["work"])
+            work.genres = await genres.resolve(_genre_ids(row["work"]))
+            work.external_links = _parse_list(WorkExternalLink, row["work"].get("external_links"))
+            works_by_index[row["item_index"]] = work
+
+        return [
+            BulkItemResult[Work](index=start + offset, status=BulkItemStatus.CREATED, result=works_by_index[offset])
+            if offset in works_by_index
+            else BulkItemResult[Work](
+                index=start + offset, status=BulkItemStatus.FAILED, error="Work wasn't returned by the insert"
+            )
+            for offset in range(len(works_data))
+        ]
+    except Exception as e:
+        # A database error rolls back the whole chunk. Any other error, such as a timeout, is reported for the chunk
+        # too so the other chunks' results still reach the client
+        error = str(e) if isinstance(e, PostgrestAPIError) else f"Chunk failed with {type(e).__name__}: {e}"
+        return [
+            BulkItemResult[Work](index=start + offset, status=BulkItemStatus.FAILED, error=error)
+            for offset in range(len(works_data))
+        ]
+
+
+async def create_many(works_data: List[WorkCreate], chunk_size: int = BULK_CHUNK_SIZE) -> List[BulkItemResult[Work]]:
+    """
+    Create several work records and their optional nested relationships, creating each chunk of works in a single
+    transaction
+
+    Args:
+        works_data (List[WorkCreate]): The raw data for the works and optional relationships, already validated
+        chunk_size (int, optional): The maximum number of works sent in each insert
+
+    Returns:
+        List[BulkItemResult[Work]]: The outcome for each work, in the same order as given, with their created
+        relationships. Works in a chunk where any insert failed are reported as failed and none of that chunk is
+        written, while a chunk that timed out may or may not have been written
+
+    Raises:
+        ValidationError: If the chunk size is invalid
+    """
+    try:
+        chunks = list(chunked(works_data, chunk_size))
+        chunk_results = await gather_bounded(
+            (_create_chunk(index * chunk_size, chunk) for index, chunk in enumerate(chunks)),
+            BULK_MAX_CONCURRENT_CHUNKS,
+        )
+
+        return [item for chunk_result in chunk_results for item in chunk_result]
+    except Exception as e:
+        raise e
@@ -1,9 +1,96 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from music_catalogue.crud import genres as genre_registry
+from music_catalogue.crud import loader
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.routers import artists, genres, persons, search, suggest, versions, works
+
+
+class DisconnectCancellationMiddleware:
+    """
+    Cancels the handler of a read request as soon as its client disconnects, along with any Supabase call it's waiting
+    on, instead of finishing a response nobody will receive. Only requests without a body are watched, and nothing is
+    cancelled once the response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        # The watcher owns the receive channel and hands every message on to the handler, so both can read it
+        messages: asyncio.Queue = asyncio.Queue()
+        response_complete = False
+
+        async def watch_disconnect() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        async def send_tracked(message: Message) -> None:
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        app_task = asyncio.create_task(self.app(scope, messages.get, send_tracked))
+        watch_task = asyncio.create_task(watch_disconnect())
+        try:
+            await asyncio.wait({app_task, watch_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not app_task.done() and not response_complete:
+                app_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await app_task
+                return
+            await app_task
+        finally:
+            app_task.cancel()
+            watch_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await watch_task
+
+
+class EntityLoaderMiddleware:
+    """
+    Gives every HTTP request its own entity loader so batching and memoization never leak across requests.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with loader.request_scope():
+            await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Preload the genre registry. If Supabase is unavailable it is loaded lazily on first use instead
+    with suppress(APIError):
+        await genre_registry.load()
+    refresh_task = asyncio.create_task(genre_registry.refresh_periodically())
+
+    yield
+
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
 
-from music_catalogue.routers import artists, persons, search, works
 
-app = FastAPI(title="Music Catalogue API")
+app = FastAPI(title="Music Catalogue API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,8 +99,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(DisconnectCancellationMiddleware)
+app.add_middleware(EntityLoaderMiddleware)
 
 app.include_router(artists.router)
 app.include_router(persons.router)
 app.include_router(works.router)
+app.include_router(versions.router)
+app.include_router(genres.router)
 app.include_router(search.router)
+app.include_router(suggest.router)
@@ -4,3 +4,19 @@ class APIError(Exception):
     """
 
     pass
+
+
+class IdempotencyKeyReuseError(Exception):
+    """
+    Exception raised when an idempotency key is sent again with a different request.
+    """
+
+    pass
+
+
+class ConflictError(Exception):
+    """
+    Exception raised when a write conflicts with an existing record.
+    """
+
+    pass
@@ -23,6 +23,8 @@ class ArtistMembershipCreate(BaseModel):
         except ValueError as e:
             raise ValueError(f"Invalid member configuration for person with ID {self.person_id}: {str(e)}") from None
 
+        return self
+
 
 class ArtistCreate(BaseModel):
     artist_type: ArtistType
@@ -55,3 +57,26 @@ class ArtistCreate(BaseModel):
             # Raise if there's a person_id for artist
             if self.person_id:
                 raise ValueError("Invalid assignment of person to GROUP type artist")
+
+        return self
+
+
+# UPDATE
+class ArtistUpdate(BaseModel):
+    display_name: Optional[str] = None
+    sort_name: Optional[str] = None
+    alternative_names: Optional[List[str]] = None
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+
+    @model_validator(mode="after")
+    def validate(self):
+        # Check there's something to update and required fields aren't cleared
+        if not self.model_fields_set:
+            raise ValueError("At least one field is required to update an artist")
+        if "display_name" in self.model_fields_set and not self.display_name:
+            raise ValueError("Artist display name can't be empty")
+        # Raise for invalid start or end years
+        validate_start_and_end_years(self.start_year, self.end_year)
+
+        return self
@@ -0,0 +1,21 @@
+from typing import List
+
+from pydantic import BaseModel, model_validator
+
+from music_catalogue.models.validation import validate_uuid_list
+
+# Maximum number of duplicates merged by a single request
+MAX_MERGE_DUPLICATES = 50
+
+
+class EntityMerge(BaseModel):
+    duplicate_ids: List[str]
+
+    @model_validator(mode="after")
+    def validate(self):
+        # Check the batch size and UUID formats, dropping repeated IDs
+        if not self.duplicate_ids:
+            raise ValueError("At least one duplicate ID is required")
+        self.duplicate_ids = validate_uuid_list(self.duplicate_ids, MAX_MERGE_DUPLICATES)
+
+        return self
@@ -0,0 +1,12 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from music_catalogue.models.types import EntityType, SearchHydration
+
+
+class LiveSearchQuery(BaseModel):
+    query: str = Field(min_length=2, max_length=50)
+    entity_types: List[EntityType] = Field(default_factory=list)
+    limit: int = Field(20, ge=1, le=100)
+    hydrate: Optional[SearchHydration] = None
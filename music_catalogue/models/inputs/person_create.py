@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, model_validator
 
@@ -15,3 +15,25 @@ class PersonCreate(BaseModel):
     @model_validator(mode="after")
     def validate(self):
         validate_start_and_end_dates(self.birth_date, self.death_date)
+
+        return self
+
+
+class PersonUpdate(BaseModel):
+    legal_name: Optional[str] = None
+    alternative_names: Optional[List[str]] = None
+    birth_date: Optional[str] = None
+    death_date: Optional[str] = None
+    pronouns: Optional[str] = None
+    notes: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate(self):
+        # Check there's something to update and required fields aren't cleared
+        if not self.model_fields_set:
+            raise ValueError("At least one field is required to update a person")
+        if "legal_name" in self.model_fields_set and not self.legal_name:
+            raise ValueError("Person legal name can't be empty")
+        validate_start_and_end_dates(self.birth_date, self.death_date)
+
+        return self
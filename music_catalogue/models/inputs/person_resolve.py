@@ -0,0 +1,34 @@
+from typing import List
+
+from pydantic import BaseModel, model_validator
+
+# Maximum number of names accepted by a single resolve request
+MAX_RESOLVE_NAMES = 1000
+# Maximum number of candidates returned for each name
+MAX_RESOLVE_CANDIDATES = 20
+
+
+class PersonResolve(BaseModel):
+    names: List[str]
+    candidate_limit: int = 5
+    min_score: float = 0.3
+
+    @model_validator(mode="after")
+    def validate(self):
+        # Check the batch size
+        if not self.names:
+            raise ValueError("At least one name is required")
+        if len(self.names) > MAX_RESOLVE_NAMES:
+            raise ValueError(f"Too many names: {len(self.names)} given, maximum is {MAX_RESOLVE_NAMES}")
+        if any(not name.strip() for name in self.names):
+            raise ValueError("Names can't be empty")
+
+        # Check candidate limit and score range
+        if not 1 <= self.candidate_limit <= MAX_RESOLVE_CANDIDATES:
+            raise ValueError(
+                f"Invalid candidate limit {self.candidate_limit}: must be between 1 and {MAX_RESOLVE_CANDIDATES}"
+            )
+        if not 0 <= self.min_score <= 1:
+            raise ValueError(f"Invalid minimum score {self.min_score}: must be between 0 and 1")
+
+        return self
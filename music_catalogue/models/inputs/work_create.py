@@ -28,6 +28,8 @@ class WorkCreditCreate(BaseModel):
         if (not self.artist_id and not self.person_id) or (self.artist_id and self.person_id):
             raise ValueError("Either person or artist ID is required for credits")
 
+        return self
+
 
 class WorkVersionCreate(BaseModel):
     title: str
@@ -53,6 +55,8 @@ class WorkVersionCreate(BaseModel):
         if self.release_year:
             validate_year(self.release_year)
 
+        return self
+
 
 class WorkExternalLinkCreate(BaseModel):
     label: str
@@ -84,3 +88,32 @@ class WorkCreate(BaseModel):
         # If genre IDs, validate they are UUIDs
         if self.genre_ids:
             [validate_uuid(genre_id) for genre_id in self.genre_ids]
+
+        return self
+
+
+# UPDATE
+class WorkUpdate(BaseModel):
+    title: Optional[str] = None
+    language: Optional[str] = None
+    titles: Optional[List[Dict[str, Any]]] = None
+    description: Optional[str] = None
+    identifiers: Optional[List[Dict[str, Any]]] = None
+    origin_year_start: Optional[int] = None
+    origin_year_end: Optional[int] = None
+    origin_country: Optional[str] = None
+    themes: Optional[List[str]] = None
+    sentiment: Optional[str] = None
+    notes: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate(self):
+        # Check there's something to update and required fields aren't cleared
+        if not self.model_fields_set:
+            raise ValueError("At least one field is required to update a work")
+        if "title" in self.model_fields_set and not self.title:
+            raise ValueError("Work title can't be empty")
+        # Check origin year start and end
+        validate_start_and_end_years(self.origin_year_start, self.origin_year_end)
+
+        return self
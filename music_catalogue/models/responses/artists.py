@@ -55,5 +55,47 @@ class ArtistMembership(BaseModel):
         )
 
 
+class DiscographyEntry(BaseModel):
+    id: str
+    work_id: Optional[str] = None
+    work_title: Optional[str] = None
+    version_id: Optional[str] = None
+    version_title: Optional[str] = None
+    role: str
+    year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DiscographyEntry":
+        return cls(
+            id=data["entry_id"],
+            work_id=data.get("work_id"),
+            work_title=data.get("work_title"),
+            version_id=data.get("version_id"),
+            version_title=data.get("version_title"),
+            role=data["role"],
+            year=data.get("year"),
+        )
+
+
+class RelatedArtist(BaseModel):
+    artist: Artist
+    rank: int
+    score: float
+    shared_works: int = 0
+    shared_versions: int = 0
+    shared_members: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RelatedArtist":
+        return cls(
+            artist=Artist.from_dict(data["related"]),
+            rank=data["rank"],
+            score=data["score"],
+            shared_works=data.get("shared_works") or 0,
+            shared_versions=data.get("shared_versions") or 0,
+            shared_members=data.get("shared_members") or 0,
+        )
+
+
 Artist.model_rebuild()
 ArtistMembership.model_rebuild()
@@ -0,0 +1,25 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from music_catalogue.models.types import BulkItemStatus
+
+T = TypeVar("T")
+
+
+class BatchResult(BaseModel, Generic[T]):
+    results: List[T] = Field(default_factory=list)
+    missing_ids: List[str] = Field(default_factory=list)
+
+
+class BulkItemResult(BaseModel, Generic[T]):
+    index: int
+    status: BulkItemStatus
+    result: Optional[T] = None
+    error: Optional[str] = None
+
+
+class Page(BaseModel, Generic[T]):
+    results: List[T] = Field(default_factory=list)
+    # Pass as the cursor to get the next page, None on the last page
+    next_cursor: Optional[str] = None
@@ -1,12 +1,15 @@
 from datetime import date
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from music_catalogue.models.types import CreditPath, NameMatchType
 
 
 class Person(BaseModel):
     id: str
     legal_name: str
+    alternative_names: Optional[List[str]] = None
     birth_date: Optional[date] = None
     death_date: Optional[date] = None
     pronouns: Optional[str] = None
@@ -17,8 +20,48 @@ class Person(BaseModel):
         return cls(
             id=data["person_id"],
             legal_name=data["legal_name"],
+            alternative_names=data.get("alternative_names"),
             birth_date=date.fromisoformat(data.get("birth_date")) if data.get("birth_date") else None,
             death_date=date.fromisoformat(data.get("death_date")) if data.get("death_date") else None,
             pronouns=data.get("pronouns"),
             notes=data.get("notes"),
         )
+
+
+class PersonCandidate(BaseModel):
+    person: Person
+    match_type: NameMatchType
+    score: float
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PersonCandidate":
+        return cls(
+            person=Person(id=data["person_id"], legal_name=data["legal_name"]),
+            match_type=NameMatchType(data["match_type"]),
+            score=data["score"],
+        )
+
+
+class PersonNameResolution(BaseModel):
+    name: str
+    candidates: List[PersonCandidate] = Field(default_factory=list)
+
+
+class PersonWork(BaseModel):
+    id: str
+    title: str
+    origin_year_start: Optional[int] = None
+    origin_year_end: Optional[int] = None
+    roles: List[str] = Field(default_factory=list)
+    credited_as: List[CreditPath] = Field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PersonWork":
+        return cls(
+            id=data["work_id"],
+            title=data["title"],
+            origin_year_start=data.get("origin_year_start"),
+            origin_year_end=data.get("origin_year_end"),
+            roles=data.get("roles") or [],
+            credited_as=[CreditPath(path) for path in data.get("credited_as") or []],
+        )
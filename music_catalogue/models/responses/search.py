@@ -1,8 +1,105 @@
-from typing import Dict
+from datetime import date
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
-from music_catalogue.models.types import EntityType
+from music_catalogue.models.types import ArtistType, EntityType, ReleaseCategory, VersionType
+
+
+def _year(date_str: Optional[str]) -> Optional[int]:
+    return date.fromisoformat(date_str).year if date_str else None
+
+
+def _composer_name(credits: Optional[List[Dict]]) -> Optional[str]:
+    # Prefer the primary composer credit, falling back to any composer credit
+    composer_credits = sorted(
+        (credit for credit in credits or [] if (credit.get("role") or "").lower() == "composer"),
+        key=lambda credit: not credit.get("is_primary"),
+    )
+    for credit in composer_credits:
+        name = (credit.get("person") or {}).get("legal_name") or (credit.get("artist") or {}).get("display_name")
+        if name:
+            return name
+    return None
+
+
+class WorkSummary(BaseModel):
+    title: str
+    composer: Optional[str] = None
+    year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WorkSummary":
+        return cls(
+            title=data["title"],
+            composer=_composer_name(data.get("credits")),
+            year=data.get("origin_year_start") or data.get("origin_year_end"),
+        )
+
+
+class VersionSummary(BaseModel):
+    title: str
+    version_type: VersionType
+    primary_artist: Optional[str] = None
+    release_year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VersionSummary":
+        return cls(
+            title=data["title"],
+            version_type=VersionType(data["version_type"]),
+            primary_artist=(data.get("primary_artist") or {}).get("display_name"),
+            release_year=data.get("release_year") or _year(data.get("release_date")),
+        )
+
+
+class ReleaseSummary(BaseModel):
+    title: str
+    release_category: ReleaseCategory
+    release_year: Optional[int] = None
+    label: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ReleaseSummary":
+        return cls(
+            title=data["release_title"],
+            release_category=ReleaseCategory(data["release_category"]),
+            release_year=_year(data.get("release_date")),
+            label=data.get("label"),
+        )
+
+
+class ArtistSummary(BaseModel):
+    display_name: str
+    artist_type: ArtistType
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ArtistSummary":
+        return cls(
+            display_name=data["display_name"],
+            artist_type=ArtistType(data["artist_type"]),
+            start_year=data.get("start_year"),
+            end_year=data.get("end_year"),
+        )
+
+
+class PersonSummary(BaseModel):
+    legal_name: str
+    birth_year: Optional[int] = None
+    death_year: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PersonSummary":
+        return cls(
+            legal_name=data["legal_name"],
+            birth_year=_year(data.get("birth_date")),
+            death_year=_year(data.get("death_date")),
+        )
+
+
+EntitySummary = Union[WorkSummary, VersionSummary, ReleaseSummary, ArtistSummary, PersonSummary]
 
 
 class UnifiedSearchResult(BaseModel):
@@ -10,6 +107,7 @@ class UnifiedSearchResult(BaseModel):
     entity_id: str
     display_text: str
     rank: float
+    summary: Optional[EntitySummary] = None
 
     @classmethod
     def from_dict(cls, data: Dict) -> "UnifiedSearchResult":
@@ -19,3 +117,17 @@ class UnifiedSearchResult(BaseModel):
             display_text=data["display_text"],
             rank=data["rank"],
         )
+
+
+class Suggestion(BaseModel):
+    entity_type: EntityType
+    entity_id: str
+    display_text: str
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Suggestion":
+        return cls(
+            entity_type=EntityType(data["entity_type"]),
+            entity_id=data["entity_id"],
+            display_text=data["display_text"],
+        )
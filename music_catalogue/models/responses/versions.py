@@ -0,0 +1,53 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from music_catalogue.models.types import VersionType
+
+
+class VersionNode(BaseModel):
+    id: str
+    title: str
+    version_type: VersionType = VersionType.ORIGINAL
+    work_id: Optional[str] = None
+    primary_artist_id: Optional[str] = None
+    primary_artist_name: Optional[str] = None
+    depth: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VersionNode":
+        return cls(
+            id=data["version_id"],
+            title=data["title"],
+            version_type=VersionType(data["version_type"]),
+            work_id=data.get("work_id"),
+            primary_artist_id=data.get("primary_artist_id"),
+            primary_artist_name=data.get("primary_artist_name"),
+            depth=data.get("depth") or 0,
+        )
+
+
+class VersionEdge(BaseModel):
+    based_on_version_id: str
+    version_id: str
+
+
+class VersionGraph(BaseModel):
+    nodes: List[VersionNode] = Field(default_factory=list)
+    edges: List[VersionEdge] = Field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict]) -> "VersionGraph":
+        # Only link versions that are both part of the graph, the traversal may stop before reaching a parent
+        ids = {row["version_id"] for row in rows}
+        return cls(
+            nodes=[
+                VersionNode.from_dict(row)
+                for row in sorted(rows, key=lambda row: (row.get("depth") or 0, row["title"]))
+            ],
+            edges=[
+                VersionEdge(based_on_version_id=row["based_on_version_id"], version_id=row["version_id"])
+                for row in rows
+                if row.get("based_on_version_id") in ids
+            ],
+        )
@@ -250,6 +250,16 @@ class ReleaseTrack(BaseModel):
         )
 
 
+class SimilarWork(BaseModel):
+    work: Work
+    rank: int
+    score: float
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SimilarWork":
+        return cls(work=Work.from_dict(data["similar"]), rank=data["rank"], score=data["score"])
+
+
 Work.model_rebuild()
 Version.model_rebuild()
 Release.model_rebuild()
@@ -95,3 +95,28 @@ class AvailabilityStatus(str, Enum):
     LIMITED = "limited"
     OUT_OF_PRINT = "out_of_print"
     DIGITAL_ONLY = "digital_only"
+
+
+class SearchHydration(str, Enum):
+    SUMMARY = "summary"
+
+
+class ResponseExpansion(str, Enum):
+    FULL = "full"
+
+
+class NameMatchType(str, Enum):
+    EXACT = "exact"
+    ALTERNATIVE_NAME = "alternative_name"
+    SIMILAR = "similar"
+
+
+class CreditPath(str, Enum):
+    DIRECT = "direct"
+    ARTIST = "artist"
+    GROUP_MEMBER = "group_member"
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    FAILED = "failed"
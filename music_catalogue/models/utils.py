@@ -2,6 +2,8 @@ from typing import Any, Dict, List
 
 from pydantic import BaseModel
 
+from music_catalogue.models.responses.batch import BatchResult
+
 
 def _parse(model_cls: BaseModel, data: Dict) -> Any:
     if not data:
@@ -13,3 +15,12 @@ def _parse_list(model_cls: BaseModel, data: Dict) -> List[Any]:
     if not data:
         return []
     return [_parse(model_cls, item) for item in data if _parse(model_cls, item) is not None]
+
+
+def _to_batch_result(model_cls: BaseModel, ids: List[str], items: List[Any]) -> BatchResult:
+    # Order results as requested and report the IDs that weren't found
+    items_by_id = {item.id: item for item in items}
+    return BatchResult[model_cls](
+        results=[items_by_id[id] for id in ids if id in items_by_id],
+        missing_ids=[id for id in ids if id not in items_by_id],
+    )
@@ -1,7 +1,10 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
+# Maximum number of IDs accepted by a single batch request
+MAX_BATCH_IDS = 250
+
 
 def validate_uuid(uuid: str) -> None:
     """
@@ -19,6 +22,28 @@ def validate_uuid(uuid: str) -> None:
         raise ValueError(f"Invalid UUID {uuid}: {str(e)}") from None
 
 
+def validate_uuid_list(uuids: List[str], max_length: int = MAX_BATCH_IDS) -> List[str]:
+    """
+    Check if a list of strings are valid UUIDs and removes duplicates, keeping the original order
+
+    Args:
+        uuids (List[str]): The UUIDs to test
+        max_length (int, optional): The maximum number of unique UUIDs allowed
+
+    Returns:
+        List[str]: The unique UUIDs, in the order they were first given
+
+    Raises:
+        ValidationError: If any UUID is invalid or there are too many of them
+    """
+    unique_uuids = list(dict.fromkeys(uuids))
+    if len(unique_uuids) > max_length:
+        raise ValueError(f"Too many UUIDs: {len(unique_uuids)} given, maximum is {max_length}")
+    for uuid in unique_uuids:
+        validate_uuid(uuid)
+    return unique_uuids
+
+
 def validate_date(date_str: str) -> date:
     """
     Check if a date has a valid format
@@ -1,11 +1,16 @@
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from music_catalogue.crud import artists
-from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.inputs.artist_create import ArtistCreate
-from music_catalogue.models.responses.artists import Artist
+from music_catalogue.models.exceptions import APIError, ConflictError, IdempotencyKeyReuseError
+from music_catalogue.models.inputs.artist_create import ArtistCreate, ArtistUpdate
+from music_catalogue.models.inputs.entity_merge import EntityMerge
+from music_catalogue.models.responses.artists import Artist, ArtistMembership, DiscographyEntry, RelatedArtist
+from music_catalogue.models.responses.batch import BatchResult, Page
+from music_catalogue.routers.params import batch_ids, idempotency_key
+from music_catalogue.utils import idempotency
+from music_catalogue.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/artists", tags=["Artists"])
 
@@ -28,13 +33,107 @@ async def get_artist_by_id(id: str):
         raise
 
 
-@router.get("/", response_model=List[Artist], response_model_exclude_none=True, status_code=status.HTTP_200_OK)
-async def search_artists(query: str = Query(min_length=2, max_length=50)):
+@router.get(
+    "/{id}/members",
+    response_model=List[ArtistMembership],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_artist_members(id: str, year: Optional[int] = None):
     """
-    Searches for artists based on a query string.
+    Gets the members of a group artist. Pass `year` to only get the members active that year.
     """
     try:
+        return await artists.get_members(id, year)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get artist members: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/{id}/related",
+    response_model=List[RelatedArtist],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_related_artists(
+    id: str, limit: int = Query(artists.MAX_RELATED_ARTISTS, ge=1, le=artists.MAX_RELATED_ARTISTS)
+):
+    """
+    Gets the artists most related to an artist by shared works, versions and members.
+    """
+    try:
+        return await artists.get_related(id, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get related artists: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/{id}/discography",
+    response_model=Page[DiscographyEntry],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_artist_discography(
+    id: str,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    role: List[str] = Query([]),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """
+    Gets a page of the works and versions an artist is credited on, ordered by year. Pass the `next_cursor` of a page as
+    `cursor` to get the next one.
+    """
+    try:
+        return await artists.get_discography(
+            id, year_from=year_from, year_to=year_to, roles=role, cursor=cursor, page_size=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get artist discography: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/",
+    response_model=Union[List[Artist], BatchResult[Artist]],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def search_artists(
+    query: Optional[str] = Query(None, min_length=2, max_length=50),
+    ids: List[str] = Depends(batch_ids),
+):
+    """
+    Searches for artists based on a query string, or fetches a batch of artists by ID when `ids` is given.
+    """
+    try:
+        if ids:
+            return await artists.get_by_ids(ids)
+        if not query:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Either a query or a list of IDs is required"
+            )
         return await artists.search(query)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to search artists: {str(e)}"
@@ -43,16 +142,82 @@ async def search_artists(query: str = Query(min_length=2, max_length=50)):
         raise
 
 
+@router.patch("/{id}", response_model=Artist, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def update_artist(id: str, artist_data: ArtistUpdate):
+    """
+    Updates only the fields given for an artist, returning the updated artist.
+    """
+    try:
+        artist = await artists.update(id, artist_data)
+        if not artist:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No artist found with ID {str(id)}")
+        return artist
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update artist: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.post("/{id}/merge", response_model=Artist, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def merge_artists(id: str, merge_data: EntityMerge):
+    """
+    Merges duplicate artists into a artist, repointing every reference to them and deleting them, and returns the merged
+    artist.
+    """
+    try:
+        artist = await artists.merge(id, merge_data)
+        if not artist:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No artist found with ID {str(id)}")
+        return artist
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to merge artists: {str(e)}"
+        )
+    except:
+        raise
+
+
 @router.post("/", response_model=Artist, response_model_exclude_none=True, status_code=status.HTTP_201_CREATED)
-async def create_artist(artist_data: ArtistCreate):
+async def create_artist(artist_data: ArtistCreate, key: Optional[str] = Depends(idempotency_key)):
     """
-    Creates a new artist with nested relationships
+    Creates a new artist with nested relationships. Retries with the same `Idempotency-Key` return the original artist.
     """
     try:
-        return await artists.create(artist_data)
+        return await idempotency.run(key, "POST /artists", artist_data, lambda: artists.create(artist_data))
+    except IdempotencyKeyReuseError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create artist: {str(e)}"
         )
     except:
         raise
+
+
+@router.post("/upsert", response_model=List[Artist], response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def upsert_artists(
+    artists_data: List[ArtistCreate],
+    chunk_size: int = Query(artists.BULK_CHUNK_SIZE, ge=1, le=1000),
+):
+    """
+    Resolves or creates a list of solo artists by their person and display name. Returns the existing or new artist
+    for each one, in the same order.
+    """
+    try:
+        return await artists.upsert_many(artists_data, chunk_size)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to upsert artists: {str(e)}"
+        )
+    except:
+        raise
@@ -0,0 +1,24 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, status
+
+from music_catalogue.crud import genres
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.works import Genre
+
+router = APIRouter(prefix="/genres", tags=["Genres"])
+
+
+@router.get("/", response_model=List[Genre], response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def list_genres():
+    """
+    Lists all genres, served from the in-memory genre registry.
+    """
+    try:
+        return await genres.get_all()
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to list genres: {str(e)}"
+        )
+    except:
+        raise
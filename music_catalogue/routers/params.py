@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from fastapi import Header, Query
+
+
+def batch_ids(
+    ids: Optional[List[str]] = Query(
+        None, description="IDs to fetch in a single batch, either repeated or comma separated"
+    ),
+) -> List[str]:
+    """
+    Collects batch IDs from the query string, accepting both `?ids=a&ids=b` and `?ids=a,b`.
+    """
+    return [id.strip() for value in ids or [] for id in value.split(",") if id.strip()]
+
+
+def idempotency_key(
+    key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Key that makes retries of this request return the original result instead of writing again",
+    ),
+) -> Optional[str]:
+    """
+    Reads the optional `Idempotency-Key` header sent with write requests.
+    """
+    return key
@@ -1,11 +1,19 @@
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from music_catalogue.crud import persons
-from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.inputs.person_create import PersonCreate
-from music_catalogue.models.responses.persons import Person
+from music_catalogue.models.exceptions import APIError, IdempotencyKeyReuseError
+from music_catalogue.models.inputs.entity_merge import EntityMerge
+from music_catalogue.models.inputs.person_create import PersonCreate, PersonUpdate
+from music_catalogue.models.inputs.person_resolve import PersonResolve
+from music_catalogue.models.responses.artists import ArtistMembership
+from music_catalogue.models.responses.batch import BatchResult, BulkItemResult, Page
+from music_catalogue.models.responses.persons import Person, PersonNameResolution, PersonWork
+from music_catalogue.models.types import BulkItemStatus
+from music_catalogue.routers.params import batch_ids, idempotency_key
+from music_catalogue.utils import idempotency
+from music_catalogue.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/persons", tags=["Persons"])
 
@@ -28,13 +36,78 @@ async def get_person_by_id(id: str):
         raise
 
 
-@router.get("/", response_model=List[Person], response_model_exclude_none=True, status_code=status.HTTP_200_OK)
-async def search_person(query: str = Query(min_length=2, max_length=50)):
+@router.get(
+    "/{id}/memberships",
+    response_model=List[ArtistMembership],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_person_memberships(id: str, year: Optional[int] = None):
+    """
+    Gets the groups a person has been a member of. Pass `year` to only get the groups they were in that year.
+    """
+    try:
+        return await persons.get_memberships(id, year)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get person memberships: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/{id}/works",
+    response_model=Page[PersonWork],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_person_works(
+    id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
     """
-    Searches for persons based on a query string.
+    Gets a page of the works a person is credited on, directly or through their solo and group artists. Pass the
+    `next_cursor` of a page as `cursor` to get the next one.
     """
     try:
+        return await persons.get_works(id, cursor=cursor, page_size=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get person works: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/",
+    response_model=Union[List[Person], BatchResult[Person]],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def search_person(
+    query: Optional[str] = Query(None, min_length=2, max_length=50),
+    ids: List[str] = Depends(batch_ids),
+):
+    """
+    Searches for persons based on a query string, or fetches a batch of persons by ID when `ids` is given.
+    """
+    try:
+        if ids:
+            return await persons.get_by_ids(ids)
+        if not query:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Either a query or a list of IDs is required"
+            )
         return await persons.search(query)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to search for person: {str(e)}"
@@ -43,13 +116,56 @@ async def search_person(query: str = Query(min_length=2, max_length=50)):
         raise
 
 
+@router.patch("/{id}", response_model=Person, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def update_person(id: str, person_data: PersonUpdate):
+    """
+    Updates only the fields given for a person, returning the updated person.
+    """
+    try:
+        person = await persons.update(id, person_data)
+        if not person:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No person found with ID {str(id)}")
+        return person
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update person: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.post("/{id}/merge", response_model=Person, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def merge_persons(id: str, merge_data: EntityMerge):
+    """
+    Merges duplicate persons into a person, repointing every reference to them and deleting them, and returns the merged
+    person.
+    """
+    try:
+        person = await persons.merge(id, merge_data)
+        if not person:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No person found with ID {str(id)}")
+        return person
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to merge persons: {str(e)}"
+        )
+    except:
+        raise
+
+
 @router.post("/", response_model=Person, response_model_exclude_none=True, status_code=status.HTTP_201_CREATED)
-async def create_person(person_data: PersonCreate):
+async def create_person(person_data: PersonCreate, key: Optional[str] = Depends(idempotency_key)):
     """
-    Creates a new person
+    Creates a new person. Retries with the same `Idempotency-Key` return the original person.
     """
     try:
-        return await persons.create(person_data)
+        return await idempotency.run(key, "POST /persons", person_data, lambda: persons.create(person_data))
+    except IdempotencyKeyReuseError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create person: {str(e)}"
@@ -59,17 +175,73 @@ async def create_person(person_data: PersonCreate):
 
 
 @router.post(
-    "/bulk", response_model=List[Person], response_model_exclude_none=True, status_code=status.HTTP_201_CREATED
+    "/bulk",
+    response_model=List[BulkItemResult[Person]],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_persons(
+    people_data: List[PersonCreate],
+    response: Response,
+    chunk_size: int = Query(persons.BULK_CHUNK_SIZE, ge=1, le=1000),
+    key: Optional[str] = Depends(idempotency_key),
+):
+    """
+    Bulk creates a list of people, inserting them in chunks. Returns the outcome for each person, with a 207 status
+    if any of them failed. Retries with the same `Idempotency-Key` return the original outcomes.
+    """
+    try:
+        results = await idempotency.run(
+            key, "POST /persons/bulk", (people_data, chunk_size), lambda: persons.create_many(people_data, chunk_size)
+        )
+        if any(result.status == BulkItemStatus.FAILED for result in results):
+            response.status_code = status.HTTP_207_MULTI_STATUS
+        return results
+    except IdempotencyKeyReuseError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except:
+        raise
+
+
+@router.post("/upsert", response_model=List[Person], response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def upsert_persons(
+    people_data: List[PersonCreate],
+    chunk_size: int = Query(persons.BULK_CHUNK_SIZE, ge=1, le=1000),
+):
+    """
+    Resolves or creates a list of people by their normalized legal name and birth year, so namesakes born in different
+    years stay apart. Returns the existing or new person for each one, in the same order.
+    """
+    try:
+        return await persons.upsert_many(people_data, chunk_size)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to upsert persons: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.post(
+    "/resolve",
+    response_model=List[PersonNameResolution],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
 )
-async def bulk_create_persons(people_data: List[PersonCreate]):
+async def resolve_person_names(resolve_data: PersonResolve):
     """
-    Bulk creates a list of people
+    Resolves a batch of free-text names to ranked candidate persons, matching exact and alternative names and similar
+    legal names. Returns the candidates for each name in the same order, best match first.
     """
     try:
-        return [await persons.create(person_data) for person_data in people_data]
+        return await persons.resolve_names(resolve_data)
     except APIError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create people in bulk: {str(e)}"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to resolve person names: {str(e)}"
         )
     except:
         raise
@@ -1,13 +1,21 @@
+import asyncio
+import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
 
-from music_catalogue.crud.search import unified_search
+from music_catalogue.crud.search import hydrate_summaries, unified_search
 from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.inputs.live_search import LiveSearchQuery
 from music_catalogue.models.responses.search import UnifiedSearchResult
-from music_catalogue.models.types import EntityType
+from music_catalogue.models.types import EntityType, SearchHydration
 
 router = APIRouter(prefix="/search", tags=["Unified Search"])
+logger = logging.getLogger(__name__)
+
+# Seconds a live search query waits before running, so a burst of keystrokes only searches for the last one
+LIVE_SEARCH_DEBOUNCE_SECONDS = 0.15
 
 
 # Unified Search
@@ -22,13 +30,82 @@ async def search_all(
     query: str = Query(min_length=2, max_length=50),
     entity_types: Optional[List[EntityType]] = Query(None),
     limit: int = Query(20, ge=1, le=100),
+    hydrate: Optional[SearchHydration] = Query(None),
 ):
     """
-    Searches among all entities according to query. Optionally, entities to search among can be limited.
+    Searches among all entities according to query. Optionally, entities to search among can be limited, and
+    results can be hydrated with a compact summary of each entity with `hydrate=summary`.
     """
     try:
-        return await unified_search(query, entity_types or [], limit)
+        results = await unified_search(query, entity_types or [], limit)
+        if hydrate == SearchHydration.SUMMARY:
+            results = await hydrate_summaries(results)
+        return results
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to search across entities: {str(e)}"
         )
+
+
+async def _run_live_search(websocket: WebSocket, send_lock: asyncio.Lock, search: LiveSearchQuery) -> None:
+    # Cancelled by the next query from the client while debouncing or waiting on Supabase. The receive loop takes the
+    # send lock before cancelling, so a send is never cut off halfway
+    await asyncio.sleep(LIVE_SEARCH_DEBOUNCE_SECONDS)
+    try:
+        results = await unified_search(search.query, search.entity_types, search.limit)
+        if search.hydrate == SearchHydration.SUMMARY:
+            results = await hydrate_summaries(results)
+        message = {
+            "query": search.query,
+            "results": [result.model_dump(mode="json", exclude_none=True) for result in results],
+        }
+    except APIError as e:
+        message = {"query": search.query, "error": f"Failed to search across entities: {str(e)}"}
+
+    async with send_lock:
+        await websocket.send_json(message)
+
+
+def _log_live_search_failure(task: asyncio.Task) -> None:
+    # Retrieve unexpected errors of finished searches, which nothing else awaits
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Live search failed", exc_info=task.exception())
+
+
+# Live Search
+@router.websocket("/live")
+async def live_search(websocket: WebSocket):
+    """
+    Searches among all entities as the client types. The client sends each query as a JSON object with the same
+    fields as unified search, and every new query cancels the previous one if its results haven't been sent yet.
+    """
+    await websocket.accept()
+    send_lock = asyncio.Lock()
+    search_task: Optional[asyncio.Task] = None
+    try:
+        while True:
+            message = await websocket.receive_text()
+            if search_task is not None:
+                # Wait for a send in progress to finish, so only the query or the wait for the lock is cancelled
+                async with send_lock:
+                    search_task.cancel()
+                search_task = None
+
+            try:
+                search = LiveSearchQuery.model_validate_json(message)
+            except ValidationError as e:
+                async with send_lock:
+                    await websocket.send_json(
+                        {"error": "Invalid search query", "details": e.errors(include_url=False, include_context=False)}
+                    )
+                continue
+
+            search_task = asyncio.create_task(_run_live_search(websocket, send_lock, search))
+            search_task.add_done_callback(_log_live_search_failure)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if search_task is not None:
+            search_task.cancel()
+            # Wait without raising, the done callback logs any error
+            await asyncio.wait([search_task])
@@ -0,0 +1,36 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from music_catalogue.crud.search import DEFAULT_SUGGESTIONS, MIN_SUGGEST_LENGTH, suggest
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.search import Suggestion
+
+router = APIRouter(prefix="/suggest", tags=["Unified Search"])
+
+
+# Typeahead Suggestions
+@router.get(
+    "/",
+    response_model=List[Suggestion],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def suggest_names(
+    q: str = Query(min_length=MIN_SUGGEST_LENGTH, max_length=50),
+    limit: int = Query(DEFAULT_SUGGESTIONS, ge=1, le=20),
+):
+    """
+    Suggests display names across all entities completing a partially typed query, matching every word of it as a
+    prefix.
+    """
+    try:
+        return await suggest(q, limit)
+    except TimeoutError:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Suggestions took too long")
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get suggestions: {str(e)}"
+        )
+    except:
+        raise
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from music_catalogue.crud import versions
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.versions import VersionGraph
+
+router = APIRouter(prefix="/versions", tags=["Versions"])
+
+
+@router.get(
+    "/{id}/lineage", response_model=VersionGraph, response_model_exclude_none=True, status_code=status.HTTP_200_OK
+)
+async def get_version_lineage(
+    id: str,
+    max_depth: int = Query(versions.DEFAULT_LINEAGE_DEPTH, ge=1, le=versions.MAX_LINEAGE_DEPTH),
+):
+    """
+    Gets the full derivation graph of a version, the versions it's based on and the ones based on it, as a flat list
+    of nodes and edges.
+    """
+    try:
+        lineage = await versions.get_lineage(id, max_depth)
+        if not lineage:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No version found with ID {str(id)}")
+        return lineage
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get version lineage: {str(e)}"
+        )
+    except:
+        raise
@@ -1,15 +1,40 @@
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from music_catalogue.crud import works
-from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.inputs.work_create import WorkCreate
-from music_catalogue.models.responses.works import Work
+from music_catalogue.crud import versions, works
+from music_catalogue.models.exceptions import APIError, IdempotencyKeyReuseError
+from music_catalogue.models.inputs.work_create import WorkCreate, WorkUpdate
+from music_catalogue.models.responses.batch import BatchResult, BulkItemResult
+from music_catalogue.models.responses.versions import VersionGraph
+from music_catalogue.models.responses.works import SimilarWork, Work
+from music_catalogue.models.types import BulkItemStatus, ResponseExpansion
+from music_catalogue.routers.params import batch_ids, idempotency_key
+from music_catalogue.utils import idempotency
 
 router = APIRouter(prefix="/works", tags=["Works"])
 
 
+# Declared before /{id} so "by-identifier" isn't taken for a work ID
+@router.get(
+    "/by-identifier", response_model=List[Work], response_model_exclude_none=True, status_code=status.HTTP_200_OK
+)
+async def get_works_by_identifier(
+    label: str = Query(min_length=1, max_length=50), value: str = Query(min_length=1, max_length=50)
+):
+    """
+    Gets the works with an exact catalogue identifier, such as `label=CNW&value=27`.
+    """
+    try:
+        return await works.get_by_identifier(label, value)
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get works by identifier: {str(e)}"
+        )
+    except:
+        raise
+
+
 @router.get("/{id}", response_model=Work, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
 async def get_work_by_id(id: str):
     """
@@ -28,13 +53,79 @@ async def get_work_by_id(id: str):
         raise
 
 
-@router.get("/", response_model=List[Work], response_model_exclude_none=True, status_code=status.HTTP_200_OK)
-async def search_works(query: str = Query(min_length=2, max_length=50)):
+@router.get(
+    "/{id}/version-tree",
+    response_model=VersionGraph,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_work_version_tree(
+    id: str,
+    max_depth: int = Query(versions.DEFAULT_LINEAGE_DEPTH, ge=1, le=versions.MAX_LINEAGE_DEPTH),
+):
+    """
+    Gets every version of a work and the versions derived from them as a flat list of nodes and edges.
+    """
+    try:
+        tree = await versions.get_work_tree(id, max_depth)
+        if tree is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No work found with ID {str(id)}")
+        return tree
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get work version tree: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/{id}/similar",
+    response_model=List[SimilarWork],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def get_similar_works(id: str, limit: int = Query(works.MAX_SIMILAR_WORKS, ge=1, le=works.MAX_SIMILAR_WORKS)):
+    """
+    Gets the works most similar to a work by title, themes, genres and metadata.
+    """
+    try:
+        return await works.get_similar(id, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get similar works: {str(e)}"
+        )
+    except:
+        raise
+
+
+@router.get(
+    "/",
+    response_model=Union[List[Work], BatchResult[Work]],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+)
+async def search_works(
+    query: Optional[str] = Query(None, min_length=2, max_length=50),
+    ids: List[str] = Depends(batch_ids),
+):
     """
-    Searches for works based on a query string.
+    Searches for works based on a query string, or fetches a batch of works by ID when `ids` is given.
     """
     try:
+        if ids:
+            return await works.get_by_ids(ids)
+        if not query:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Either a query or a list of IDs is required"
+            )
         return await works.search(query)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to search for work: {str(e)}"
@@ -43,16 +134,76 @@ async def search_works(query: str = Query(min_length=2, max_length=50)):
         raise
 
 
+@router.patch("/{id}", response_model=Work, response_model_exclude_none=True, status_code=status.HTTP_200_OK)
+async def update_work(id: str, work_data: WorkUpdate):
+    """
+    Updates only the fields given for a work, returning the updated work.
+    """
+    try:
+        work = await works.update(id, work_data)
+        if not work:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No work found with ID {str(id)}")
+        return work
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except APIError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update work: {str(e)}"
+        )
+    except:
+        raise
+
+
 @router.post("/", response_model=Work, response_model_exclude_none=True, status_code=status.HTTP_201_CREATED)
-async def create_work(work_data: WorkCreate):
+async def create_work(
+    work_data: WorkCreate,
+    expand: Optional[ResponseExpansion] = Query(None),
+    key: Optional[str] = Depends(idempotency_key),
+):
     """
-    Creates a new work with nested relationships
+    Creates a new work with nested relationships. With `expand=full`, the work is read back after creation to include
+    complete information. Retries with the same `Idempotency-Key` return the original work.
     """
     try:
-        return await works.create(work_data)
+        full = expand == ResponseExpansion.FULL
+        return await idempotency.run(key, "POST /works", (work_data, full), lambda: works.create(work_data, full=full))
+    except IdempotencyKeyReuseError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except APIError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create work: {str(e)}"
         )
     except:
         raise
+
+
+@router.post(
+    "/bulk",
+    response_model=List[BulkItemResult[Work]],
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_works(
+    works_data: List[WorkCreate],
+    response: Response,
+    chunk_size: int = Query(works.BULK_CHUNK_SIZE, ge=1, le=1000),
+    key: Optional[str] = Depends(idempotency_key),
+):
+    """
+    Bulk creates a list of works with nested relationships, creating each chunk of works in a single transaction.
+    Returns the outcome for each work, with a 207 status if any of them failed. Retries with the same
+    `Idempotency-Key` return the original outcomes.
+    """
+    try:
+        results = await idempotency.run(
+            key, "POST /works/bulk", (works_data, chunk_size), lambda: works.create_many(works_data, chunk_size)
+        )
+        if any(result.status == BulkItemStatus.FAILED for result in results):
+            response.status_code = status.HTTP_207_MULTI_STATUS
+        return results
+    except IdempotencyKeyReuseError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except:
+        raise
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Awaitable, Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Split a sequence into consecutive chunks
+
+    Args:
+        items (Sequence[T]): The items to split
+        size (int): The maximum number of items per chunk
+
+    Yields:
+        Sequence[T]: Each chunk, in order
+    """
+    if size < 1:
+        raise ValueError(f"Invalid chunk size {size}: must be at least 1")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def gather_bounded(awaitables: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """
+    Await several awaitables concurrently, running at most `limit` of them at a time
+
+    Args:
+        awaitables (Iterable[Awaitable[T]]): The awaitables to run
+        limit (int): The maximum number running concurrently
+
+    Returns:
+        List[T]: The results, in the same order as the awaitables given
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(run(awaitable) for awaitable in awaitables)))
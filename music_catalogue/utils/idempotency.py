@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from pydantic_core import to_json
+
+from music_catalogue.models.exceptions import IdempotencyKeyReuseError
+
+T = TypeVar("T")
+
+# How long a completed response can be replayed for the same idempotency key
+IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+# Maximum number of idempotency keys kept in memory, oldest completed ones are evicted first
+IDEMPOTENCY_MAX_KEYS = 10_000
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    future: asyncio.Future
+    # None while the operation is still in flight
+    expires_at: Optional[float] = None
+
+
+_entries: Dict[str, _Entry] = {}
+
+
+def _fingerprint(payload: Any) -> str:
+    return hashlib.sha256(to_json(payload)).hexdigest()
+
+
+def _evict() -> None:
+    now = time.monotonic()
+    for storage_key in [key for key, entry in _entries.items() if entry.expires_at and entry.expires_at <= now]:
+        del _entries[storage_key]
+
+    # Dicts keep insertion order, so the first completed entries are the oldest
+    completed = [key for key, entry in _entries.items() if entry.expires_at]
+    for storage_key in completed[: max(0, len(_entries) - IDEMPOTENCY_MAX_KEYS)]:
+        del _entries[storage_key]
+
+
+def clear() -> None:
+    """
+    Forget every stored idempotency key
+    """
+    _entries.clear()
+
+
+async def run(key: Optional[str], scope: str, payload: Any, operation: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run a write operation at most once per idempotency key. Replays of a completed key return the stored result, and
+    concurrent duplicates wait on the request already in flight. Failed operations aren't stored, so they can be
+    retried with the same key
+
+    Args:
+        key (Optional[str]): The idempotency key sent by the client. Without one the operation always runs
+        scope (str): The endpoint the key belongs to, so the same key can be used on different endpoints
+        payload (Any): The request data the key is bound to
+        operation (Callable[[], Awaitable[T]]): Runs the write operation
+
+    Returns:
+        T: The result of the operation, stored or new
+
+    Raises:
+        IdempotencyKeyReuseError: If the key was already used with a different payload
+    """
+    if not key:
+        return await operation()
+
+    _evict()
+
+    storage_key = f"{scope}:{key}"
+    fingerprint = _fingerprint(payload)
+
+    entry = _entries.get(storage_key)
+    if entry:
+        if entry.fingerprint != fingerprint:
+            raise IdempotencyKeyReuseError(f"Idempotency key {key} was already used with a different request")
+        if entry.future.done():
+            return entry.future.result()
+        # Shield the stored future so a cancelled replay doesn't cancel it for every other caller
+        return await asyncio.shield(entry.future)
+
+    future = asyncio.get_running_loop().create_future()
+    # Mark the exception as retrieved in case no duplicate ever waits on this request
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _entries[storage_key] = _Entry(fingerprint=fingerprint, future=future)
+
+    try:
+        result = await operation()
+    except BaseException as e:
+        _entries.pop(storage_key, None)
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+        raise
+
+    future.set_result(result)
+    _entries[storage_key].expires_at = time.monotonic() + IDEMPOTENCY_TTL_SECONDS
+
+    return result
@@ -0,0 +1,98 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, Tuple
+
+from music_catalogue.models.validation import validate_uuid
+
+# Default number of items in a keyset page
+DEFAULT_PAGE_SIZE = 50
+# Maximum number of items a request can ask for in a keyset page
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    Encode the sort key of the last item of a page as an opaque cursor for the next page
+
+    Args:
+        position (Dict[str, Any]): The JSON-serializable sort key values of the last item
+
+    Returns:
+        str: The URL-safe cursor
+    """
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor made by `encode_cursor` back into the sort key values it holds
+
+    Args:
+        cursor (str): The cursor sent by the client
+
+    Returns:
+        Dict[str, Any]: The sort key values of the last item of the previous page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor {cursor}") from None
+
+    if not isinstance(position, dict):
+        raise ValueError(f"Invalid cursor {cursor}")
+
+    return position
+
+
+def encode_year_cursor(sort_year: int, id: str) -> str:
+    """
+    Encode the position of the last item of a page ordered by (year, UUID) as a cursor
+
+    Args:
+        sort_year (int): The year the last item was sorted by
+        id (str): The UUID of the last item
+
+    Returns:
+        str: The URL-safe cursor
+    """
+    return encode_cursor({"year": sort_year, "id": id})
+
+
+def decode_year_cursor(cursor: str) -> Tuple[int, str]:
+    """
+    Decode a cursor made by `encode_year_cursor`
+
+    Args:
+        cursor (str): The cursor sent by the client
+
+    Returns:
+        Tuple[int, str]: The sort year and UUID of the last item of the previous page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    position = decode_cursor(cursor)
+    sort_year, id = position.get("year"), position.get("id")
+    if not isinstance(sort_year, int) or not isinstance(id, str):
+        raise ValueError(f"Invalid cursor {cursor}")
+    validate_uuid(id)
+
+    return sort_year, id
+
+
+def validate_page_size(page_size: int) -> None:
+    """
+    Check if a page size is within the allowed range
+
+    Args:
+        page_size (int): The number of items requested
+
+    Raises:
+        ValidationError: If the page size is invalid
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"Invalid page size {page_size}: must be between 1 and {MAX_PAGE_SIZE}")
@@ -0,0 +1,263 @@
+# Sparse matrix helpers for the batch jobs in scripts/. Requires the optional analytics dependency group
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def index_values(values: Iterable[str]) -> Dict[str, int]:
+    """
+    Assign consecutive matrix indexes to values, in order of first appearance
+
+    Args:
+        values (Iterable[str]): The values to index, possibly repeated
+
+    Returns:
+        Dict[str, int]: The index of each distinct value
+    """
+    index: Dict[str, int] = {}
+    for value in values:
+        index.setdefault(value, len(index))
+    return index
+
+
+def incidence_matrix(pairs: Iterable[Tuple[str, str]], row_index: Dict[str, int]) -> sparse.csr_matrix:
+    """
+    Build a binary sparse matrix with a row per indexed value and a column per distinct value it's paired with
+
+    Args:
+        pairs (Iterable[Tuple[str, str]]): (row value, column value) pairs. Pairs with unindexed row values are skipped
+            and repeated pairs count once
+        row_index (Dict[str, int]): The matrix row of each row value
+
+    Returns:
+        sparse.csr_matrix: The incidence matrix, with as many rows as row_index
+    """
+    col_index: Dict[str, int] = {}
+    rows, cols = [], []
+    for row_value, col_value in pairs:
+        if row_value not in row_index:
+            continue
+        rows.append(row_index[row_value])
+        cols.append(col_index.setdefault(col_value, len(col_index)))
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(len(row_index), len(col_index))
+    )
+    # Duplicate pairs are summed when building the matrix
+    matrix.data[:] = 1
+    return matrix
+
+
+def one_hot_matrix(values: List[Iterable[str]]) -> sparse.csr_matrix:
+    """
+    Build a binary feature matrix with a row per item and a column per distinct value any item has
+
+    Args:
+        values (List[Iterable[str]]): The values of each item, such as its genres or its language alone
+
+    Returns:
+        sparse.csr_matrix: The item by value matrix
+    """
+    value_index: Dict[str, int] = {}
+    rows, cols = [], []
+    for row, item_values in enumerate(values):
+        for value in set(item_values):
+            rows.append(row)
+            cols.append(value_index.setdefault(value, len(value_index)))
+
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(len(values), len(value_index))
+    )
+
+
+def tfidf_matrix(documents: List[List[str]]) -> sparse.csr_matrix:
+    """
+    Build a TF-IDF weighted term matrix with a row per document, using smoothed inverse document frequencies
+
+    Args:
+        documents (List[List[str]]): The tokens of each document
+
+    Returns:
+        sparse.csr_matrix: The document by term matrix
+    """
+    term_index: Dict[str, int] = {}
+    rows, cols = [], []
+    for row, tokens in enumerate(documents):
+        for token in tokens:
+            rows.append(row)
+            cols.append(term_index.setdefault(token, len(term_index)))
+
+    # Repeated terms in a document are summed into their count
+    counts = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(len(documents), len(term_index))
+    )
+    document_frequency = np.bincount(counts.indices, minlength=len(term_index))
+    idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+    return (counts @ sparse.diags(idf.astype(np.float32))).tocsr()
+
+
+def normalize_rows(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    Scale every row of a sparse matrix to unit L2 norm, so dot products between rows are cosine similarities
+
+    Args:
+        matrix (sparse.csr_matrix): The matrix to normalize. Empty rows are left empty
+
+    Returns:
+        sparse.csr_matrix: The normalized matrix
+    """
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return (sparse.diags(1 / norms) @ matrix).tocsr()
+
+
+def cooccurrence(incidence: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    Count the columns each pair of rows of an incidence matrix share
+
+    Args:
+        incidence (sparse.csr_matrix): A binary row by column incidence matrix
+
+    Returns:
+        sparse.csr_matrix: A square row by row matrix of shared column counts, without the diagonal
+    """
+    counts = (incidence @ incidence.T).tocsr()
+    counts.setdiag(0)
+    counts.eliminate_zeros()
+    return counts
+
+
+def top_k_per_row(matrix: sparse.csr_matrix, k: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Find the k highest scoring columns of each row of a sparse matrix
+
+    Args:
+        matrix (sparse.csr_matrix): The scores, with zero meaning no relation
+        k (int): The maximum number of columns kept per row
+
+    Yields:
+        Tuple[int, np.ndarray, np.ndarray]: The row, and the columns and scores of its top entries from highest to
+            lowest score, for every row with at least one entry. Ties are broken by lowest column
+    """
+    if k < 1:
+        raise ValueError(f"Invalid k {k}: must be at least 1")
+
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        if start == end:
+            continue
+        cols, scores = matrix.indices[start:end], matrix.data[start:end]
+        if len(scores) > k:
+            # Keep every entry tied with the k-th score, so ties are broken deterministically below
+            threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+            keep = scores >= threshold
+            cols, scores = cols[keep], scores[keep]
+        order = np.lexsort((cols, -scores))[:k]
+        yield row, cols[order], scores[order]
+
+
+def blocked_top_k(
+    queries: sparse.csr_matrix,
+    candidates: sparse.csr_matrix,
+    k: int,
+    block_size: int = 1024,
+    self_columns: Optional[np.ndarray] = None,
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Find the k candidates with the highest dot product for each query, multiplying one block of queries at a time so
+    the full query by candidate matrix is never held in memory
+
+    Args:
+        queries (sparse.csr_matrix): The query feature rows
+        candidates (sparse.csr_matrix): The candidate feature rows, with the same columns as the queries
+        k (int): The maximum number of candidates kept per query
+        block_size (int, optional): The number of queries multiplied at once
+        self_columns (np.ndarray, optional): The candidate row of each query, excluded from its results
+
+    Yields:
+        Tuple[int, np.ndarray, np.ndarray]: The query row, and the candidate rows and scores of its top candidates from
+            highest to lowest score, for every query with at least one non-zero score
+    """
+    if block_size < 1:
+        raise ValueError(f"Invalid block size {block_size}: must be at least 1")
+
+    candidates_t = candidates.T.tocsr()
+    for start in range(0, queries.shape[0], block_size):
+        scores = (queries[start : start + block_size] @ candidates_t).tocoo()
+        keep = scores.data > 0
+        if self_columns is not None:
+            keep &= scores.col != self_columns[start + scores.row]
+        block = sparse.csr_matrix((scores.data[keep], (scores.row[keep], scores.col[keep])), shape=scores.shape)
+        for row, cols, row_scores in top_k_per_row(block, k):
+            yield start + row, cols, row_scores
+
+
+def blocked_max(
+    queries: sparse.csr_matrix,
+    candidates: sparse.csr_matrix,
+    block_size: int = 1024,
+) -> np.ndarray:
+    """
+    Find the highest dot product of each query with any candidate, multiplying one block of queries at a time
+
+    Args:
+        queries (sparse.csr_matrix): The query feature rows, with non-negative values
+        candidates (sparse.csr_matrix): The candidate feature rows, with the same columns as the queries
+        block_size (int, optional): The number of queries multiplied at once
+
+    Returns:
+        np.ndarray: The highest score of each query, 0 when it shares no feature with any candidate
+    """
+    if block_size < 1:
+        raise ValueError(f"Invalid block size {block_size}: must be at least 1")
+
+    best = np.zeros(queries.shape[0])
+    candidates_t = candidates.T.tocsr()
+    for start in range(0, queries.shape[0], block_size):
+        scores = (queries[start : start + block_size] @ candidates_t).tocoo()
+        np.maximum.at(best, start + scores.row, scores.data)
+
+    return best
+
+
+def block_pairs(blocks: Iterable[List[int]], max_block_size: int) -> np.ndarray:
+    """
+    Get the distinct pairs of rows that share at least one block, so only likely matches are compared instead of every
+    pair of rows
+
+    Args:
+        blocks (Iterable[List[int]]): The rows in each block
+        max_block_size (int): Blocks with more rows than this are skipped, as keys that common don't tell rows apart
+            and would make the number of pairs quadratic
+
+    Returns:
+        np.ndarray: An (n, 2) array of row pairs, the lower row first, sorted
+    """
+    pairs = []
+    for rows in blocks:
+        rows = np.unique(rows)
+        if len(rows) < 2 or len(rows) > max_block_size:
+            continue
+        left, right = np.triu_indices(len(rows), k=1)
+        pairs.append(np.column_stack((rows[left], rows[right])))
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def pair_cosine(matrix: sparse.csr_matrix, pairs: np.ndarray) -> np.ndarray:
+    """
+    Compute the dot product of many pairs of rows at once
+
+    Args:
+        matrix (sparse.csr_matrix): The feature rows, normalized for cosine similarities
+        pairs (np.ndarray): An (n, 2) array of row pairs
+
+    Returns:
+        np.ndarray: The score of each pair
+    """
+    if not len(pairs):
+        return np.empty(0, dtype=np.float32)
+    return np.asarray(matrix[pairs[:, 0]].multiply(matrix[pairs[:, 1]]).sum(axis=1)).ravel()
@@ -169,19 +169,13 @@ def transform_mei(source: str) -> Dict[str, Any]:
 
 
 async def add_to_database(extracted_data: ExtractedWorkData) -> Work:
-    # Check if there's already people with those legal names in the database
-    credits = []
-    for contributor in extracted_data.get("contributors", []):
-        possible_matches = await persons.search(contributor["name"])
-        # If nothing found, create new person
-        if not possible_matches:
-            person = await persons.create(PersonCreate(legal_name=contributor["name"]))
-        # If there's matches, assume it's the first one
-        else:
-            person = possible_matches[0]
-        credits.append(
-            WorkCreditCreate(person_id=person.id, role=contributor["role"], is_primary=contributor["is_primary"])
-        )
+    # Resolve every contributor to a person by normalized legal name, creating the ones missing, in one round trip
+    contributors = extracted_data.get("contributors") or []
+    people = await persons.upsert_many([PersonCreate(legal_name=contributor["name"]) for contributor in contributors])
+    credits = [
+        WorkCreditCreate(person_id=person.id, role=contributor["role"], is_primary=contributor["is_primary"])
+        for contributor, person in zip(contributors, people)
+    ]
 
     return await works.create(
         WorkCreate(
@@ -0,0 +1,96 @@
+"""Rank related artists by shared works, versions and members, and store the top ones for every artist."""
+
+import argparse
+import asyncio
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from music_catalogue.crud import analytics
+from music_catalogue.utils.similarity import cooccurrence, incidence_matrix, index_values, top_k_per_row
+
+# Number of related artists stored per artist
+DEFAULT_TOP_K = 20
+# How much a shared member counts compared to a shared work or version
+DEFAULT_MEMBER_WEIGHT = 2.0
+
+
+def compute_related(
+    artist_ids: List[str],
+    credits: List[Dict],
+    artist_persons: List[Tuple[str, str]],
+    top_k: int = DEFAULT_TOP_K,
+    member_weight: float = DEFAULT_MEMBER_WEIGHT,
+) -> Dict[str, List[Dict]]:
+    artist_index = index_values(artist_ids)
+
+    # One artist by work, artist by version and artist by person incidence matrix over the whole catalogue, and the
+    # number of columns every pair of artists shares in each
+    shared_works = cooccurrence(
+        incidence_matrix(((row["artist_id"], row["work_id"]) for row in credits if row.get("work_id")), artist_index)
+    )
+    shared_versions = cooccurrence(
+        incidence_matrix(
+            ((row["artist_id"], row["version_id"]) for row in credits if row.get("version_id")), artist_index
+        )
+    )
+    shared_members = cooccurrence(incidence_matrix(artist_persons, artist_index))
+
+    scores = (shared_works + shared_versions + member_weight * shared_members).tocsr()
+    top = list(top_k_per_row(scores, top_k))
+    if not top:
+        return {}
+
+    # Look up the shared counts of every kept pair at once instead of one element at a time
+    rows = np.concatenate([np.full(len(cols), row) for row, cols, _ in top])
+    cols = np.concatenate([cols for _, cols, _ in top])
+    works_counts, versions_counts, members_counts = (
+        np.asarray(matrix[rows, cols]).ravel() for matrix in (shared_works, shared_versions, shared_members)
+    )
+
+    related_by_artist: Dict[str, List[Dict]] = {}
+    position = 0
+    for row, row_cols, row_scores in top:
+        related = related_by_artist[artist_ids[row]] = []
+        for rank, (col, score) in enumerate(zip(row_cols, row_scores), start=1):
+            related.append(
+                {
+                    "artist_id": artist_ids[row],
+                    "related_artist_id": artist_ids[col],
+                    "rank": rank,
+                    "score": float(score),
+                    "shared_works": int(works_counts[position]),
+                    "shared_versions": int(versions_counts[position]),
+                    "shared_members": int(members_counts[position]),
+                }
+            )
+            position += 1
+
+    return related_by_artist
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compute and store the related artists of every artist")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help="Number of related artists per artist")
+    parser.add_argument("--member-weight", type=float, default=DEFAULT_MEMBER_WEIGHT, help="Weight of a shared member")
+    parser.add_argument("--dry-run", action="store_true", help="Compute without saving the results")
+    args = parser.parse_args()
+
+    print("Loading credits and members..")
+    artist_ids, credits, artist_persons = await asyncio.gather(
+        analytics.get_artist_ids(), analytics.get_artist_credits(), analytics.get_artist_persons()
+    )
+    # Keep the artist list unique, it indexes the matrix rows
+    artist_ids = list(index_values(artist_ids))
+
+    related_by_artist = compute_related(artist_ids, credits, artist_persons, args.top_k, args.member_weight)
+    print(f"Found related artists for {len(related_by_artist)} of {len(artist_ids)} artists")
+
+    if not args.dry_run:
+        print("\nSaving to Database...")
+        await analytics.replace_related_artists(artist_ids, related_by_artist)
+        print("Related artists saved")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
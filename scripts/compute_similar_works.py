@@ -0,0 +1,173 @@
+"""Find the most similar works to every work by title, themes, genres and metadata, and store them."""
+
+import argparse
+import asyncio
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from music_catalogue.crud import analytics
+from music_catalogue.utils.similarity import blocked_max, blocked_top_k, normalize_rows, one_hot_matrix, tfidf_matrix
+
+# Number of similar works stored per work
+DEFAULT_TOP_K = 20
+# Number of works whose similarities are computed in each matrix product
+DEFAULT_BLOCK_SIZE = 1024
+# How much each feature group counts towards the similarity of two works
+FEATURE_WEIGHTS = {
+    "title": 1.0,
+    "themes": 1.0,
+    "genres": 1.5,
+    "language": 0.5,
+    "sentiment": 0.5,
+    "decade": 0.5,
+}
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    # Match accented and unaccented spellings of the same word
+    text = "".join(c for c in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.combining(c))
+    return [token for token in re.findall(r"\w+", text) if len(token) > 1]
+
+
+def _themes(themes) -> List[str]:
+    if not isinstance(themes, list):
+        return []
+    return [theme.strip().lower() for theme in themes if isinstance(theme, str) and theme.strip()]
+
+
+def work_features(works: List[Dict], work_genres: List[Dict]) -> sparse.csr_matrix:
+    genres_by_work = defaultdict(list)
+    for row in work_genres:
+        genres_by_work[row["work_id"]].append(row["genre_id"])
+
+    groups = {
+        "title": tfidf_matrix([_tokens(work.get("title")) for work in works]),
+        "themes": one_hot_matrix([_themes(work.get("themes")) for work in works]),
+        "genres": one_hot_matrix([genres_by_work[work["work_id"]] for work in works]),
+        "language": one_hot_matrix([[work["language"]] if work.get("language") else [] for work in works]),
+        "sentiment": one_hot_matrix([[work["sentiment"].lower()] if work.get("sentiment") else [] for work in works]),
+        "decade": one_hot_matrix(
+            [[str(work["origin_year_start"] // 10 * 10)] if work.get("origin_year_start") else [] for work in works]
+        ),
+    }
+
+    # Normalize each group so its weight doesn't depend on how many values it has, then the whole row so dot products
+    # are cosine similarities
+    return normalize_rows(
+        sparse.hstack(
+            [np.sqrt(FEATURE_WEIGHTS[name]) * normalize_rows(matrix) for name, matrix in groups.items()]
+        ).tocsr()
+    )
+
+
+def compute_similar(
+    works: List[Dict],
+    work_genres: List[Dict],
+    query_ids: Optional[List[str]] = None,
+    top_k: int = DEFAULT_TOP_K,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Dict[str, List[Dict]]:
+    work_ids = [work["work_id"] for work in works]
+    work_index = {work_id: row for row, work_id in enumerate(work_ids)}
+    features = work_features(works, work_genres)
+
+    # Only the queried works get new neighbours, but they're compared against every work
+    if query_ids is None:
+        query_rows = np.arange(len(work_ids))
+    else:
+        query_rows = np.array([work_index[work_id] for work_id in query_ids if work_id in work_index], dtype=np.int64)
+
+    similar_by_work: Dict[str, List[Dict]] = {}
+    for row, cols, scores in blocked_top_k(
+        features[query_rows], features, top_k, block_size=block_size, self_columns=query_rows
+    ):
+        work_id = work_ids[query_rows[row]]
+        similar_by_work[work_id] = [
+            {"work_id": work_id, "similar_work_id": work_ids[col], "rank": rank, "score": float(score)}
+            for rank, (col, score) in enumerate(zip(cols, scores), start=1)
+        ]
+
+    return similar_by_work
+
+
+def works_entered_by(
+    works: List[Dict],
+    work_genres: List[Dict],
+    changed_ids: List[str],
+    floors: Dict[str, Tuple[int, float]],
+    top_k: int = DEFAULT_TOP_K,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> List[str]:
+    """Works whose stored similar works a new or changed work would now be among, so they're recomputed too"""
+    work_ids = [work["work_id"] for work in works]
+    work_index = {work_id: row for row, work_id in enumerate(work_ids)}
+    changed_rows = np.array([work_index[work_id] for work_id in changed_ids if work_id in work_index], dtype=np.int64)
+    if not len(changed_rows):
+        return []
+
+    features = work_features(works, work_genres)
+    best = blocked_max(features, features[changed_rows], block_size)
+    # The changed works are recomputed anyway
+    best[changed_rows] = 0
+
+    entered = []
+    for row in np.flatnonzero(best > 0):
+        # Works with fewer similar works than the limit take any similar work, the others one scoring above their last
+        neighbour_count, min_score = floors.get(work_ids[row], (0, 0.0))
+        if neighbour_count < top_k or best[row] >= min_score:
+            entered.append(work_ids[row])
+
+    return entered
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compute and store the similar works of every work")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help="Number of similar works per work")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE, help="Works compared per block")
+    parser.add_argument(
+        "--only-missing",
+        action="store_true",
+        help="Only compute works without computed similar works, such as new ones, and the works they affect",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Compute without saving the results")
+    args = parser.parse_args()
+
+    print("Loading works..")
+    works, work_genres = await analytics.get_work_features()
+    query_ids = None
+    if args.only_missing:
+        changed_ids = await analytics.get_works_without_similarities()
+        if not changed_ids:
+            print("Every work already has similar works")
+            return
+
+        # Keep the stored lists consistent: recompute the works listing a changed work, and those a new or changed
+        # work now ranks among the top similar works of
+        floors, listing_ids = await asyncio.gather(
+            analytics.get_work_similarity_floors(), analytics.get_works_listing(changed_ids)
+        )
+        entered_ids = works_entered_by(works, work_genres, changed_ids, floors, args.top_k, args.block_size)
+        query_ids = list(dict.fromkeys([*changed_ids, *listing_ids, *entered_ids]))
+        print(
+            f"Recomputing {len(changed_ids)} new or changed works and {len(query_ids) - len(changed_ids)} affected works"
+        )
+
+    similar_by_work = compute_similar(works, work_genres, query_ids, args.top_k, args.block_size)
+    replaced_ids = query_ids if query_ids is not None else [work["work_id"] for work in works]
+    print(f"Found similar works for {len(similar_by_work)} of {len(replaced_ids)} works")
+
+    if not args.dry_run:
+        print("\nSaving to Database...")
+        await analytics.replace_work_similarities(replaced_ids, similar_by_work)
+        print("Similar works saved")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
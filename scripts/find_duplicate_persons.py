@@ -0,0 +1,144 @@
+"""Find persons that are likely duplicates of each other and output suggestions of which ones to merge."""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from music_catalogue.crud import analytics
+from music_catalogue.utils.similarity import block_pairs, normalize_rows, one_hot_matrix, pair_cosine
+
+# Minimum score for a pair of persons to be suggested as duplicates
+DEFAULT_MIN_SCORE = 0.85
+# Blocks with more persons than this are skipped, so a common name part doesn't make the comparisons quadratic
+MAX_BLOCK_SIZE = 200
+# Name parts shorter than this don't make a block on their own
+MIN_BLOCK_TOKEN_LENGTH = 3
+# Added to the name similarity for each life date both persons have in the same year
+DATE_MATCH_BONUS = 0.1
+# Subtracted from the name similarity for each life date both persons have in different years
+DATE_MISMATCH_PENALTY = 0.5
+
+
+def _name_tokens(name: Optional[str]) -> List[str]:
+    if not name:
+        return []
+    # Like normalize_name in the database, so names differing only in accents, case or spacing match
+    name = "".join(c for c in unicodedata.normalize("NFKD", name.lower()) if not unicodedata.combining(c))
+    return re.findall(r"\w+", name)
+
+
+def _name_key(name: Optional[str]) -> str:
+    # Sorting the name parts matches "Nielsen, Carl" with "Carl Nielsen"
+    return " ".join(sorted(_name_tokens(name)))
+
+
+def _trigrams(key: str) -> List[str]:
+    padded = f" {key} "
+    return [padded[i : i + 3] for i in range(len(padded) - 2)]
+
+
+def _year(date: Optional[str]) -> float:
+    return float(date[:4]) if date else np.nan
+
+
+def _date_adjustment(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    both = ~np.isnan(left) & ~np.isnan(right)
+    return np.where(both & (left == right), DATE_MATCH_BONUS, 0) - np.where(
+        both & (left != right), DATE_MISMATCH_PENALTY, 0
+    )
+
+
+def _completeness(person: Dict) -> int:
+    return sum(1 for field in ("birth_date", "death_date", "alternative_names") if person.get(field))
+
+
+def find_duplicates(
+    persons: List[Dict], min_score: float = DEFAULT_MIN_SCORE, max_block_size: int = MAX_BLOCK_SIZE
+) -> List[Dict]:
+    names = [
+        [person.get("legal_name")] + [name for name in person.get("alternative_names") or [] if isinstance(name, str)]
+        for person in persons
+    ]
+    legal_keys = [_name_key(person.get("legal_name")) for person in persons]
+
+    # Block persons by every full name key they go by and by each of their longer name parts, and only compare persons
+    # sharing a block
+    blocks = defaultdict(list)
+    name_keys: List[set] = []
+    for row, person_names in enumerate(names):
+        keys = {_name_key(name) for name in person_names} - {""}
+        name_keys.append(keys)
+        for key in keys:
+            blocks[f"key:{key}"].append(row)
+            for token in key.split():
+                if len(token) >= MIN_BLOCK_TOKEN_LENGTH:
+                    blocks[f"token:{token}"].append(row)
+
+    pairs = block_pairs(blocks.values(), max_block_size)
+    if not len(pairs):
+        return []
+
+    # Character trigram cosine of the sorted legal names, or an exact match through any of the names
+    name_scores = pair_cosine(normalize_rows(one_hot_matrix([_trigrams(key) for key in legal_keys])), pairs)
+    shared_key = np.fromiter(
+        (bool(name_keys[left] & name_keys[right]) for left, right in pairs), dtype=bool, count=len(pairs)
+    )
+    name_scores = np.where(shared_key, 1.0, name_scores)
+
+    birth_years = np.array([_year(person.get("birth_date")) for person in persons])
+    death_years = np.array([_year(person.get("death_date")) for person in persons])
+    scores = np.clip(
+        name_scores
+        + _date_adjustment(birth_years[pairs[:, 0]], birth_years[pairs[:, 1]])
+        + _date_adjustment(death_years[pairs[:, 0]], death_years[pairs[:, 1]]),
+        0,
+        1,
+    )
+
+    suggestions = []
+    for (left, right), score in zip(pairs[scores >= min_score], scores[scores >= min_score]):
+        # Suggest keeping the person with the most data
+        keep, duplicate = (
+            (left, right) if _completeness(persons[left]) >= _completeness(persons[right]) else (right, left)
+        )
+        suggestions.append(
+            {
+                "person_id": persons[keep]["person_id"],
+                "duplicate_person_id": persons[duplicate]["person_id"],
+                "score": round(float(score), 4),
+                "legal_names": [persons[keep].get("legal_name"), persons[duplicate].get("legal_name")],
+            }
+        )
+
+    return sorted(suggestions, key=lambda suggestion: -suggestion["score"])
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Suggest persons to merge as likely duplicates")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE, help="Minimum score of a suggestion")
+    parser.add_argument("--output", help="File to write the suggestions to as JSON lines, instead of stdout")
+    args = parser.parse_args()
+
+    print("Loading persons..", file=sys.stderr)
+    persons = await analytics.get_persons()
+    suggestions = find_duplicates(persons, args.min_score)
+    print(f"Found {len(suggestions)} likely duplicates among {len(persons)} persons", file=sys.stderr)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for suggestion in suggestions:
+            output.write(json.dumps(suggestion, ensure_ascii=False) + "\n")
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,169 @@
+-- Migration: 20261019120000_create_work_function.sql
+-- Create a work and all of its nested relationships in a single transaction
+
+create or replace function create_work(payload jsonb, added_by uuid)
+returns jsonb
+language plpgsql
+as $$
+declare
+    new_work_id uuid;
+begin
+    insert into works (
+        title,
+        language,
+        titles,
+        description,
+        identifiers,
+        origin_year_start,
+        origin_year_end,
+        origin_country,
+        themes,
+        sentiment,
+        notes
+    )
+    select
+        w.title,
+        w.language,
+        w.titles,
+        w.description,
+        w.identifiers,
+        w.origin_year_start,
+        w.origin_year_end,
+        w.origin_country,
+        w.themes,
+        w.sentiment,
+        w.notes
+    from jsonb_populate_record(null::works, payload) w
+    returning work_id into new_work_id;
+
+    insert into versions (
+        work_id,
+        title,
+        version_type,
+        primary_artist_id,
+        release_date,
+        release_year,
+        duration_seconds,
+        bpm,
+        key_signature,
+        lyrics_reference,
+        completeness_level,
+        notes
+    )
+    select
+        new_work_id,
+        v.title,
+        coalesce(v.version_type, 'original'),
+        v.primary_artist_id,
+        v.release_date,
+        v.release_year,
+        v.duration_seconds,
+        v.bpm,
+        v.key_signature,
+        v.lyrics_reference,
+        coalesce(v.completeness_level, 'complete'),
+        v.notes
+    from jsonb_populate_recordset(null::versions, coalesce(payload->'versions', '[]'::jsonb)) v;
+
+    insert into credits (
+        work_id,
+        artist_id,
+        person_id,
+        role,
+        is_primary,
+        credit_order,
+        instruments,
+        notes
+    )
+    select
+        new_work_id,
+        c.artist_id,
+        c.person_id,
+        c.role,
+        coalesce(c.is_primary, false),
+        c.credit_order,
+        c.instruments,
+        c.notes
+    from jsonb_populate_recordset(null::credits, coalesce(payload->'credits', '[]'::jsonb)) c;
+
+    insert into work_genres (work_id, genre_id)
+    select new_work_id, genre_id::uuid
+    from jsonb_array_elements_text(coalesce(payload->'genre_ids', '[]'::jsonb)) genre_id;
+
+    insert into external_links (entity_type, entity_id, label, url, source_verified, added_by)
+    select
+        'work'::public.entity_type,
+        new_work_id,
+        l.label,
+        l.url,
+        coalesce(l.source_verified, false),
+        create_work.added_by
+    from jsonb_populate_recordset(null::external_links, coalesce(payload->'external_links', '[]'::jsonb)) l;
+
+    -- Return the work in the same shape as the detail select used by the API
+    return (
+        select
+            to_jsonb(w) - 'search_vector'
+            || jsonb_build_object(
+                'versions', coalesce((
+                    select jsonb_agg(
+                        jsonb_build_object(
+                            'version_id', v.version_id,
+                            'title', v.title,
+                            'version_type', v.version_type,
+                            'primary_artist', jsonb_build_object(
+                                'artist_id', a.artist_id,
+                                'artist_type', a.artist_type,
+                                'display_name', a.display_name
+                            ),
+                            'release_year', v.release_year,
+                            'completeness_level', v.completeness_level
+                        )
+                    )
+                    from versions v
+                    left join artists a on a.artist_id = v.primary_artist_id
+                    where v.work_id = new_work_id
+                ), '[]'::jsonb),
+                'work_genres', coalesce((
+                    select jsonb_agg(jsonb_build_object('genre_id', wg.genre_id))
+                    from work_genres wg
+                    where wg.work_id = new_work_id
+                ), '[]'::jsonb),
+                'credits', coalesce((
+                    select jsonb_agg(
+                        jsonb_build_object(
+                            'credit_id', c.credit_id,
+                            'artist', case when a.artist_id is null then null else jsonb_build_object(
+                                'artist_id', a.artist_id,
+                                'artist_type', a.artist_type,
+                                'display_name', a.display_name
+                            ) end,
+                            'person', case when p.person_id is null then null else jsonb_build_object(
+                                'person_id', p.person_id,
+                                'legal_name', p.legal_name
+                            ) end,
+                            'role', c.role,
+                            'is_primary', c.is_primary,
+                            'credit_order', c.credit_order,
+                            'instruments', c.instruments,
+                            'notes', c.notes
+                        )
+                    )
+                    from credits c
+                    left join artists a on a.artist_id = c.artist_id
+                    left join persons p on p.person_id = c.person_id
+                    where c.work_id = new_work_id
+                ), '[]'::jsonb),
+                'external_links', coalesce((
+                    select jsonb_agg(
+                        jsonb_build_object('label', l.label, 'url', l.url, 'source_verified', l.source_verified)
+                    )
+                    from external_links l
+                    where l.entity_type = 'work' and l.entity_id = new_work_id
+                ), '[]'::jsonb)
+            )
+        from works w
+        where w.work_id = new_work_id
+    );
+end;
+$$;
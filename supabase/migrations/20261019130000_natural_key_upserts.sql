@@ -0,0 +1,131 @@
+-- Migration: 20261019130000_natural_key_upserts.sql
+-- Add a normalized name key to persons and functions to resolve or create persons and artists by natural key
+
+create extension if not exists unaccent with schema extensions;
+
+-- unaccent is only stable, so wrap it with an explicit dictionary to use it in generated columns and indexes
+create or replace function normalize_name(name text) returns text as $$
+    select lower(trim(regexp_replace(extensions.unaccent('extensions.unaccent'::regdictionary, name), '\s+', ' ', 'g')));
+$$ language sql immutable strict parallel safe;
+
+alter table if exists persons
+    add column if not exists name_key text
+        generated always as (normalize_name(legal_name)) stored;
+-- Not unique: different people can share a name
+create index if not exists persons_name_key_idx on persons(name_key);
+
+-- Resolve or create persons by normalized name and birth year. An input matches an existing person with the same name
+-- key whose birth year is the same or unknown on either side, preferring the same birth year, so same-name persons
+-- born in different years stay apart. Existing persons keep their values, only filling in the ones missing. Returns
+-- one row per input, in the same order, repeating the row for inputs with the same name key and birth year
+create or replace function upsert_persons(payload jsonb)
+returns setof persons
+language plpgsql
+as $$
+declare
+    resolved_ids uuid[];
+begin
+    -- Names aren't unique, so nothing else stops two concurrent upserts from both creating the same new person.
+    -- Serialize them per name key, taking the locks in a fixed order to avoid deadlocks
+    perform pg_advisory_xact_lock(hashtext('upsert_persons:' || k.name_key))
+    from (
+        select distinct normalize_name(e.item->>'legal_name') as name_key
+        from jsonb_array_elements(payload) as e(item)
+        order by 1
+    ) k;
+
+    with input as (
+        select
+            e.position,
+            normalize_name(r.legal_name) as name_key,
+            extract(year from r.birth_date)::int as birth_year,
+            r.legal_name,
+            r.birth_date,
+            r.death_date,
+            r.pronouns,
+            r.notes
+        from jsonb_array_elements(payload) with ordinality as e(item, position),
+             jsonb_populate_record(null::persons, e.item) as r
+    ),
+    grouped as (
+        select distinct on (name_key, birth_year)
+            name_key, birth_year, legal_name, birth_date, death_date, pronouns, notes
+        from input
+        order by name_key, birth_year, position
+    ),
+    matched as (
+        select distinct on (g.name_key, g.birth_year) g.name_key, g.birth_year, p.person_id
+        from grouped g
+        join persons p
+          on p.name_key = g.name_key
+         and (g.birth_year is null or p.birth_date is null or extract(year from p.birth_date)::int = g.birth_year)
+        order by g.name_key, g.birth_year, (extract(year from p.birth_date)::int is not distinct from g.birth_year) desc,
+            p.person_id
+    ),
+    updated as (
+        update persons p set
+            birth_date = coalesce(p.birth_date, g.birth_date),
+            death_date = coalesce(p.death_date, g.death_date),
+            pronouns = coalesce(p.pronouns, g.pronouns),
+            notes = coalesce(p.notes, g.notes)
+        from matched m
+        join grouped g on g.name_key = m.name_key and g.birth_year is not distinct from m.birth_year
+        where p.person_id = m.person_id
+        returning p.person_id
+    ),
+    inserted as (
+        insert into persons (legal_name, birth_date, death_date, pronouns, notes)
+        select g.legal_name, g.birth_date, g.death_date, g.pronouns, g.notes
+        from grouped g
+        where not exists (
+            select 1 from matched m where m.name_key = g.name_key and m.birth_year is not distinct from g.birth_year
+        )
+        returning persons.person_id, persons.name_key, extract(year from persons.birth_date)::int as birth_year
+    ),
+    resolved as (
+        select m.name_key, m.birth_year, m.person_id from matched m
+        union all
+        select i.name_key, i.birth_year, i.person_id from inserted i
+    )
+    select array_agg(r.person_id order by i.position) into resolved_ids
+    from input i
+    join resolved r on r.name_key = i.name_key and r.birth_year is not distinct from i.birth_year;
+
+    -- Rows written by the statement above aren't visible to it, so read them back in a second one
+    return query
+    select p.*
+    from unnest(resolved_ids) with ordinality as r(person_id, position)
+    join persons p on p.person_id = r.person_id
+    order by r.position;
+end;
+$$;
+
+-- Resolve or create artists by person and display name, using the existing uq_artists_person_display index. Existing
+-- artists keep their values, only filling in the ones missing. Returns one row per input, in the same order
+create or replace function upsert_artists(payload jsonb)
+returns setof artists
+language sql
+as $$
+    with input as (
+        select e.position, r.*
+        from jsonb_array_elements(payload) with ordinality as e(item, position),
+             jsonb_populate_record(null::artists, e.item) as r
+    ),
+    upserted as (
+        insert into artists (person_id, artist_type, display_name, sort_name, alternative_names, start_year, end_year)
+        select distinct on (person_id, display_name)
+            person_id, artist_type, display_name, sort_name, alternative_names, start_year, end_year
+        from input
+        order by person_id, display_name, position
+        on conflict (person_id, display_name) do update set
+            sort_name = coalesce(artists.sort_name, excluded.sort_name),
+            alternative_names = coalesce(artists.alternative_names, excluded.alternative_names),
+            start_year = coalesce(artists.start_year, excluded.start_year),
+            end_year = coalesce(artists.end_year, excluded.end_year)
+        returning *
+    )
+    select u.*
+    from input i
+    join upserted u on u.person_id = i.person_id and u.display_name = i.display_name
+    order by i.position;
+$$;
@@ -0,0 +1,68 @@
+-- Migration: 20261019140000_person_name_resolution.sql
+-- Resolve batches of free-text names to persons by exact, alternative and similar normalized names
+
+create extension if not exists pg_trgm with schema extensions;
+
+-- Normalized keys of a person's alternative names, indexed to match them without scanning every person
+create or replace function alternative_name_keys(alternative_names jsonb) returns text[] as $$
+    select coalesce(array_agg(normalize_name(name)), '{}')
+    from jsonb_array_elements_text(
+        case when jsonb_typeof(alternative_names) = 'array' then alternative_names else '[]'::jsonb end
+    ) as name;
+$$ language sql immutable parallel safe;
+
+create index if not exists persons_alternative_name_keys_idx on persons using gin (alternative_name_keys(alternative_names));
+create index if not exists persons_name_key_trgm_idx on persons using gin (name_key extensions.gin_trgm_ops);
+
+-- Returns up to candidate_limit ranked candidates for each name, identified by its 1-based index in names. Names
+-- without any candidate are returned once with a null person. Similar names are found with the indexed % operator,
+-- whose threshold is set to min_score for the query, as its 0.3 default would otherwise hide lower scoring matches
+create or replace function resolve_person_names(names text[], candidate_limit int default 5, min_score real default 0.3)
+returns table (
+    name_index int,
+    name text,
+    person_id uuid,
+    legal_name text,
+    match_type text,
+    score real
+)
+language plpgsql
+as $$
+declare
+    -- The setting isn't registered until pg_trgm is first used in the session, in which case it has its default
+    previous_threshold text := coalesce(current_setting('pg_trgm.similarity_threshold', true), '0.3');
+begin
+    perform set_config('pg_trgm.similarity_threshold', min_score::text, true);
+
+    return query
+    select n.name_index::int, n.name, c.person_id, c.legal_name, c.match_type, c.score
+    from unnest(names) with ordinality as n(name, name_index)
+    left join lateral (
+        select
+            m.person_id,
+            m.legal_name,
+            (array_agg(m.match_type order by m.score desc))[1] as match_type,
+            max(m.score) as score
+        from (
+            select p.person_id, p.legal_name, 'exact' as match_type, 1.0::real as score
+            from persons p
+            where p.name_key = normalize_name(n.name)
+            union all
+            select p.person_id, p.legal_name, 'alternative_name', 0.9::real
+            from persons p
+            where alternative_name_keys(p.alternative_names) @> array[normalize_name(n.name)]
+            union all
+            select p.person_id, p.legal_name, 'similar', extensions.similarity(p.name_key, normalize_name(n.name))
+            from persons p
+            where p.name_key operator(extensions.%) normalize_name(n.name)
+        ) m
+        where m.score >= min_score
+        group by m.person_id, m.legal_name
+        order by max(m.score) desc, m.legal_name
+        limit candidate_limit
+    ) c on true
+    order by n.name_index, c.score desc nulls last;
+
+    perform set_config('pg_trgm.similarity_threshold', previous_threshold, true);
+end;
+$$;
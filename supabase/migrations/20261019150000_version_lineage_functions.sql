@@ -0,0 +1,105 @@
+-- Migration: 20261019150000_version_lineage_functions.sql
+-- Traverse version derivation chains (covers, remixes, live versions...) server-side with a depth limit
+
+create index if not exists versions_based_on_version_id_idx on versions(based_on_version_id);
+create index if not exists versions_work_id_idx on versions(work_id);
+
+-- Ancestors and descendants of a version. Depth is relative to the version: negative for the versions it's based on,
+-- positive for the versions based on it
+create or replace function version_lineage(root_version_id uuid, max_depth int default 10)
+returns table (
+    version_id uuid,
+    title text,
+    version_type public.version_type,
+    work_id uuid,
+    primary_artist_id uuid,
+    primary_artist_name text,
+    based_on_version_id uuid,
+    depth int
+)
+language sql
+stable
+as $$
+    with recursive ancestors as (
+        select v.version_id, v.based_on_version_id, 0 as depth, array[v.version_id] as path
+        from versions v
+        where v.version_id = root_version_id
+        union all
+        select p.version_id, p.based_on_version_id, a.depth - 1, a.path || p.version_id
+        from ancestors a
+        join versions p on p.version_id = a.based_on_version_id
+        where a.depth > -max_depth and not p.version_id = any(a.path)
+    ),
+    descendants as (
+        select v.version_id, 0 as depth, array[v.version_id] as path
+        from versions v
+        where v.version_id = root_version_id
+        union all
+        select c.version_id, d.depth + 1, d.path || c.version_id
+        from descendants d
+        join versions c on c.based_on_version_id = d.version_id
+        where d.depth < max_depth and not c.version_id = any(d.path)
+    ),
+    lineage as (
+        select version_id, depth from ancestors
+        union all
+        select version_id, depth from descendants
+    )
+    select distinct on (v.version_id)
+        v.version_id,
+        v.title,
+        v.version_type,
+        v.work_id,
+        v.primary_artist_id,
+        a.display_name,
+        v.based_on_version_id,
+        l.depth
+    from lineage l
+    join versions v on v.version_id = l.version_id
+    left join artists a on a.artist_id = v.primary_artist_id
+    order by v.version_id, abs(l.depth);
+$$;
+
+-- Every version of a work and the versions derived from them, including ones in other works. Depth is the distance
+-- from a version of the work that isn't based on another version of the same work
+create or replace function work_version_tree(target_work_id uuid, max_depth int default 10)
+returns table (
+    version_id uuid,
+    title text,
+    version_type public.version_type,
+    work_id uuid,
+    primary_artist_id uuid,
+    primary_artist_name text,
+    based_on_version_id uuid,
+    depth int
+)
+language sql
+stable
+as $$
+    with recursive tree as (
+        select v.version_id, 0 as depth, array[v.version_id] as path
+        from versions v
+        where v.work_id = target_work_id
+          and not exists (
+              select 1 from versions p where p.version_id = v.based_on_version_id and p.work_id = target_work_id
+          )
+        union all
+        select c.version_id, t.depth + 1, t.path || c.version_id
+        from tree t
+        join versions c on c.based_on_version_id = t.version_id
+        where t.depth < max_depth and not c.version_id = any(t.path)
+    )
+    select distinct on (v.version_id)
+        v.version_id,
+        v.title,
+        v.version_type,
+        v.work_id,
+        v.primary_artist_id,
+        a.display_name,
+        v.based_on_version_id,
+        t.depth
+    from tree t
+    join versions v on v.version_id = t.version_id
+    left join artists a on a.artist_id = v.primary_artist_id
+    order by v.version_id, t.depth;
+$$;
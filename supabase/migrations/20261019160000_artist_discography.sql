@@ -0,0 +1,170 @@
+-- Migration: 20261019160000_artist_discography.sql
+-- Trigger-maintained index of everything an artist is credited on, for ordered and paged discography listings
+
+create table if not exists artist_discography (
+    -- The credit ID for credits, or the version ID for primary artist entries
+    entry_id uuid primary key,
+    artist_id uuid not null,
+    work_id uuid,
+    version_id uuid,
+    role text not null,
+    year int,
+    constraint fk_artist_discography_artist foreign key (artist_id) references artists(artist_id) on delete cascade,
+    constraint fk_artist_discography_work foreign key (work_id) references works(work_id) on delete cascade,
+    constraint fk_artist_discography_version foreign key (version_id) references versions(version_id) on delete cascade
+);
+
+-- Entries without a year sort last
+create index if not exists artist_discography_artist_year_idx
+    on artist_discography(artist_id, (coalesce(year, 2147483647)), entry_id);
+
+alter table if exists artist_discography enable row level security;
+
+-- The year of an entry is the version release year, falling back to the year the work was started
+create or replace function discography_year(entry_version_id uuid, entry_work_id uuid) returns int as $$
+    select coalesce(
+        (select release_year from versions where version_id = entry_version_id),
+        (select origin_year_start from works where work_id = entry_work_id)
+    );
+$$ language sql stable;
+
+create or replace function sync_credit_discography() returns trigger
+language plpgsql
+as $$
+declare
+    entry_work_id uuid;
+begin
+    if tg_op in ('UPDATE', 'DELETE') then
+        delete from artist_discography where entry_id = old.credit_id;
+    end if;
+
+    if tg_op in ('INSERT', 'UPDATE') and new.artist_id is not null then
+        entry_work_id := coalesce(new.work_id, (select work_id from versions where version_id = new.version_id));
+        insert into artist_discography (entry_id, artist_id, work_id, version_id, role, year)
+        values (
+            new.credit_id,
+            new.artist_id,
+            entry_work_id,
+            new.version_id,
+            new.role,
+            discography_year(new.version_id, entry_work_id)
+        );
+    end if;
+
+    return null;
+end;
+$$;
+
+create or replace function sync_version_discography() returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op in ('UPDATE', 'DELETE') then
+        delete from artist_discography where entry_id = old.version_id;
+    end if;
+
+    if tg_op in ('INSERT', 'UPDATE') then
+        if new.primary_artist_id is not null then
+            insert into artist_discography (entry_id, artist_id, work_id, version_id, role, year)
+            values (
+                new.version_id,
+                new.primary_artist_id,
+                new.work_id,
+                new.version_id,
+                'primary_artist',
+                discography_year(new.version_id, new.work_id)
+            );
+        end if;
+
+        -- Credits on the version take their year from it
+        if tg_op = 'UPDATE' then
+            update artist_discography
+            set year = discography_year(new.version_id, work_id)
+            where version_id = new.version_id and entry_id <> new.version_id;
+        end if;
+    end if;
+
+    return null;
+end;
+$$;
+
+create or replace function sync_work_discography() returns trigger
+language plpgsql
+as $$
+begin
+    update artist_discography
+    set year = discography_year(version_id, work_id)
+    where work_id = new.work_id;
+
+    return null;
+end;
+$$;
+
+drop trigger if exists credits_discography_sync on credits;
+create trigger credits_discography_sync
+    after insert or update or delete on credits
+    for each row execute function sync_credit_discography();
+
+drop trigger if exists versions_discography_sync on versions;
+create trigger versions_discography_sync
+    after insert or update or delete on versions
+    for each row execute function sync_version_discography();
+
+drop trigger if exists works_discography_sync on works;
+create trigger works_discography_sync
+    after update of origin_year_start on works
+    for each row execute function sync_work_discography();
+
+-- Backfill existing credits and primary artists
+insert into artist_discography (entry_id, artist_id, work_id, version_id, role, year)
+select c.credit_id, c.artist_id, coalesce(c.work_id, v.work_id), c.version_id, c.role,
+       discography_year(c.version_id, coalesce(c.work_id, v.work_id))
+from credits c
+left join versions v on v.version_id = c.version_id
+where c.artist_id is not null
+union all
+select v.version_id, v.primary_artist_id, v.work_id, v.version_id, 'primary_artist',
+       discography_year(v.version_id, v.work_id)
+from versions v
+where v.primary_artist_id is not null
+on conflict (entry_id) do nothing;
+
+-- One page of an artist's discography, ordered by year with undated entries last. Pass the sort year and entry ID of
+-- the last entry of the previous page to get the next one
+create or replace function artist_discography_page(
+    target_artist_id uuid,
+    year_from int default null,
+    year_to int default null,
+    roles text[] default null,
+    after_sort_year int default null,
+    after_entry_id uuid default null,
+    page_size int default 50
+)
+returns table (
+    entry_id uuid,
+    work_id uuid,
+    work_title text,
+    version_id uuid,
+    version_title text,
+    role text,
+    year int,
+    sort_year int
+)
+language sql
+stable
+as $$
+    select d.entry_id, d.work_id, w.title, d.version_id, v.title, d.role, d.year, coalesce(d.year, 2147483647)
+    from artist_discography d
+    left join works w on w.work_id = d.work_id
+    left join versions v on v.version_id = d.version_id
+    where d.artist_id = target_artist_id
+      and (year_from is null or d.year >= year_from)
+      and (year_to is null or d.year <= year_to)
+      and (roles is null or d.role = any(roles))
+      and (
+          after_entry_id is null
+          or (coalesce(d.year, 2147483647), d.entry_id) > (after_sort_year, after_entry_id)
+      )
+    order by coalesce(d.year, 2147483647), d.entry_id
+    limit page_size;
+$$;
@@ -0,0 +1,68 @@
+-- Migration: 20261019170000_person_works.sql
+-- List the works of a person across direct credits and the solo and group artists they're part of
+
+create index if not exists credits_person_id_idx on credits(person_id);
+create index if not exists credits_artist_id_idx on credits(artist_id);
+create index if not exists artist_memberships_person_id_idx on artist_memberships(person_id);
+create index if not exists artists_person_id_idx on artists(person_id);
+
+-- One page of the works a person is credited on, once per work with every role and path it was credited through,
+-- ordered by the year the work was started with undated works last. Artist credits come from artist_discography,
+-- so they include the versions the artists are the primary artist of. Pass the sort year and work ID of the last work
+-- of the previous page to get the next one
+create or replace function person_works_page(
+    target_person_id uuid,
+    after_sort_year int default null,
+    after_work_id uuid default null,
+    page_size int default 50
+)
+returns table (
+    work_id uuid,
+    title text,
+    origin_year_start int,
+    origin_year_end int,
+    roles text[],
+    credited_as text[],
+    sort_year int
+)
+language sql
+stable
+as $$
+    with person_artists as (
+        select a.artist_id, 'artist' as credited_as
+        from artists a
+        where a.person_id = target_person_id
+        union
+        select m.group_id, 'group_member'
+        from artist_memberships m
+        where m.person_id = target_person_id
+    ),
+    credited as (
+        select coalesce(c.work_id, v.work_id) as work_id, c.role, 'direct' as credited_as
+        from credits c
+        left join versions v on v.version_id = c.version_id
+        where c.person_id = target_person_id
+        union all
+        select d.work_id, d.role, pa.credited_as
+        from person_artists pa
+        join artist_discography d on d.artist_id = pa.artist_id
+    ),
+    person_works as (
+        select
+            w.work_id,
+            w.title,
+            w.origin_year_start,
+            w.origin_year_end,
+            array_agg(distinct cr.role order by cr.role) as roles,
+            array_agg(distinct cr.credited_as order by cr.credited_as) as credited_as,
+            coalesce(w.origin_year_start, 2147483647) as sort_year
+        from credited cr
+        join works w on w.work_id = cr.work_id
+        group by w.work_id
+    )
+    select pw.work_id, pw.title, pw.origin_year_start, pw.origin_year_end, pw.roles, pw.credited_as, pw.sort_year
+    from person_works pw
+    where after_work_id is null or (pw.sort_year, pw.work_id) > (after_sort_year, after_work_id)
+    order by pw.sort_year, pw.work_id
+    limit page_size;
+$$;
@@ -0,0 +1,14 @@
+-- Migration: 20261019180000_membership_active_years.sql
+-- Index artist memberships by the years they were active to answer point-in-time membership lookups
+
+create extension if not exists btree_gist with schema extensions;
+
+-- Inclusive range of active years. Missing years leave that side unbounded, so memberships with unknown years match
+alter table if exists artist_memberships
+    add column if not exists active_years int4range
+        generated always as (int4range(start_year, end_year, '[]')) stored;
+
+create index if not exists artist_memberships_group_active_years_idx
+    on artist_memberships using gist (group_id, active_years);
+create index if not exists artist_memberships_person_active_years_idx
+    on artist_memberships using gist (person_id, active_years);
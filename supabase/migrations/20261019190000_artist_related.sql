@@ -0,0 +1,33 @@
+-- Migration: 20261019190000_artist_related.sql
+-- Precomputed top related artists per artist, ranked by shared works, versions and members
+
+create table if not exists artist_related (
+    artist_id uuid not null,
+    related_artist_id uuid not null,
+    rank int not null,
+    score real not null,
+    shared_works int not null default 0,
+    shared_versions int not null default 0,
+    shared_members int not null default 0,
+    computed_at timestamptz not null default now(),
+    primary key (artist_id, related_artist_id),
+    constraint fk_artist_related_artist foreign key (artist_id) references artists(artist_id) on delete cascade,
+    constraint fk_artist_related_related foreign key (related_artist_id) references artists(artist_id) on delete cascade
+);
+
+create index if not exists artist_related_artist_rank_idx on artist_related(artist_id, rank);
+
+alter table if exists artist_related enable row level security;
+
+-- Replace the related artists of a batch of artists in one transaction. Artists in artist_ids without rows in the
+-- payload are left without related artists
+create or replace function replace_artist_related(artist_ids uuid[], payload jsonb)
+returns void
+language sql
+as $$
+    delete from artist_related where artist_id = any(artist_ids);
+
+    insert into artist_related (artist_id, related_artist_id, rank, score, shared_works, shared_versions, shared_members)
+    select artist_id, related_artist_id, rank, score, shared_works, shared_versions, shared_members
+    from jsonb_populate_recordset(null::artist_related, payload);
+$$;
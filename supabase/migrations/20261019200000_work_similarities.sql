@@ -0,0 +1,57 @@
+-- Migration: 20261019200000_work_similarities.sql
+-- Precomputed top similar works per work, by cosine similarity of title, theme, genre and metadata features
+
+create table if not exists work_similarities (
+    work_id uuid not null,
+    similar_work_id uuid not null,
+    rank int not null,
+    score real not null,
+    computed_at timestamptz not null default now(),
+    primary key (work_id, similar_work_id),
+    constraint fk_work_similarities_work foreign key (work_id) references works(work_id) on delete cascade,
+    constraint fk_work_similarities_similar foreign key (similar_work_id) references works(work_id) on delete cascade
+);
+
+create index if not exists work_similarities_work_rank_idx on work_similarities(work_id, rank);
+-- Find the works listing a work, to recompute them when it changes
+create index if not exists work_similarities_similar_work_idx on work_similarities(similar_work_id);
+
+alter table if exists work_similarities enable row level security;
+
+-- When the similar works of each work were last computed, including works that have no similar work
+create table if not exists work_similarity_runs (
+    work_id uuid primary key,
+    computed_at timestamptz not null default now(),
+    constraint fk_work_similarity_runs_work foreign key (work_id) references works(work_id) on delete cascade
+);
+
+alter table if exists work_similarity_runs enable row level security;
+
+-- Replace the similar works of a batch of works in one transaction, and mark them as computed. Works in work_ids
+-- without rows in the payload are left without similar works
+create or replace function replace_work_similarities(work_ids uuid[], payload jsonb)
+returns void
+language sql
+as $$
+    delete from work_similarities where work_id = any(work_ids);
+
+    insert into work_similarities (work_id, similar_work_id, rank, score)
+    select work_id, similar_work_id, rank, score
+    from jsonb_populate_recordset(null::work_similarities, payload);
+
+    insert into work_similarity_runs (work_id)
+    select distinct unnest(work_ids)
+    on conflict (work_id) do update set computed_at = now();
+$$;
+
+-- Works the similarity job hasn't computed similar works for yet, such as newly created ones
+create or replace view works_without_similarities with (security_invoker = true) as
+select w.work_id
+from works w
+where not exists (select 1 from work_similarity_runs r where r.work_id = w.work_id);
+
+-- Number of similar works and lowest similarity stored for each work, to tell whether a new work enters its top
+create or replace view work_similarity_floors with (security_invoker = true) as
+select work_id, count(*)::int as neighbour_count, min(score) as min_score
+from work_similarities
+group by work_id;
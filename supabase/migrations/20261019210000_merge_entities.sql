@@ -0,0 +1,261 @@
+-- Migration: 20261019210000_merge_entities.sql
+-- Merge duplicate persons or artists into one, repointing every reference to them in a single transaction
+
+-- Repoint the polymorphic references of a merged entity, dropping the ones the target already has
+create or replace function merge_entity_references(
+    merged_entity_type public.entity_type,
+    target_id uuid,
+    duplicate_ids uuid[]
+)
+returns void
+language sql
+as $$
+    delete from external_links l
+    where l.entity_type = merged_entity_type
+      and l.entity_id = any(duplicate_ids)
+      and exists (
+          select 1 from external_links t
+          where t.entity_type = merged_entity_type and t.entity_id = target_id and t.url = l.url
+      );
+    update external_links set entity_id = target_id
+    where entity_type = merged_entity_type and entity_id = any(duplicate_ids);
+
+    delete from tag_assignments a
+    where a.entity_type = merged_entity_type
+      and a.entity_id = any(duplicate_ids)
+      and exists (
+          select 1 from tag_assignments t
+          where t.entity_type = merged_entity_type and t.entity_id = target_id
+            and t.tag_id is not distinct from a.tag_id and t.user_id = a.user_id
+      );
+    update tag_assignments set entity_id = target_id
+    where entity_type = merged_entity_type and entity_id = any(duplicate_ids);
+
+    update evidence set entity_id = target_id
+    where entity_type = merged_entity_type and entity_id = any(duplicate_ids);
+
+    update notation_assets set entity_id = target_id
+    where entity_type = merged_entity_type and entity_id = any(duplicate_ids);
+
+    update contributions set entity_id = target_id
+    where entity_type = merged_entity_type and entity_id = any(duplicate_ids);
+$$;
+
+-- Merge artists into target_artist_id and delete them. The target keeps its values, only filling in the ones missing,
+-- and gets the display names of the duplicates as alternative names. Only artists of the same type can be merged, and a
+-- group never gets a person. Returns no rows if the target doesn't exist
+create or replace function merge_artists(target_artist_id uuid, duplicate_artist_ids uuid[])
+returns setof artists
+language plpgsql
+as $$
+declare
+    missing_ids uuid[];
+    mismatched_ids uuid[];
+    target artists;
+    duplicate_person_id uuid;
+begin
+    duplicate_artist_ids := array_remove(duplicate_artist_ids, target_artist_id);
+
+    -- Lock every artist involved so concurrent merges or edits can't interleave
+    perform 1 from artists
+    where artist_id = target_artist_id or artist_id = any(duplicate_artist_ids)
+    for update;
+
+    select * into target from artists where artist_id = target_artist_id;
+    if not found then
+        return;
+    end if;
+
+    select array_agg(id) into missing_ids
+    from unnest(duplicate_artist_ids) as id
+    where not exists (select 1 from artists where artist_id = id);
+    if missing_ids is not null then
+        raise exception 'Artists % not found', missing_ids using errcode = 'P0002';
+    end if;
+
+    select array_agg(artist_id) into mismatched_ids
+    from artists
+    where artist_id = any(duplicate_artist_ids) and artist_type <> target.artist_type;
+    if mismatched_ids is not null then
+        raise exception 'Artists % aren''t of the same type as artist %', mismatched_ids, target_artist_id
+            using errcode = '22023';
+    end if;
+
+    select person_id into duplicate_person_id
+    from artists
+    where artist_id = any(duplicate_artist_ids) and person_id is not null
+    order by artist_id
+    limit 1;
+
+    update artists t set
+        sort_name = coalesce(t.sort_name, d.sort_name),
+        start_year = coalesce(t.start_year, d.start_year),
+        end_year = coalesce(t.end_year, d.end_year),
+        alternative_names = d.alternative_names
+    from (
+        select
+            (array_agg(sort_name) filter (where sort_name is not null))[1] as sort_name,
+            min(start_year) as start_year,
+            max(end_year) as end_year,
+            (
+                select coalesce(jsonb_agg(distinct name), '[]'::jsonb)
+                from (
+                    select jsonb_array_elements_text(
+                        case when jsonb_typeof(a.alternative_names) = 'array' then a.alternative_names else '[]'::jsonb end
+                    ) as name
+                    from artists a
+                    where a.artist_id = target_artist_id or a.artist_id = any(duplicate_artist_ids)
+                    union
+                    select a.display_name
+                    from artists a
+                    where a.artist_id = any(duplicate_artist_ids)
+                ) names
+                where name <> (select display_name from artists where artist_id = target_artist_id)
+            ) as alternative_names
+        from artists
+        where artist_id = any(duplicate_artist_ids)
+    ) d
+    where t.artist_id = target_artist_id;
+
+    -- Drop credits the target already has for the same work, version and role
+    delete from credits c
+    where c.artist_id = any(duplicate_artist_ids)
+      and exists (
+          select 1 from credits t
+          where t.artist_id = target_artist_id
+            and t.work_id is not distinct from c.work_id
+            and t.version_id is not distinct from c.version_id
+            and t.role = c.role
+      );
+    update credits set artist_id = target_artist_id where artist_id = any(duplicate_artist_ids);
+
+    update versions set primary_artist_id = target_artist_id where primary_artist_id = any(duplicate_artist_ids);
+
+    delete from artist_memberships m
+    where m.group_id = any(duplicate_artist_ids)
+      and exists (
+          select 1 from artist_memberships t
+          where t.group_id = target_artist_id and t.person_id is not distinct from m.person_id
+      );
+    update artist_memberships set group_id = target_artist_id where group_id = any(duplicate_artist_ids);
+
+    perform merge_entity_references('artist', target_artist_id, duplicate_artist_ids);
+
+    delete from artists where artist_id = any(duplicate_artist_ids);
+
+    -- Fill in a solo target's missing person once the duplicates are gone, unless that person already has another artist
+    -- with the target's display name
+    if target.artist_type = 'solo' and target.person_id is null and duplicate_person_id is not null then
+        update artists t set person_id = duplicate_person_id
+        where t.artist_id = target_artist_id
+          and not exists (
+              select 1 from artists a
+              where a.person_id = duplicate_person_id and a.display_name = t.display_name and a.artist_id <> t.artist_id
+          );
+    end if;
+
+    return query select * from artists where artist_id = target_artist_id;
+end;
+$$;
+
+-- Merge persons into target_person_id and delete them. The target keeps its values, only filling in the ones missing,
+-- and gets the legal names of the duplicates as alternative names. Artists of the merged persons with the same display
+-- name are merged too. Returns no rows if the target doesn't exist
+create or replace function merge_persons(target_person_id uuid, duplicate_person_ids uuid[])
+returns setof persons
+language plpgsql
+as $$
+declare
+    missing_ids uuid[];
+    same_name_artists record;
+begin
+    duplicate_person_ids := array_remove(duplicate_person_ids, target_person_id);
+
+    -- Lock every person involved so concurrent merges or edits can't interleave
+    perform 1 from persons
+    where person_id = target_person_id or person_id = any(duplicate_person_ids)
+    for update;
+
+    if not exists (select 1 from persons where person_id = target_person_id) then
+        return;
+    end if;
+
+    select array_agg(id) into missing_ids
+    from unnest(duplicate_person_ids) as id
+    where not exists (select 1 from persons where person_id = id);
+    if missing_ids is not null then
+        raise exception 'Persons % not found', missing_ids using errcode = 'P0002';
+    end if;
+
+    update persons t set
+        birth_date = coalesce(t.birth_date, d.birth_date),
+        death_date = coalesce(t.death_date, d.death_date),
+        pronouns = coalesce(t.pronouns, d.pronouns),
+        notes = coalesce(t.notes, d.notes),
+        alternative_names = d.alternative_names
+    from (
+        select
+            (array_agg(birth_date) filter (where birth_date is not null))[1] as birth_date,
+            (array_agg(death_date) filter (where death_date is not null))[1] as death_date,
+            (array_agg(pronouns) filter (where pronouns is not null))[1] as pronouns,
+            (array_agg(notes) filter (where notes is not null))[1] as notes,
+            (
+                select coalesce(jsonb_agg(distinct name), '[]'::jsonb)
+                from (
+                    select jsonb_array_elements_text(
+                        case when jsonb_typeof(p.alternative_names) = 'array' then p.alternative_names else '[]'::jsonb end
+                    ) as name
+                    from persons p
+                    where p.person_id = target_person_id or p.person_id = any(duplicate_person_ids)
+                    union
+                    select p.legal_name
+                    from persons p
+                    where p.person_id = any(duplicate_person_ids)
+                ) names
+                where name <> (select legal_name from persons where person_id = target_person_id)
+            ) as alternative_names
+        from persons
+        where person_id = any(duplicate_person_ids)
+    ) d
+    where t.person_id = target_person_id;
+
+    -- Artists with the same display name would collide on uq_artists_person_display, so merge them first, into the
+    -- target's artist when it has one
+    for same_name_artists in
+        select array_agg(artist_id order by (person_id = target_person_id) desc, artist_id) as artist_ids
+        from artists
+        where person_id = target_person_id or person_id = any(duplicate_person_ids)
+        group by display_name
+        having count(*) > 1
+    loop
+        perform merge_artists(same_name_artists.artist_ids[1], same_name_artists.artist_ids[2:]);
+    end loop;
+    update artists set person_id = target_person_id where person_id = any(duplicate_person_ids);
+
+    -- Drop credits the target already has for the same work, version and role
+    delete from credits c
+    where c.person_id = any(duplicate_person_ids)
+      and exists (
+          select 1 from credits t
+          where t.person_id = target_person_id
+            and t.work_id is not distinct from c.work_id
+            and t.version_id is not distinct from c.version_id
+            and t.role = c.role
+      );
+    update credits set person_id = target_person_id where person_id = any(duplicate_person_ids);
+
+    delete from artist_memberships m
+    where m.person_id = any(duplicate_person_ids)
+      and exists (
+          select 1 from artist_memberships t
+          where t.person_id = target_person_id and t.group_id is not distinct from m.group_id
+      );
+    update artist_memberships set person_id = target_person_id where person_id = any(duplicate_person_ids);
+
+    perform merge_entity_references('person', target_person_id, duplicate_person_ids);
+
+    delete from persons where person_id = any(duplicate_person_ids);
+
+    return query select * from persons where person_id = target_person_id;
+end;
+$$;
@@ -0,0 +1,129 @@
+-- Migration: 20261019220000_suggest.sql
+-- Typeahead suggestions matching every word of the query as a prefix, served by prefix ordered name indexes and the
+-- existing search vector indexes
+
+-- Build a tsquery matching each word of the text as a prefix, so "carl niel" matches "Carl Nielsen". Punctuation is
+-- dropped so user input can never make an invalid tsquery. Returns null when the text has no words
+create or replace function prefix_tsquery(prefix_text text)
+returns tsquery
+language sql
+immutable
+as $$
+    select to_tsquery('simple', string_agg(word || ':*', ' & '))
+    from regexp_split_to_table(lower(prefix_text), '[^[:alnum:]]+') as word
+    where word <> '';
+$$;
+
+-- Names starting with the typed text, read in index order so short prefixes don't sort every match
+create index if not exists works_title_prefix_idx on works (lower(title) text_pattern_ops);
+create index if not exists versions_title_prefix_idx on versions (lower(title) text_pattern_ops);
+create index if not exists releases_release_title_prefix_idx on releases (lower(release_title) text_pattern_ops);
+create index if not exists artists_display_name_prefix_idx on artists (lower(display_name) text_pattern_ops);
+create index if not exists persons_legal_name_prefix_idx on persons (lower(legal_name) text_pattern_ops);
+
+-- Suggest display names across entity types. Each type contributes its first names starting with the query, read as
+-- a range of the prefix index in index order, and the first names with a word starting with each word of it, so no
+-- branch sorts every match. Names starting with the query come first, then shorter names, as the closest completions
+-- of what's being typed. Queries shorter than two characters get no suggestions
+create or replace function suggest(prefix_text text, fetch_limit int default 10)
+returns table (
+    entity_type public.entity_type,
+    entity_id uuid,
+    display_text text
+)
+language plpgsql
+stable
+as $$
+declare
+    prefix text := lower(trim(prefix_text));
+    -- Sorts after every name starting with the prefix in the byte order of the pattern indexes
+    prefix_end text := prefix || chr(1114111);
+    tsq tsquery := prefix_tsquery(prefix_text);
+begin
+    if char_length(prefix) < 2 then
+        return;
+    end if;
+
+    return query
+    with matches as (
+        (
+            select 'work'::public.entity_type as entity_type, w.work_id as entity_id, w.title as display_text
+            from works w
+            where lower(w.title) ~>=~ prefix and lower(w.title) ~<~ prefix_end
+            order by lower(w.title) using ~<~
+            limit fetch_limit
+        )
+        union
+        (
+            select 'work'::public.entity_type, w.work_id, w.title
+            from works w
+            where w.search_vector @@ tsq
+            limit fetch_limit
+        )
+        union
+        (
+            select 'version'::public.entity_type, v.version_id, v.title
+            from versions v
+            where lower(v.title) ~>=~ prefix and lower(v.title) ~<~ prefix_end
+            order by lower(v.title) using ~<~
+            limit fetch_limit
+        )
+        union
+        (
+            select 'version'::public.entity_type, v.version_id, v.title
+            from versions v
+            where v.search_vector @@ tsq
+            limit fetch_limit
+        )
+        union
+        (
+            select 'release'::public.entity_type, r.release_id, r.release_title
+            from releases r
+            where lower(r.release_title) ~>=~ prefix and lower(r.release_title) ~<~ prefix_end
+            order by lower(r.release_title) using ~<~
+            limit fetch_limit
+        )
+        union
+        (
+            select 'release'::public.entity_type, r.release_id, r.release_title
+            from releases r
+            where r.search_vector @@ tsq
+            limit fetch_limit
+        )
+        union
+        (
+            select 'artist'::public.entity_type, a.artist_id, a.display_name
+            from artists a
+            where lower(a.display_name) ~>=~ prefix and lower(a.display_name) ~<~ prefix_end
+            order by lower(a.display_name) using ~<~
+            limit fetch_limit
+        )
+        union
+        (
+            select 'artist'::public.entity_type, a.artist_id, a.display_name
+            from artists a
+            where a.search_vector @@ tsq
+            limit fetch_limit
+        )
+        union
+        (
+            select 'person'::public.entity_type, p.person_id, p.legal_name
+            from persons p
+            where lower(p.legal_name) ~>=~ prefix and lower(p.legal_name) ~<~ prefix_end
+            order by lower(p.legal_name) using ~<~
+            limit fetch_limit
+        )
+        union
+        (
+            select 'person'::public.entity_type, p.person_id, p.legal_name
+            from persons p
+            where p.search_vector @@ tsq
+            limit fetch_limit
+        )
+    )
+    select m.entity_type, m.entity_id, m.display_text
+    from matches m
+    order by starts_with(lower(m.display_text), prefix) desc, length(m.display_text), m.display_text
+    limit fetch_limit;
+end;
+$$;
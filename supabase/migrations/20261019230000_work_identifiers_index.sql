@@ -0,0 +1,6 @@
+-- Migration: 20261019230000_work_identifiers_index.sql
+-- Index work identifiers for exact catalogue number lookups such as {"label": "CNW", "value": "27"}
+
+-- jsonb_path_ops only supports containment, which is all identifier lookups use, and is smaller and faster than the
+-- default jsonb operator class
+create index if not exists works_identifiers_idx on works using gin (identifiers jsonb_path_ops);
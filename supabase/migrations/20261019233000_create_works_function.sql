@@ -0,0 +1,12 @@
+-- Migration: 20261019233000_create_works_function.sql
+-- Create a batch of works and all of their nested relationships in a single transaction
+
+-- Returns each created work with the position of its payload in the batch, so callers match works to their input by
+-- index instead of relying on row order. If any work fails, none of the batch is written
+create or replace function create_works(payload jsonb, added_by uuid)
+returns table (item_index int, work jsonb)
+language sql
+as $$
+    select (p.ordinality - 1)::int, create_work(p.value, create_works.added_by)
+    from jsonb_array_elements(payload) with ordinality as p(value, ordinality);
+$$;
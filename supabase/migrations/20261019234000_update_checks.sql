@@ -0,0 +1,53 @@
+-- Migration: 20261019234000_update_checks.sql
+-- Check year and date ranges against the stored row on every write, and queue works for the similar works job when
+-- the fields it compares change
+
+-- Partial updates only send some fields, so the range is checked here against the values after the write. Not validated
+-- against existing rows, which keep any range written before the check existed
+alter table if exists works drop constraint if exists ck_works_origin_years;
+alter table if exists works
+    add constraint ck_works_origin_years check (origin_year_start <= origin_year_end) not valid;
+
+alter table if exists artists drop constraint if exists ck_artists_years;
+alter table if exists artists
+    add constraint ck_artists_years check (start_year <= end_year) not valid;
+
+alter table if exists persons drop constraint if exists ck_persons_life_dates;
+alter table if exists persons
+    add constraint ck_persons_life_dates check (birth_date <= death_date) not valid;
+
+-- Forget when the similar works of a work were computed, so the next incremental run recomputes it and the works
+-- listing it. Its stored similar works are kept until then
+create or replace function reset_work_similarity_run() returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op in ('UPDATE', 'DELETE') then
+        delete from work_similarity_runs where work_id = old.work_id;
+    end if;
+
+    if tg_op in ('INSERT', 'UPDATE') then
+        delete from work_similarity_runs where work_id = new.work_id;
+    end if;
+
+    return null;
+end;
+$$;
+
+drop trigger if exists works_similarity_reset on works;
+create trigger works_similarity_reset
+    after update of title, language, themes, sentiment, origin_year_start on works
+    for each row
+    when (
+        old.title is distinct from new.title
+        or old.language is distinct from new.language
+        or old.themes is distinct from new.themes
+        or old.sentiment is distinct from new.sentiment
+        or old.origin_year_start is distinct from new.origin_year_start
+    )
+    execute function reset_work_similarity_run();
+
+drop trigger if exists work_genres_similarity_reset on work_genres;
+create trigger work_genres_similarity_reset
+    after insert or update or delete on work_genres
+    for each row execute function reset_work_similarity_run();
@@ -0,0 +1,22 @@
+-- Migration: 20261019236000_work_identifier_search.sql
+-- Look up works by catalogue identifier ignoring case, so "cnw 27" finds {"label": "CNW", "value": "27"} in one query
+
+-- Identifiers with lower cased labels and values, searched by containment like works_identifiers_idx
+create index if not exists works_identifiers_lower_idx on works using gin ((lower(identifiers::text)::jsonb) jsonb_path_ops);
+
+-- Works with an identifier matching the label and value in any case. The expression matches the index above
+create or replace function search_work_identifiers(label_text text, value_text text, fetch_limit int default 20)
+returns table (
+    work_id uuid,
+    title text
+)
+language sql
+stable
+as $$
+    select w.work_id, w.title
+    from works w
+    where lower(w.identifiers::text)::jsonb @> jsonb_build_array(
+        jsonb_build_object('label', lower(label_text), 'value', lower(value_text))
+    )
+    limit fetch_limit;
+$$;
@@ -0,0 +1,153 @@
+"""
+Unit tests for the batch job reads and writes in the analytics CRUD module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from music_catalogue.crud import analytics
+from music_catalogue.models.exceptions import APIError
+from supabase import PostgrestAPIError
+
+
+def _scan_table(pages):
+    table = MagicMock()
+    table.select.return_value = table
+    table.order.return_value = table
+    table.range.return_value = table
+    table.execute = AsyncMock(side_effect=[MagicMock(data=page) for page in pages])
+    return table
+
+
+class TestAnalyticsCRUD:
+    """Tests for analytics CRUD operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_artist_credits_scans_every_page(self):
+        """Test the whole table is read in ordered pages until a short page."""
+        table = _scan_table([[{"artist_id": "a"}, {"artist_id": "b"}], [{"artist_id": "c"}]])
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = table
+
+        with (
+            patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.analytics.SCAN_PAGE_SIZE", 2),
+        ):
+            rows = await analytics.get_artist_credits()
+
+        assert [row["artist_id"] for row in rows] == ["a", "b", "c"]
+        table.order.assert_called_with("entry_id")
+        assert [c.args for c in table.range.call_args_list] == [(0, 1), (2, 3)]
+
+    @pytest.mark.asyncio
+    async def test_get_artist_persons_combines_solo_artists_and_members(self):
+        """Test solo artist persons and group members are both returned as artist and person pairs."""
+        artists_table = _scan_table([[{"artist_id": "solo", "person_id": "p1"}, {"artist_id": "group"}]])
+        memberships_table = _scan_table([[{"group_id": "group", "person_id": "p1"}]])
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = lambda name: {
+            "artists": artists_table,
+            "artist_memberships": memberships_table,
+        }[name]
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            pairs = await analytics.get_artist_persons()
+
+        assert pairs == [("solo", "p1"), ("group", "p1")]
+
+    @pytest.mark.asyncio
+    async def test_replace_related_artists_chunks_by_artist(self):
+        """Test related artists are replaced per chunk of artists, including artists without rows."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=None))
+        related = {"a": [{"artist_id": "a", "related_artist_id": "b", "rank": 1}]}
+
+        with (
+            patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.analytics.WRITE_CHUNK_SIZE", 2),
+        ):
+            await analytics.replace_related_artists(["a", "b", "c"], related)
+
+        calls = mock_supabase.rpc.call_args_list
+        assert calls[0].args == ("replace_artist_related", {"artist_ids": ["a", "b"], "payload": related["a"]})
+        assert calls[1].args == ("replace_artist_related", {"artist_ids": ["c"], "payload": []})
+
+    @pytest.mark.asyncio
+    async def test_replace_related_artists_api_error(self):
+        """Test Supabase errors while writing are raised as APIError."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError):
+                await analytics.replace_related_artists(["a"], {})
+
+    @pytest.mark.asyncio
+    async def test_get_work_features_orders_genres_by_composite_key(self):
+        """Test work genres are scanned in a stable order by both key columns."""
+        works_table = _scan_table([[{"work_id": "w1", "title": "Helios"}]])
+        genres_table = _scan_table([[{"work_id": "w1", "genre_id": "g1"}]])
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = lambda name: {"works": works_table, "work_genres": genres_table}[name]
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            works, work_genres = await analytics.get_work_features()
+
+        assert works == [{"work_id": "w1", "title": "Helios"}]
+        assert work_genres == [{"work_id": "w1", "genre_id": "g1"}]
+        assert [c.args for c in genres_table.order.call_args_list] == [("work_id",), ("genre_id",)]
+
+    @pytest.mark.asyncio
+    async def test_get_works_without_similarities(self):
+        """Test works not yet computed are scanned as UUIDs."""
+        table = _scan_table([[{"work_id": "w1"}]])
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = table
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            work_ids = await analytics.get_works_without_similarities()
+
+        mock_supabase.table.assert_called_once_with("works_without_similarities")
+        assert work_ids == ["w1"]
+
+    @pytest.mark.asyncio
+    async def test_get_work_similarity_floors(self):
+        """Test the stored similar work count and lowest score are keyed by work."""
+        table = _scan_table([[{"work_id": "w1", "neighbour_count": 3, "min_score": 0.25}]])
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = table
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            floors = await analytics.get_work_similarity_floors()
+
+        mock_supabase.table.assert_called_once_with("work_similarity_floors")
+        assert floors == {"w1": (3, 0.25)}
+
+    @pytest.mark.asyncio
+    async def test_get_works_listing_filters_by_similar_work(self):
+        """Test works listing any of the given works are returned once each."""
+        table = _scan_table([[{"work_id": "w1"}, {"work_id": "w1"}, {"work_id": "w2"}]])
+        table.in_.return_value = table
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = table
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            work_ids = await analytics.get_works_listing(["w3", "w4"])
+
+        mock_supabase.table.assert_called_once_with("work_similarities")
+        table.in_.assert_called_once_with("similar_work_id", ["w3", "w4"])
+        assert work_ids == ["w1", "w2"]
+
+    @pytest.mark.asyncio
+    async def test_get_persons_selects_names_and_dates(self):
+        """Test persons are scanned with the fields the duplicate persons job compares."""
+        table = _scan_table([[{"person_id": "p1", "legal_name": "Carl Nielsen"}]])
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value = table
+
+        with patch("music_catalogue.crud.analytics.get_supabase", AsyncMock(return_value=mock_supabase)):
+            rows = await analytics.get_persons()
+
+        table.select.assert_called_with("person_id, legal_name, alternative_names, birth_date, death_date")
+        assert rows == [{"person_id": "p1", "legal_name": "Carl Nielsen"}]
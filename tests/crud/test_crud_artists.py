@@ -7,8 +7,11 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 import pytest
 
 from music_catalogue.crud import artists
-from music_catalogue.models.inputs.artist_create import ArtistCreate, ArtistMembershipCreate, ArtistType
+from music_catalogue.models.exceptions import APIError, ConflictError
+from music_catalogue.models.inputs.artist_create import ArtistCreate, ArtistMembershipCreate, ArtistType, ArtistUpdate
+from music_catalogue.models.inputs.entity_merge import EntityMerge
 from music_catalogue.models.responses.artists import Artist
+from supabase import PostgrestAPIError
 
 
 class TestArtistsCRUD:
@@ -68,6 +71,27 @@ class TestArtistsCRUD:
             result = await artists.get_by_id(artist_id)
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_artists_by_ids_success(self, sample_uuid):
+        """Test retrieving several artists in one query, reporting missing IDs."""
+        missing_id = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+        mock_artists_data = [{"artist_id": sample_uuid, "display_name": "Carl Nielsen", "artist_type": "solo"}]
+
+        mock_supabase = MagicMock()
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.in_.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=MagicMock(data=mock_artists_data))
+        mock_supabase.table.return_value = query_builder
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await artists.get_by_ids([missing_id, sample_uuid])
+
+            mock_supabase.table.assert_called_once_with("artists")
+            query_builder.in_.assert_called_once_with("artist_id", [missing_id, sample_uuid])
+            assert [artist.id for artist in result.results] == [sample_uuid]
+            assert result.missing_ids == [missing_id]
+
     @pytest.mark.asyncio
     async def test_search_artists_success(self):
         """Test searching for artists with a valid query."""
@@ -234,3 +258,335 @@ class TestArtistsCRUD:
             memberships_table.insert.assert_called_once_with(expected_members_payload)
             mock_parse.assert_called_once_with(Artist, {"artist_id": "group-123"})
             mock_parse_list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_artist_insert_error(self):
+        """Test a failed artist insert raises an APIError without attempting a rollback."""
+        mock_supabase = MagicMock()
+        artists_table = MagicMock()
+        artists_table.insert.return_value = artists_table
+        artists_table.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+        mock_supabase.table.return_value = artists_table
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError, match="boom"):
+                await artists.create(
+                    ArtistCreate(
+                        artist_type=ArtistType.SOLO,
+                        display_name="Carl Nielsen",
+                        person_id="fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                    )
+                )
+
+        artists_table.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_artist_membership_error_rolls_back(self):
+        """Test a failed membership insert deletes the artist created."""
+        mock_supabase = MagicMock()
+        artists_table = MagicMock()
+        artists_table.insert.return_value = artists_table
+        artists_table.delete.return_value = artists_table
+        artists_table.eq.return_value = artists_table
+        artists_table.execute = AsyncMock(
+            side_effect=[
+                MagicMock(data=[{"artist_id": "group-123", "artist_type": "group", "display_name": "The Ensemble"}]),
+                MagicMock(data=[]),
+            ]
+        )
+        memberships_table = MagicMock()
+        memberships_table.insert.return_value = memberships_table
+        memberships_table.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+        table_map = {"artists": artists_table, "artist_memberships": memberships_table}
+        mock_supabase.table.side_effect = lambda name: table_map[name]
+
+        artist_data = ArtistCreate(
+            artist_type=ArtistType.GROUP,
+            display_name="The Ensemble",
+            members=[ArtistMembershipCreate(person_id="fe9032cc-1b14-402b-b5f5-0151176b1d1c")],
+        )
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError, match="boom"):
+                await artists.create(artist_data)
+
+        artists_table.eq.assert_called_once_with("artist_id", "group-123")
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_success(self):
+        """Test upserting artists sends a single upsert_artists call per chunk without memberships."""
+        artist_data = ArtistCreate(
+            artist_type=ArtistType.SOLO,
+            display_name="Carl Nielsen",
+            person_id="fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+        )
+
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[{"artist_id": "artist-1", "artist_type": "solo", "display_name": "Carl Nielsen"}]
+            )
+        )
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await artists.upsert_many([artist_data])
+
+        mock_supabase.rpc.assert_called_once_with(
+            "upsert_artists",
+            {
+                "payload": [
+                    {
+                        "artist_type": ArtistType.SOLO,
+                        "display_name": "Carl Nielsen",
+                        "person_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                    }
+                ]
+            },
+        )
+        assert [artist.id for artist in results] == ["artist-1"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_requires_person(self):
+        """Test artists without a person can't be upserted."""
+        artist_data = ArtistCreate(
+            artist_type=ArtistType.GROUP,
+            display_name="The Ensemble",
+            members=[ArtistMembershipCreate(person_id="fe9032cc-1b14-402b-b5f5-0151176b1d1c")],
+        )
+
+        with pytest.raises(ValueError, match="The Ensemble"):
+            await artists.upsert_many([artist_data])
+
+    @pytest.mark.asyncio
+    async def test_update_returns_detail_representation(self):
+        """Test updating an artist sends only the fields given and selects the detail shape from the write."""
+        mock_supabase = MagicMock()
+        artists_table = MagicMock()
+        artists_table.update.return_value = artists_table
+        artists_table.eq.return_value = artists_table
+        artists_table.select.return_value = artists_table
+        artists_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[{"artist_id": "artist-1", "artist_type": "solo", "display_name": "C. Nielsen"}]
+            )
+        )
+        mock_supabase.table.return_value = artists_table
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await artists.update(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c", ArtistUpdate(display_name="C. Nielsen")
+            )
+
+        artists_table.update.assert_called_once_with({"display_name": "C. Nielsen"})
+        artists_table.select.assert_called_once_with(artists._ARTIST_DETAIL_SELECT)
+        assert result.display_name == "C. Nielsen"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "code, error",
+        [("23514", ValueError), ("23505", ConflictError), ("XX000", APIError)],
+    )
+    async def test_update_maps_constraint_violations(self, code, error):
+        """Test a years check violation is invalid input and a display name collision is a conflict."""
+        mock_supabase = MagicMock()
+        artists_table = MagicMock()
+        artists_table.update.return_value = artists_table
+        artists_table.eq.return_value = artists_table
+        artists_table.select.return_value = artists_table
+        artists_table.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "violation", "code": code}))
+        mock_supabase.table.return_value = artists_table
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(error):
+                await artists.update("fe9032cc-1b14-402b-b5f5-0151176b1d1c", ArtistUpdate(start_year=1990))
+
+    @pytest.mark.asyncio
+    async def test_get_discography_pages_with_cursor(self):
+        """Test the discography asks for one extra entry and returns a cursor from the last entry of the page."""
+        rows = [
+            {
+                "entry_id": f"fe9032cc-1b14-402b-b5f5-0151176b1d1{i}",
+                "work_id": "work-1",
+                "work_title": "Symphony",
+                "role": "composer",
+                "year": 1900 + i,
+                "sort_year": 1900 + i,
+            }
+            for i in range(3)
+        ]
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=rows))
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            page = await artists.get_discography(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c", year_from=1900, roles=["composer"], page_size=2
+            )
+            await artists.get_discography("fe9032cc-1b14-402b-b5f5-0151176b1d1c", cursor=page.next_cursor, page_size=2)
+
+        first_call, second_call = mock_supabase.rpc.call_args_list
+        assert first_call.args[1]["page_size"] == 3
+        assert first_call.args[1]["roles"] == ["composer"]
+        assert second_call.args[1]["after_sort_year"] == 1901
+        assert second_call.args[1]["after_entry_id"] == "fe9032cc-1b14-402b-b5f5-0151176b1d11"
+        assert [entry.year for entry in page.results] == [1900, 1901]
+        assert page.next_cursor
+
+    @pytest.mark.asyncio
+    async def test_get_discography_last_page(self):
+        """Test the last page of the discography has no cursor."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=[{"entry_id": "entry-1", "role": "primary_artist", "sort_year": 2147483647}])
+        )
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            page = await artists.get_discography("fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+
+        assert len(page.results) == 1
+        assert page.results[0].year is None
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_get_discography_invalid_input(self):
+        """Test invalid year ranges and cursors are rejected before querying."""
+        with pytest.raises(ValueError, match="Start year"):
+            await artists.get_discography("fe9032cc-1b14-402b-b5f5-0151176b1d1c", year_from=2000, year_to=1990)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await artists.get_discography("fe9032cc-1b14-402b-b5f5-0151176b1d1c", cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_get_members_at_year_filters_by_active_range(self):
+        """Test members active in a year are matched by overlapping their active years range."""
+        mock_supabase = MagicMock()
+        memberships_table = MagicMock()
+        memberships_table.select.return_value = memberships_table
+        memberships_table.eq.return_value = memberships_table
+        memberships_table.filter.return_value = memberships_table
+        memberships_table.order.return_value = memberships_table
+        memberships_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    {
+                        "membership_id": "membership-1",
+                        "start_year": 1962,
+                        "end_year": 1970,
+                        "person": {"person_id": "person-1", "legal_name": "John Lennon"},
+                    }
+                ]
+            )
+        )
+        mock_supabase.table.return_value = memberships_table
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            members = await artists.get_members("fe9032cc-1b14-402b-b5f5-0151176b1d1c", 1969)
+
+        mock_supabase.table.assert_called_once_with("artist_memberships")
+        memberships_table.eq.assert_called_once_with("group_id", "fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+        memberships_table.filter.assert_called_once_with("active_years", "ov", "[1969,1969]")
+        assert members[0].person.legal_name == "John Lennon"
+
+    @pytest.mark.asyncio
+    async def test_get_members_without_year(self):
+        """Test every member is returned when no year is given."""
+        mock_supabase = MagicMock()
+        memberships_table = MagicMock()
+        memberships_table.select.return_value = memberships_table
+        memberships_table.eq.return_value = memberships_table
+        memberships_table.order.return_value = memberships_table
+        memberships_table.execute = AsyncMock(return_value=MagicMock(data=[]))
+        mock_supabase.table.return_value = memberships_table
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            members = await artists.get_members("fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+
+        memberships_table.filter.assert_not_called()
+        assert members == []
+
+    @pytest.mark.asyncio
+    async def test_get_related_reads_precomputed_rows(self):
+        """Test related artists are a single ranked lookup on the precomputed table."""
+        mock_supabase = MagicMock()
+        related_table = MagicMock()
+        related_table.select.return_value = related_table
+        related_table.eq.return_value = related_table
+        related_table.order.return_value = related_table
+        related_table.limit.return_value = related_table
+        related_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    {
+                        "rank": 1,
+                        "score": 3.0,
+                        "shared_works": 1,
+                        "shared_versions": 0,
+                        "shared_members": 1,
+                        "related": {"artist_id": "artist-2", "artist_type": "group", "display_name": "The Band"},
+                    }
+                ]
+            )
+        )
+        mock_supabase.table.return_value = related_table
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            related = await artists.get_related("fe9032cc-1b14-402b-b5f5-0151176b1d1c", 5)
+
+        mock_supabase.table.assert_called_once_with("artist_related")
+        related_table.order.assert_called_once_with("rank")
+        related_table.limit.assert_called_once_with(5)
+        assert related[0].artist.display_name == "The Band"
+        assert related[0].shared_members == 1
+
+    @pytest.mark.asyncio
+    async def test_get_related_invalid_limit(self):
+        """Test limits over the number of stored related artists are rejected."""
+        with pytest.raises(ValueError, match="Invalid limit"):
+            await artists.get_related("fe9032cc-1b14-402b-b5f5-0151176b1d1c", artists.MAX_RELATED_ARTISTS + 1)
+
+    @pytest.mark.asyncio
+    async def test_merge_calls_rpc(self):
+        """Test merging artists runs the merge function with the target and duplicates."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    {
+                        "artist_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                        "artist_type": "group",
+                        "display_name": "The Beatles",
+                        "alternative_names": ["Beatles"],
+                    }
+                ]
+            )
+        )
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            artist = await artists.merge(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                EntityMerge(duplicate_ids=["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]),
+            )
+
+        mock_supabase.rpc.assert_called_once_with(
+            "merge_artists",
+            {
+                "target_artist_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                "duplicate_artist_ids": ["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"],
+            },
+        )
+        assert artist.alternative_names == ["Beatles"]
+
+    @pytest.mark.asyncio
+    async def test_merge_different_artist_types(self):
+        """Test merging a group into a solo artist, refused by the merge function, is invalid input."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            side_effect=PostgrestAPIError(
+                {"message": "Artists {0f5b2f5e} aren't of the same type as artist fe9032cc", "code": "22023"}
+            )
+        )
+
+        with patch("music_catalogue.crud.artists.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(ValueError, match="same type"):
+                await artists.merge(
+                    "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                    EntityMerge(duplicate_ids=["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]),
+                )
@@ -82,3 +82,30 @@ class TestAssetsCRUD:
             result = await assets.get_external_links_raw(entity_type, entity_id)
 
             assert result == []
+
+    @pytest.mark.asyncio
+    async def test_get_external_links_by_entity_ids_groups_links(self):
+        """Test retrieving external links for several entities in one query."""
+        mock_links_data = [
+            {"link_id": "link-1", "entity_id": "work-1", "label": "IMSLP", "url": "https://imslp.org/work"},
+            {"link_id": "link-2", "entity_id": "work-2", "label": "CNW", "url": "https://example.com/cnw"},
+            {"link_id": "link-3", "entity_id": "work-1", "label": "Wikipedia", "url": "https://en.wikipedia.org"},
+        ]
+
+        mock_supabase = MagicMock()
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.in_.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=MagicMock(data=mock_links_data))
+        mock_supabase.table.return_value = query_builder
+
+        with (
+            patch("music_catalogue.crud.assets.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.assets.validate_uuid", return_value=None),
+        ):
+            result = await assets.get_external_links_raw_by_entity_ids(EntityType.WORK, ["work-1", "work-2"])
+
+            query_builder.in_.assert_called_once_with("entity_id", ["work-1", "work-2"])
+            assert [link["link_id"] for link in result["work-1"]] == ["link-1", "link-3"]
+            assert [link["link_id"] for link in result["work-2"]] == ["link-2"]
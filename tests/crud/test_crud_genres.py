@@ -0,0 +1,114 @@
+"""
+Unit tests for the in-memory genre registry in the genres CRUD module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from music_catalogue.crud import genres
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.works import Genre
+from supabase import PostgrestAPIError
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Start every test with an empty, stale registry."""
+    genres._registry = {}
+    genres._loaded_at = None
+    yield
+    genres._registry = {}
+    genres._loaded_at = None
+
+
+def _mock_supabase(data):
+    mock_supabase = MagicMock()
+    query_builder = MagicMock()
+    query_builder.select.return_value = query_builder
+    query_builder.order.return_value = query_builder
+    query_builder.execute = AsyncMock(return_value=MagicMock(data=data))
+    mock_supabase.table.return_value = query_builder
+    return mock_supabase, query_builder
+
+
+class TestGenreRegistry:
+    """Tests for genre registry operations."""
+
+    @pytest.mark.asyncio
+    async def test_load_replaces_registry(self):
+        """Test loading all genres into the registry."""
+        mock_supabase, _ = _mock_supabase(
+            [{"genre_id": "genre-1", "name": "Classical"}, {"genre_id": "genre-2", "name": "Jazz"}]
+        )
+
+        with patch("music_catalogue.crud.genres.get_supabase", AsyncMock(return_value=mock_supabase)):
+            registry = await genres.load()
+
+        mock_supabase.table.assert_called_once_with("genres")
+        assert list(registry.keys()) == ["genre-1", "genre-2"]
+        assert registry["genre-1"] == Genre(id="genre-1", name="Classical")
+
+    @pytest.mark.asyncio
+    async def test_load_api_error(self):
+        """Test Supabase errors surface as APIError."""
+        mock_supabase, query_builder = _mock_supabase([])
+        query_builder.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.genres.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError):
+                await genres.load()
+
+    @pytest.mark.asyncio
+    async def test_get_all_served_from_memory(self):
+        """Test the registry is only loaded once while fresh."""
+        mock_supabase, query_builder = _mock_supabase([{"genre_id": "genre-1", "name": "Classical"}])
+
+        with patch("music_catalogue.crud.genres.get_supabase", AsyncMock(return_value=mock_supabase)):
+            first = await genres.get_all()
+            second = await genres.get_all()
+
+        assert first == second == [Genre(id="genre-1", name="Classical")]
+        query_builder.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resolve_preserves_order(self):
+        """Test resolving IDs returns genres in the order given."""
+        mock_supabase, _ = _mock_supabase(
+            [{"genre_id": "genre-1", "name": "Classical"}, {"genre_id": "genre-2", "name": "Jazz"}]
+        )
+
+        with patch("music_catalogue.crud.genres.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await genres.resolve(["genre-2", "genre-1"])
+
+        assert [genre.name for genre in result] == ["Jazz", "Classical"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_empty_skips_load(self):
+        """Test resolving no IDs doesn't touch Supabase."""
+        with patch("music_catalogue.crud.genres.get_supabase", new_callable=AsyncMock) as mock_get_supabase:
+            result = await genres.resolve([])
+
+        assert result == []
+        mock_get_supabase.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resolve_unknown_id_reloads(self):
+        """Test an unknown genre ID triggers a reload to pick up new genres."""
+        mock_supabase, query_builder = _mock_supabase([])
+        query_builder.execute = AsyncMock(
+            side_effect=[
+                MagicMock(data=[{"genre_id": "genre-1", "name": "Classical"}]),
+                MagicMock(data=[{"genre_id": "genre-1", "name": "Classical"}, {"genre_id": "genre-2", "name": "Jazz"}]),
+            ]
+        )
+
+        with (
+            patch("music_catalogue.crud.genres.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.genres.MISS_RELOAD_INTERVAL_SECONDS", 0),
+        ):
+            await genres.get_all()
+            result = await genres.resolve(["genre-2"])
+
+        assert result == [Genre(id="genre-2", name="Jazz")]
+        assert query_builder.execute.await_count == 2
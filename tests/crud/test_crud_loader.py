@@ -0,0 +1,145 @@
+"""
+Unit tests for the request-scoped entity loader.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from music_catalogue.crud import loader
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.types import EntityType
+from supabase import PostgrestAPIError
+
+PERSON_1 = "fe9032cc-1b14-402b-b5f5-0151176b1d1c"
+PERSON_2 = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+MISSING = "7d8c3f7e-2f0e-4d25-a8b1-61c3e4d5f6a7"
+
+
+def _mock_supabase(data):
+    mock_supabase = MagicMock()
+    query_builder = MagicMock()
+    query_builder.select.return_value = query_builder
+    query_builder.in_.return_value = query_builder
+    query_builder.execute = AsyncMock(return_value=MagicMock(data=data))
+    mock_supabase.table.return_value = query_builder
+    return mock_supabase, query_builder
+
+
+class TestEntityLoader:
+    """Tests for batched, memoized entity loading."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_same_tick_are_batched(self):
+        """Test concurrent loads are collapsed into a single in_() query."""
+        mock_supabase, query_builder = _mock_supabase(
+            [
+                {"person_id": PERSON_1, "legal_name": "Carl Nielsen"},
+                {"person_id": PERSON_2, "legal_name": "Anne Marie Carl-Nielsen"},
+            ]
+        )
+        entity_loader = loader.EntityLoader()
+
+        async def resolve(id):
+            return await entity_loader.load(EntityType.PERSON, id)
+
+        with patch("music_catalogue.crud.loader.get_supabase", AsyncMock(return_value=mock_supabase)):
+            first, second, missing = await asyncio.gather(resolve(PERSON_1), resolve(PERSON_2), resolve(MISSING))
+
+        mock_supabase.table.assert_called_once_with("persons")
+        query_builder.in_.assert_called_once_with("person_id", [PERSON_1, PERSON_2, MISSING])
+        assert first.legal_name == "Carl Nielsen"
+        assert second.legal_name == "Anne Marie Carl-Nielsen"
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_results_are_memoized(self):
+        """Test loading the same entity again doesn't query Supabase."""
+        mock_supabase, query_builder = _mock_supabase([{"person_id": PERSON_1, "legal_name": "Carl Nielsen"}])
+        entity_loader = loader.EntityLoader()
+
+        with patch("music_catalogue.crud.loader.get_supabase", AsyncMock(return_value=mock_supabase)):
+            first = await entity_loader.load(EntityType.PERSON, PERSON_1)
+            again = await entity_loader.load(EntityType.PERSON, PERSON_1)
+
+        assert first is again
+        query_builder.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_entity_type(self):
+        """Test loads for different entity types in the same tick run one query each."""
+        mock_supabase, query_builder = _mock_supabase([])
+        entity_loader = loader.EntityLoader()
+
+        with patch("music_catalogue.crud.loader.get_supabase", AsyncMock(return_value=mock_supabase)):
+            await asyncio.gather(
+                entity_loader.load_many(EntityType.PERSON, [PERSON_1, PERSON_2]),
+                entity_loader.load(EntityType.ARTIST, MISSING),
+            )
+
+        assert sorted(call.args[0] for call in mock_supabase.table.call_args_list) == ["artists", "persons"]
+        assert query_builder.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_loads_raise_and_are_not_memoized(self):
+        """Test Supabase errors surface as APIError and can be retried."""
+        mock_supabase, query_builder = _mock_supabase([])
+        query_builder.execute = AsyncMock(
+            side_effect=[
+                PostgrestAPIError({"message": "boom"}),
+                MagicMock(data=[{"person_id": PERSON_1, "legal_name": "Carl Nielsen"}]),
+            ]
+        )
+        entity_loader = loader.EntityLoader()
+
+        with patch("music_catalogue.crud.loader.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError):
+                await entity_loader.load(EntityType.PERSON, PERSON_1)
+
+            person = await entity_loader.load(EntityType.PERSON, PERSON_1)
+
+        assert person.legal_name == "Carl Nielsen"
+
+    @pytest.mark.asyncio
+    async def test_invalid_uuid_raises(self):
+        """Test invalid IDs are rejected before being queued."""
+        with pytest.raises(ValueError):
+            loader.EntityLoader().load(EntityType.PERSON, "not-a-uuid")
+
+    def test_request_scope_binds_fresh_loader(self):
+        """Test each request scope gets its own loader."""
+        with loader.request_scope() as first:
+            assert loader.get_loader() is first
+        with loader.request_scope() as second:
+            assert loader.get_loader() is second
+
+        assert first is not second
+
+    def test_get_loader_outside_request_scope_is_unbound(self):
+        """Test loaders created outside a request scope aren't kept in the context."""
+        assert loader.get_loader() is not loader.get_loader()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_fetch_settles_waiting_loads(self):
+        """Test cancelling a dispatched query cancels its loads instead of leaving them pending, and allows retries."""
+        started = asyncio.Event()
+
+        async def slow_execute():
+            started.set()
+            await asyncio.sleep(10)
+
+        mock_supabase, query_builder = _mock_supabase([])
+        query_builder.execute = slow_execute
+        entity_loader = loader.EntityLoader()
+
+        with patch("music_catalogue.crud.loader.get_supabase", AsyncMock(return_value=mock_supabase)):
+            pending = entity_loader.load(EntityType.PERSON, PERSON_1)
+            await started.wait()
+            for task in list(entity_loader._dispatches):
+                task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+
+        assert (EntityType.PERSON, PERSON_1) not in entity_loader._cache
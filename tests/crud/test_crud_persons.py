@@ -7,8 +7,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from music_catalogue.crud import persons
-from music_catalogue.models.inputs.person_create import PersonCreate
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.inputs.entity_merge import EntityMerge
+from music_catalogue.models.inputs.person_create import PersonCreate, PersonUpdate
+from music_catalogue.models.inputs.person_resolve import PersonResolve
 from music_catalogue.models.responses.persons import Person
+from music_catalogue.models.types import BulkItemStatus, CreditPath, NameMatchType
+from supabase import PostgrestAPIError
 
 
 class TestPersonsCRUD:
@@ -67,6 +72,27 @@ class TestPersonsCRUD:
             result = await persons.get_by_id(person_id)
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_persons_by_ids_success(self, sample_uuid):
+        """Test retrieving several persons in one query, reporting missing IDs."""
+        missing_id = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+        mock_persons_data = [{"person_id": sample_uuid, "legal_name": "Carl Nielsen"}]
+
+        mock_supabase = MagicMock()
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.in_.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=MagicMock(data=mock_persons_data))
+        mock_supabase.table.return_value = query_builder
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await persons.get_by_ids([sample_uuid, missing_id])
+
+            mock_supabase.table.assert_called_once_with("persons")
+            query_builder.in_.assert_called_once_with("person_id", [sample_uuid, missing_id])
+            assert [person.id for person in result.results] == [sample_uuid]
+            assert result.missing_ids == [missing_id]
+
     @pytest.mark.asyncio
     async def test_search_persons_success(self):
         """Test searching for persons with a valid query."""
@@ -174,3 +200,381 @@ class TestPersonsCRUD:
             mock_supabase.table.assert_called_once_with("persons")
             persons_table.insert.assert_called_once_with(expected_payload)
             mock_parse.assert_called_once_with(Person, {"person_id": "person-uuid"})
+
+    @pytest.mark.asyncio
+    async def test_create_many_one_insert_per_chunk(self):
+        """Test bulk creation sends one insert per chunk and keeps input order."""
+        people_data = [PersonCreate(legal_name=f"Person {index}") for index in range(5)]
+
+        mock_supabase = MagicMock()
+        persons_table = MagicMock()
+        # Return the rows in reverse so results have to be matched to inputs by ID
+        persons_table.insert.side_effect = lambda rows: MagicMock(
+            execute=AsyncMock(
+                return_value=MagicMock(
+                    data=[{"person_id": row["person_id"], "legal_name": row["legal_name"]} for row in reversed(rows)]
+                )
+            )
+        )
+        mock_supabase.table.return_value = persons_table
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await persons.create_many(people_data, chunk_size=2)
+
+            assert persons_table.insert.call_count == 3
+            assert [result.index for result in results] == [0, 1, 2, 3, 4]
+            assert all(result.status == BulkItemStatus.CREATED for result in results)
+            assert [result.result.legal_name for result in results] == [person.legal_name for person in people_data]
+
+    @pytest.mark.asyncio
+    async def test_create_many_failed_chunk_reported_per_item(self):
+        """Test a failing chunk marks only its own items as failed."""
+        people_data = [PersonCreate(legal_name=f"Person {index}") for index in range(3)]
+
+        def insert_side_effect(rows):
+            if rows[0]["legal_name"] == "Person 2":
+                return MagicMock(execute=AsyncMock(side_effect=PostgrestAPIError({"message": "boom"})))
+            return MagicMock(
+                execute=AsyncMock(
+                    return_value=MagicMock(
+                        data=[{"person_id": row["person_id"], "legal_name": row["legal_name"]} for row in rows]
+                    )
+                )
+            )
+
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value.insert.side_effect = insert_side_effect
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await persons.create_many(people_data, chunk_size=2)
+
+            assert [result.status for result in results] == [
+                BulkItemStatus.CREATED,
+                BulkItemStatus.CREATED,
+                BulkItemStatus.FAILED,
+            ]
+            assert results[2].result is None
+            assert "boom" in results[2].error
+
+    @pytest.mark.asyncio
+    async def test_create_many_unexpected_error_reported_per_chunk(self):
+        """Test errors other than database errors, like timeouts, fail their chunk instead of the whole request."""
+        people_data = [PersonCreate(legal_name=f"Person {index}") for index in range(3)]
+
+        def insert_side_effect(rows):
+            if rows[0]["legal_name"] == "Person 2":
+                return MagicMock(execute=AsyncMock(side_effect=TimeoutError("read timed out")))
+            return MagicMock(
+                execute=AsyncMock(
+                    return_value=MagicMock(
+                        data=[{"person_id": row["person_id"], "legal_name": row["legal_name"]} for row in rows]
+                    )
+                )
+            )
+
+        mock_supabase = MagicMock()
+        mock_supabase.table.return_value.insert.side_effect = insert_side_effect
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await persons.create_many(people_data, chunk_size=2)
+
+            assert [result.status for result in results] == [
+                BulkItemStatus.CREATED,
+                BulkItemStatus.CREATED,
+                BulkItemStatus.FAILED,
+            ]
+            assert results[2].error == "Chunk failed with TimeoutError: read timed out"
+
+    @pytest.mark.asyncio
+    async def test_create_many_invalid_chunk_size(self):
+        """Test an invalid chunk size is rejected."""
+        with pytest.raises(ValueError):
+            await persons.create_many([PersonCreate(legal_name="Person")], chunk_size=0)
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_one_rpc_per_chunk(self):
+        """Test upserting sends one upsert_persons call per chunk and keeps input order."""
+        people_data = [
+            PersonCreate(legal_name=name) for name in ["Carl Nielsen", "Anne Marie Carl-Nielsen", "Carl Nielsen"]
+        ]
+
+        def rpc_side_effect(function_name, params):
+            return MagicMock(
+                execute=AsyncMock(
+                    return_value=MagicMock(
+                        data=[
+                            {"person_id": f"id-{row['legal_name']}", "legal_name": row["legal_name"]}
+                            for row in params["payload"]
+                        ]
+                    )
+                )
+            )
+
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.side_effect = rpc_side_effect
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await persons.upsert_many(people_data, chunk_size=2)
+
+        assert mock_supabase.rpc.call_count == 2
+        assert mock_supabase.rpc.call_args_list[0].args == (
+            "upsert_persons",
+            {"payload": [{"legal_name": "Carl Nielsen"}, {"legal_name": "Anne Marie Carl-Nielsen"}]},
+        )
+        assert [person.id for person in results] == [
+            "id-Carl Nielsen",
+            "id-Anne Marie Carl-Nielsen",
+            "id-Carl Nielsen",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_api_error(self):
+        """Test Supabase errors while upserting are raised as APIError."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError, match="boom"):
+                await persons.upsert_many([PersonCreate(legal_name="Carl Nielsen")])
+
+    @pytest.mark.asyncio
+    async def test_resolve_names_groups_candidates_by_name(self):
+        """Test name resolution runs one query and groups the ranked candidates under each name in order."""
+        resolve_data = PersonResolve(names=["Carl Nielsen", "Unknown Person", "C. Nielsen"], candidate_limit=3)
+
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    {
+                        "name_index": 1,
+                        "name": "Carl Nielsen",
+                        "person_id": "person-1",
+                        "legal_name": "Carl Nielsen",
+                        "match_type": "exact",
+                        "score": 1.0,
+                    },
+                    {"name_index": 2, "name": "Unknown Person", "person_id": None},
+                    {
+                        "name_index": 3,
+                        "name": "C. Nielsen",
+                        "person_id": "person-1",
+                        "legal_name": "Carl Nielsen",
+                        "match_type": "similar",
+                        "score": 0.6,
+                    },
+                ]
+            )
+        )
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await persons.resolve_names(resolve_data)
+
+        mock_supabase.rpc.assert_called_once_with(
+            "resolve_person_names",
+            {"names": resolve_data.names, "candidate_limit": 3, "min_score": 0.3},
+        )
+        assert [result.name for result in results] == resolve_data.names
+        assert results[0].candidates[0].match_type == NameMatchType.EXACT
+        assert results[1].candidates == []
+        assert results[2].candidates[0].person.id == "person-1"
+        assert results[2].candidates[0].score == 0.6
+
+    @pytest.mark.asyncio
+    async def test_update_writes_only_set_fields(self):
+        """Test updating a person sends only the fields given and returns the row from the write."""
+        mock_supabase = MagicMock()
+        persons_table = MagicMock()
+        persons_table.update.return_value = persons_table
+        persons_table.eq.return_value = persons_table
+        persons_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[{"person_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c", "legal_name": "Carl Nielsen"}]
+            )
+        )
+        mock_supabase.table.return_value = persons_table
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await persons.update(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c", PersonUpdate(legal_name="Carl Nielsen")
+            )
+
+        persons_table.update.assert_called_once_with({"legal_name": "Carl Nielsen"})
+        persons_table.eq.assert_called_once_with("person_id", "fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+        assert result.legal_name == "Carl Nielsen"
+
+    @pytest.mark.asyncio
+    async def test_update_not_found(self):
+        """Test updating a person that doesn't exist returns None."""
+        mock_supabase = MagicMock()
+        persons_table = MagicMock()
+        persons_table.update.return_value = persons_table
+        persons_table.eq.return_value = persons_table
+        persons_table.execute = AsyncMock(return_value=MagicMock(data=[]))
+        mock_supabase.table.return_value = persons_table
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await persons.update("fe9032cc-1b14-402b-b5f5-0151176b1d1c", PersonUpdate(notes="Danish composer"))
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_update_dates_out_of_order_with_stored_row(self):
+        """Test a death date before the stored birth date, rejected by the check, is invalid input."""
+        mock_supabase = MagicMock()
+        persons_table = MagicMock()
+        persons_table.update.return_value = persons_table
+        persons_table.eq.return_value = persons_table
+        persons_table.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "violation", "code": "23514"}))
+        mock_supabase.table.return_value = persons_table
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(ValueError, match="Birth date should be before or equal to death date"):
+                await persons.update("fe9032cc-1b14-402b-b5f5-0151176b1d1c", PersonUpdate(death_date="1800-01-01"))
+
+    @pytest.mark.asyncio
+    async def test_get_works_pages_with_cursor(self):
+        """Test person works are parsed with their credit paths and paged by the last work's year and ID."""
+        rows = [
+            {
+                "work_id": f"fe9032cc-1b14-402b-b5f5-0151176b1d1{i}",
+                "title": f"Symphony No. {i + 1}",
+                "origin_year_start": 1890 + i,
+                "roles": ["composer"],
+                "credited_as": ["artist", "direct"],
+                "sort_year": 1890 + i,
+            }
+            for i in range(3)
+        ]
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=rows))
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            page = await persons.get_works("fe9032cc-1b14-402b-b5f5-0151176b1d1c", page_size=2)
+            await persons.get_works("fe9032cc-1b14-402b-b5f5-0151176b1d1c", cursor=page.next_cursor, page_size=2)
+
+        first_call, second_call = mock_supabase.rpc.call_args_list
+        assert first_call.args == (
+            "person_works_page",
+            {
+                "target_person_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                "after_sort_year": None,
+                "after_work_id": None,
+                "page_size": 3,
+            },
+        )
+        assert second_call.args[1]["after_sort_year"] == 1891
+        assert second_call.args[1]["after_work_id"] == "fe9032cc-1b14-402b-b5f5-0151176b1d11"
+        assert [work.title for work in page.results] == ["Symphony No. 1", "Symphony No. 2"]
+        assert page.results[0].credited_as == [CreditPath.ARTIST, CreditPath.DIRECT]
+
+    @pytest.mark.asyncio
+    async def test_get_works_api_error(self):
+        """Test Supabase errors while listing person works are raised as APIError."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError):
+                await persons.get_works("fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+
+    @pytest.mark.asyncio
+    async def test_get_memberships_at_year(self):
+        """Test a person's groups in a year are matched by overlapping their active years range."""
+        mock_supabase = MagicMock()
+        memberships_table = MagicMock()
+        memberships_table.select.return_value = memberships_table
+        memberships_table.eq.return_value = memberships_table
+        memberships_table.filter.return_value = memberships_table
+        memberships_table.order.return_value = memberships_table
+        memberships_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    {
+                        "membership_id": "membership-1",
+                        "artist": {"artist_id": "artist-1", "artist_type": "group", "display_name": "The Beatles"},
+                    }
+                ]
+            )
+        )
+        mock_supabase.table.return_value = memberships_table
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            memberships = await persons.get_memberships("fe9032cc-1b14-402b-b5f5-0151176b1d1c", 1969)
+
+        memberships_table.eq.assert_called_once_with("person_id", "fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+        memberships_table.filter.assert_called_once_with("active_years", "ov", "[1969,1969]")
+        assert memberships[0].artist.display_name == "The Beatles"
+
+    @pytest.mark.asyncio
+    async def test_get_memberships_invalid_year(self):
+        """Test invalid years are rejected."""
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=MagicMock())):
+            with pytest.raises(ValueError, match="Invalid year"):
+                await persons.get_memberships("fe9032cc-1b14-402b-b5f5-0151176b1d1c", 0)
+
+    @pytest.mark.asyncio
+    async def test_merge_calls_rpc(self):
+        """Test merging persons runs one RPC and returns the merged person."""
+        duplicate_id = "0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[
+                    {
+                        "person_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                        "legal_name": "Carl Nielsen",
+                        "alternative_names": ["Nielsen, Carl"],
+                    }
+                ]
+            )
+        )
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            person = await persons.merge(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c", EntityMerge(duplicate_ids=[duplicate_id])
+            )
+
+        mock_supabase.rpc.assert_called_once_with(
+            "merge_persons",
+            {"target_person_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c", "duplicate_person_ids": [duplicate_id]},
+        )
+        assert person.alternative_names == ["Nielsen, Carl"]
+
+    @pytest.mark.asyncio
+    async def test_merge_into_itself_raises(self):
+        """Test a person can't be merged into itself."""
+        with pytest.raises(ValueError, match="into itself"):
+            await persons.merge(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                EntityMerge(duplicate_ids=["fe9032cc-1b14-402b-b5f5-0151176b1d1c"]),
+            )
+
+    @pytest.mark.asyncio
+    async def test_merge_missing_duplicate_raises_validation_error(self):
+        """Test missing duplicates reported by the merge function are raised as validation errors."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            side_effect=PostgrestAPIError({"message": "Persons {x} not found", "code": "P0002"})
+        )
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(ValueError, match="not found"):
+                await persons.merge(
+                    "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                    EntityMerge(duplicate_ids=["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]),
+                )
+
+    @pytest.mark.asyncio
+    async def test_merge_missing_target_returns_none(self):
+        """Test merging into a person that doesn't exist returns None."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=[]))
+
+        with patch("music_catalogue.crud.persons.get_supabase", AsyncMock(return_value=mock_supabase)):
+            person = await persons.merge(
+                "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                EntityMerge(duplicate_ids=["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]),
+            )
+
+        assert person is None
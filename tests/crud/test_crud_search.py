@@ -2,13 +2,16 @@
 Unit tests for CRUD operations on unified search.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from music_catalogue.crud.search import unified_search
-from music_catalogue.models.responses.search import UnifiedSearchResult
+from music_catalogue.crud.search import hydrate_summaries, parse_catalogue_number, suggest, unified_search
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.search import ArtistSummary, Suggestion, UnifiedSearchResult, WorkSummary
 from music_catalogue.models.types import EntityType
+from supabase import PostgrestAPIError
 
 
 class TestUnifiedSearch:
@@ -73,3 +76,225 @@ class TestUnifiedSearch:
             mock_rpc.execute.assert_awaited_once()
             mock_parse.assert_called_once_with(UnifiedSearchResult, [])
             assert result == []
+
+    @pytest.mark.asyncio
+    async def test_unified_search_filters_entity_types(self):
+        """Test entity type filters are applied to the RPC query."""
+        mock_supabase = MagicMock()
+        mock_rpc = MagicMock()
+        mock_rpc.select.return_value = mock_rpc
+        mock_rpc.in_.return_value = mock_rpc
+        mock_rpc.execute = AsyncMock(return_value=MagicMock(data=[]))
+        mock_supabase.rpc = MagicMock(return_value=mock_rpc)
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            await unified_search("test", entity_types=[EntityType.WORK, EntityType.PERSON])
+
+            mock_rpc.in_.assert_called_once_with("entity_type", ["work", "person"])
+
+
+class TestCatalogueNumberSearch:
+    """Tests for the exact catalogue number fast path of unified search."""
+
+    @staticmethod
+    def _mock_supabase(identifier_rows):
+        mock_supabase = MagicMock()
+        identifier_rpc = MagicMock()
+        identifier_rpc.execute = AsyncMock(return_value=MagicMock(data=identifier_rows))
+        search_rpc = MagicMock()
+        search_rpc.select.return_value.execute = AsyncMock(return_value=MagicMock(data=[]))
+        search_rpc.select.return_value.in_.return_value.execute = AsyncMock(return_value=MagicMock(data=[]))
+        mock_supabase.rpc.side_effect = lambda name, params: (
+            identifier_rpc if name == "search_work_identifiers" else search_rpc
+        )
+        return mock_supabase
+
+    @staticmethod
+    def _rpc_names(mock_supabase):
+        return [call.args[0] for call in mock_supabase.rpc.call_args_list]
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("CNW 27", ("CNW", "27")),
+            (" Op. 40 ", ("Op.", "40")),
+            ("BWV1006a", ("BWV", "1006a")),
+            ("op 27/2", ("op", "27/2")),
+            ("kv525", ("kv", "525")),
+            ("Symphony 5", None),
+            ("No. 4", None),
+            ("Saul og David", None),
+            ("nielsen", None),
+            ("27", None),
+        ],
+    )
+    def test_parse_catalogue_number(self, query, expected):
+        """Test only a known catalogue label followed by a number is taken as a catalogue number."""
+        assert parse_catalogue_number(query) == expected
+
+    @pytest.mark.asyncio
+    async def test_identifier_hit_skips_full_text_search(self):
+        """Test an exact identifier hit is returned without calling the search RPC."""
+        mock_supabase = self._mock_supabase([{"work_id": "work-1", "title": "Saul og David"}])
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await unified_search("CNW 27", limit=5)
+
+            assert result == [
+                UnifiedSearchResult(
+                    entity_type=EntityType.WORK, entity_id="work-1", display_text="Saul og David", rank=1.0
+                )
+            ]
+            mock_supabase.rpc.assert_called_once_with(
+                "search_work_identifiers", {"label_text": "CNW", "value_text": "27", "fetch_limit": 5}
+            )
+
+    @pytest.mark.asyncio
+    async def test_lower_case_label_looked_up_once(self):
+        """Test a label typed in lower case is looked up as typed in a single case-insensitive query."""
+        mock_supabase = self._mock_supabase([{"work_id": "work-1", "title": "Saul og David"}])
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await unified_search("cnw 27")
+
+            assert [item.entity_id for item in result] == ["work-1"]
+            mock_supabase.rpc.assert_called_once_with(
+                "search_work_identifiers", {"label_text": "cnw", "value_text": "27", "fetch_limit": 20}
+            )
+
+    @pytest.mark.asyncio
+    async def test_identifier_miss_falls_back_to_full_text_search(self):
+        """Test catalogue numbers without an identifier hit go through full-text search."""
+        mock_supabase = self._mock_supabase([])
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await unified_search("CNW 999")
+
+            assert result == []
+            assert self._rpc_names(mock_supabase) == ["search_work_identifiers", "unified_search"]
+            mock_supabase.rpc.assert_called_with("unified_search", {"query_text": "CNW+999", "fetch_limit": 20})
+
+    @pytest.mark.asyncio
+    async def test_word_and_number_skips_identifier_lookup(self):
+        """Test a query like "Symphony 5" goes straight to full-text search."""
+        mock_supabase = self._mock_supabase([{"work_id": "work-1", "title": "Saul og David"}])
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            await unified_search("Symphony 5")
+
+            assert self._rpc_names(mock_supabase) == ["unified_search"]
+
+    @pytest.mark.asyncio
+    async def test_identifier_lookup_skipped_without_works(self):
+        """Test the identifier lookup is skipped when works aren't among the searched entity types."""
+        mock_supabase = self._mock_supabase([{"work_id": "work-1", "title": "Saul og David"}])
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            await unified_search("CNW 27", [EntityType.PERSON])
+
+            assert self._rpc_names(mock_supabase) == ["unified_search"]
+
+
+class TestHydrateSummaries:
+    """Tests for hydrating unified search results with entity summaries."""
+
+    @pytest.mark.asyncio
+    async def test_hydrate_summaries_one_query_per_entity_type(self):
+        """Test summaries are loaded with a single query for each entity type present."""
+        results = [
+            UnifiedSearchResult(
+                entity_type=EntityType.WORK, entity_id="work-1", display_text="Saul og David", rank=0.9
+            ),
+            UnifiedSearchResult(entity_type=EntityType.ARTIST, entity_id="artist-1", display_text="Nielsen", rank=0.8),
+            UnifiedSearchResult(entity_type=EntityType.WORK, entity_id="work-2", display_text="Maskarade", rank=0.7),
+        ]
+        table_data = {
+            "works": [
+                {
+                    "work_id": "work-1",
+                    "title": "Saul og David",
+                    "origin_year_start": 1898,
+                    "credits": [
+                        {"role": "librettist", "is_primary": False, "person": {"legal_name": "Einar Christiansen"}},
+                        {"role": "composer", "is_primary": True, "person": {"legal_name": "Carl Nielsen"}},
+                    ],
+                },
+                {"work_id": "work-2", "title": "Maskarade", "origin_year_start": 1904, "credits": []},
+            ],
+            "artists": [{"artist_id": "artist-1", "display_name": "Nielsen", "artist_type": "solo"}],
+        }
+        builders = {}
+
+        def table_side_effect(name):
+            builder = MagicMock()
+            builder.select.return_value = builder
+            builder.in_.return_value = builder
+            builder.execute = AsyncMock(return_value=MagicMock(data=table_data[name]))
+            builders[name] = builder
+            return builder
+
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = table_side_effect
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            hydrated = await hydrate_summaries(results)
+
+            assert mock_supabase.table.call_count == 2
+            builders["works"].in_.assert_called_once_with("work_id", ["work-1", "work-2"])
+            builders["artists"].in_.assert_called_once_with("artist_id", ["artist-1"])
+            assert hydrated[0].summary == WorkSummary(title="Saul og David", composer="Carl Nielsen", year=1898)
+            assert hydrated[1].summary == ArtistSummary(display_name="Nielsen", artist_type="solo")
+            assert hydrated[2].summary == WorkSummary(title="Maskarade", year=1904)
+
+    @pytest.mark.asyncio
+    async def test_hydrate_summaries_empty(self):
+        """Test hydrating no results doesn't query Supabase."""
+        with patch("music_catalogue.crud.search.get_supabase", new_callable=AsyncMock) as mock_get_supabase:
+            assert await hydrate_summaries([]) == []
+
+            mock_get_supabase.assert_not_awaited()
+
+
+class TestSuggest:
+    """Tests for typeahead suggestions."""
+
+    @pytest.mark.asyncio
+    async def test_suggest_success(self):
+        """Test suggestions are fetched through the prefix RPC and parsed."""
+        mock_data = [{"entity_type": "person", "entity_id": "person-1", "display_text": "Carl Nielsen"}]
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=mock_data))
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            result = await suggest("niel", limit=5)
+
+            mock_supabase.rpc.assert_called_once_with("suggest", {"prefix_text": "niel", "fetch_limit": 5})
+            assert result == [
+                Suggestion(entity_type=EntityType.PERSON, entity_id="person-1", display_text="Carl Nielsen")
+            ]
+
+    @pytest.mark.asyncio
+    async def test_suggest_timeout(self):
+        """Test slow suggestions are abandoned once the timeout passes."""
+
+        async def slow_execute():
+            await asyncio.sleep(1)
+
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = slow_execute
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(TimeoutError):
+                await suggest("niel", timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_suggest_api_error(self):
+        """Test Supabase errors are raised as API errors."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            side_effect=PostgrestAPIError({"message": "Database error", "code": "500"})
+        )
+
+        with patch("music_catalogue.crud.search.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError):
+                await suggest("niel")
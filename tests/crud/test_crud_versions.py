@@ -0,0 +1,133 @@
+"""
+Unit tests for version lineage traversal in the versions CRUD module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from music_catalogue.crud import versions
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.artists import Artist
+from music_catalogue.models.types import ArtistType, EntityType
+from supabase import PostgrestAPIError
+
+ORIGINAL = "fe9032cc-1b14-402b-b5f5-0151176b1d1c"
+COVER = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+REMIX = "7d8c3f7e-2f0e-4d25-a8b1-61c3e4d5f6a7"
+ARTIST = "3c9e6a1b-5d2f-4e8a-9b7c-0a1d2e3f4a5b"
+
+
+def _row(version_id, title, depth, based_on_version_id=None, version_type="original"):
+    return {
+        "version_id": version_id,
+        "title": title,
+        "version_type": version_type,
+        "work_id": "work-1",
+        "primary_artist_id": ARTIST,
+        "based_on_version_id": based_on_version_id,
+        "depth": depth,
+    }
+
+
+def _mock_supabase(data):
+    mock_supabase = MagicMock()
+    mock_supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=data))
+    return mock_supabase
+
+
+@pytest.fixture(autouse=True)
+def mock_loader():
+    """Resolve every primary artist through a mock request loader."""
+    entity_loader = MagicMock()
+    entity_loader.load_many = AsyncMock(
+        side_effect=lambda entity_type, ids: [
+            Artist(id=id, artist_type=ArtistType.SOLO, display_name="Carl Nielsen") for id in ids
+        ]
+    )
+    with patch("music_catalogue.crud.versions.get_loader", return_value=entity_loader):
+        yield entity_loader
+
+
+class TestVersionsCRUD:
+    """Tests for versions CRUD operations."""
+
+    @pytest.mark.asyncio
+    async def test_get_lineage_builds_nodes_and_edges(self, mock_loader):
+        """Test the lineage is fetched in one RPC call and returned as a flat node and edge list."""
+        mock_supabase = _mock_supabase(
+            [
+                _row(REMIX, "Remix", 1, based_on_version_id=COVER, version_type="remix"),
+                _row(ORIGINAL, "Original", -1),
+                _row(COVER, "Cover", 0, based_on_version_id=ORIGINAL, version_type="cover"),
+            ]
+        )
+
+        with patch("music_catalogue.crud.versions.get_supabase", AsyncMock(return_value=mock_supabase)):
+            graph = await versions.get_lineage(COVER, max_depth=3)
+
+        mock_supabase.rpc.assert_called_once_with("version_lineage", {"root_version_id": COVER, "max_depth": 3})
+        assert [node.id for node in graph.nodes] == [ORIGINAL, COVER, REMIX]
+        # The artist shared by every version is loaded once
+        mock_loader.load_many.assert_awaited_once_with(EntityType.ARTIST, [ARTIST])
+        assert {node.primary_artist_name for node in graph.nodes} == {"Carl Nielsen"}
+        assert [(edge.based_on_version_id, edge.version_id) for edge in graph.edges] == [
+            (COVER, REMIX),
+            (ORIGINAL, COVER),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_lineage_skips_edges_outside_graph(self):
+        """Test versions whose parent is beyond the depth limit have no edge to it."""
+        mock_supabase = _mock_supabase([_row(COVER, "Cover", 0, based_on_version_id=ORIGINAL)])
+
+        with patch("music_catalogue.crud.versions.get_supabase", AsyncMock(return_value=mock_supabase)):
+            graph = await versions.get_lineage(COVER)
+
+        assert [node.id for node in graph.nodes] == [COVER]
+        assert graph.edges == []
+
+    @pytest.mark.asyncio
+    async def test_get_lineage_not_found(self):
+        """Test a version that doesn't exist returns None."""
+        with patch("music_catalogue.crud.versions.get_supabase", AsyncMock(return_value=_mock_supabase([]))):
+            assert await versions.get_lineage(COVER) is None
+
+    @pytest.mark.asyncio
+    async def test_get_lineage_invalid_depth(self):
+        """Test depths outside the allowed range are rejected."""
+        with pytest.raises(ValueError):
+            await versions.get_lineage(COVER, max_depth=versions.MAX_LINEAGE_DEPTH + 1)
+
+    @pytest.mark.asyncio
+    async def test_get_work_tree_empty(self, mock_loader):
+        """Test a work without versions returns an empty graph."""
+        mock_supabase = _mock_supabase([])
+        mock_loader.load = AsyncMock(return_value=MagicMock())
+
+        with patch("music_catalogue.crud.versions.get_supabase", AsyncMock(return_value=mock_supabase)):
+            graph = await versions.get_work_tree(ORIGINAL)
+
+        mock_supabase.rpc.assert_called_once_with(
+            "work_version_tree", {"target_work_id": ORIGINAL, "max_depth": versions.DEFAULT_LINEAGE_DEPTH}
+        )
+        mock_loader.load.assert_awaited_once_with(EntityType.WORK, ORIGINAL)
+        assert graph.nodes == [] and graph.edges == []
+
+    @pytest.mark.asyncio
+    async def test_get_work_tree_unknown_work(self, mock_loader):
+        """Test the tree of a work that doesn't exist is None."""
+        mock_loader.load = AsyncMock(return_value=None)
+
+        with patch("music_catalogue.crud.versions.get_supabase", AsyncMock(return_value=_mock_supabase([]))):
+            assert await versions.get_work_tree(ORIGINAL) is None
+
+    @pytest.mark.asyncio
+    async def test_get_work_tree_api_error(self):
+        """Test Supabase errors are raised as APIError."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.versions.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError, match="boom"):
+                await versions.get_work_tree(ORIGINAL)
@@ -5,13 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from music_catalogue.crud import works
+from music_catalogue.models.exceptions import APIError
 from music_catalogue.models.inputs.work_create import (
     WorkCreate,
     WorkCreditCreate,
     WorkExternalLinkCreate,
+    WorkUpdate,
     WorkVersionCreate,
 )
-from music_catalogue.models.responses.works import Work
+from music_catalogue.models.responses.works import Genre, Work
+from music_catalogue.models.types import BulkItemStatus
+from supabase import PostgrestAPIError
 
 
 class TestWorksCRUD:
@@ -47,6 +51,35 @@ class TestWorksCRUD:
             mock_parse.assert_called_once_with(Work, mock_work_data)
             assert result is mock_parse.return_value
 
+    @pytest.mark.asyncio
+    async def test_get_work_by_id_resolves_genres_from_registry(self):
+        """Test genre IDs embedded in the work are resolved from the genre registry."""
+        mock_work_data = {
+            "work_id": "work-1",
+            "title": "Work 1",
+            "work_genres": [{"genre_id": "genre-2"}, {"genre_id": "genre-1"}],
+        }
+        mock_supabase = MagicMock()
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.single.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=MagicMock(data=mock_work_data))
+        mock_supabase.table.return_value = query_builder
+
+        resolved_genres = [Genre(id="genre-2", name="Jazz"), Genre(id="genre-1", name="Classical")]
+
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works.validate_uuid", return_value=None),
+            patch("music_catalogue.crud.works.assets.get_external_links_raw", return_value=[]),
+            patch("music_catalogue.crud.works.genres.resolve", AsyncMock(return_value=resolved_genres)) as mock_resolve,
+        ):
+            result = await works.get_by_id("work-1")
+
+            mock_resolve.assert_awaited_once_with(["genre-2", "genre-1"])
+            assert result.genres == resolved_genres
+
     @pytest.mark.asyncio
     async def test_get_work_by_id_not_found(self):
         """Test retrieving a work that doesn't exist."""
@@ -69,6 +102,54 @@ class TestWorksCRUD:
             res = await works.get_by_id(work_id)
             assert res is None
 
+    @pytest.mark.asyncio
+    async def test_get_works_by_ids_success(self, sample_uuid):
+        """Test retrieving several works in one query, in the order requested."""
+        missing_id = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+        other_id = "7d8c3f7e-2f0e-4d25-a8b1-61c3e4d5f6a7"
+        mock_works_data = [
+            {"work_id": other_id, "title": "Maskarade", "work_genres": [{"genre_id": "genre-1"}]},
+            {"work_id": sample_uuid, "title": "Saul og David"},
+        ]
+        mock_links = {other_id: [{"label": "CNW", "url": "https://example.com", "source_verified": True}]}
+
+        mock_supabase = MagicMock()
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.in_.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=MagicMock(data=mock_works_data))
+        mock_supabase.table.return_value = query_builder
+
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch(
+                "music_catalogue.crud.works.assets.get_external_links_raw_by_entity_ids",
+                AsyncMock(return_value=mock_links),
+            ) as mock_get_links,
+            patch(
+                "music_catalogue.crud.works.genres.resolve",
+                AsyncMock(side_effect=lambda ids: [Genre(id=id, name="Classical") for id in ids]),
+            ),
+        ):
+            result = await works.get_by_ids([sample_uuid, missing_id, other_id, sample_uuid])
+
+            mock_supabase.table.assert_called_once_with("works")
+            query_builder.in_.assert_called_once_with("work_id", [sample_uuid, missing_id, other_id])
+            mock_get_links.assert_awaited_once()
+            assert [work.id for work in result.results] == [sample_uuid, other_id]
+            assert result.missing_ids == [missing_id]
+            assert result.results[1].genres == [Genre(id="genre-1", name="Classical")]
+            assert result.results[1].external_links[0].label == "CNW"
+
+    @pytest.mark.asyncio
+    async def test_get_works_by_ids_invalid_uuid(self):
+        """Test invalid IDs are rejected before querying."""
+        with patch("music_catalogue.crud.works.get_supabase", new_callable=AsyncMock) as mock_get_supabase:
+            with pytest.raises(ValueError):
+                await works.get_by_ids(["not-a-uuid"])
+
+            mock_get_supabase.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_search_works_success(self):
         """Test searching for works with a valid query."""
@@ -145,131 +226,349 @@ class TestWorksCRUD:
             query_builder.text_search.assert_called_once_with("search_text", "nielsen+saul+and+david")
 
     @pytest.mark.asyncio
-    async def test_create_simple_work_success(self):
-        """Test successful creation of a simple work."""
-        work_data = MagicMock(spec=WorkCreate)
-        work_data.title = "Simple Work"
-        work_data.versions = []
-        work_data.credits = []
-        work_data.genre_ids = []
-        work_data.external_links = []
+    async def test_get_by_identifier_uses_containment(self):
+        """Test works are looked up by exact identifier through jsonb containment."""
+        mock_results = [{"work_id": "id1", "title": "Saul og David"}]
 
         mock_supabase = MagicMock()
-        works_table = MagicMock()
-        works_table.insert.return_value = works_table
-        works_table.execute = AsyncMock(return_value=MagicMock(data=[{"work_id": "work-uuid"}]))
-        mock_supabase.table.return_value = works_table
-
-        mock_work = MagicMock()
-        mock_work.id = "work-uuid"
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.contains.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=MagicMock(data=mock_results))
+        mock_supabase.table.return_value = query_builder
 
-        expected_payload = work_data.model_dump(exclude_none=True, exclude={"genre_ids", "versions", "credits"})
+        parsed_works = [MagicMock(spec=Work)]
 
         with (
-            patch("music_catalogue.crud.works.get_supabase", new_callable=AsyncMock) as mock_get_supabase,
-            patch("music_catalogue.crud.works._parse", return_value=mock_work) as mock_parse,
-            patch("music_catalogue.crud.works._parse_list", return_value=[]) as mock_parse_list,
-            patch("music_catalogue.crud.works.validate_uuid", return_value=None),
-            patch("music_catalogue.crud.works.get_by_id", return_value=mock_work),
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works._parse_list", return_value=parsed_works) as mock_parse_list,
+            patch("music_catalogue.crud.works.genres.resolve", AsyncMock(return_value=[])),
         ):
-            mock_get_supabase.return_value = mock_supabase
+            result = await works.get_by_identifier("CNW", "27")
 
+            assert result is parsed_works
+            mock_parse_list.assert_called_once_with(Work, mock_results)
+            query_builder.contains.assert_called_once_with("identifiers", '[{"label": "CNW", "value": "27"}]')
+
+    @pytest.mark.asyncio
+    async def test_get_by_identifier_api_error(self):
+        """Test Supabase errors are raised as API errors."""
+        mock_supabase = MagicMock()
+        query_builder = MagicMock()
+        query_builder.select.return_value = query_builder
+        query_builder.contains.return_value = query_builder
+        query_builder.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+        mock_supabase.table.return_value = query_builder
+
+        with patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError):
+                await works.get_by_identifier("CNW", "27")
+
+    @pytest.mark.asyncio
+    async def test_create_work_single_rpc(self):
+        """Test a work and its nested relationships are created with a single RPC call and no read back."""
+        work_data = WorkCreate(
+            title="Nested Work",
+            genre_ids=["0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"],
+            versions=[WorkVersionCreate(title="Nested Work", primary_artist_id="fe9032cc-1b14-402b-b5f5-0151176b1d1c")],
+            credits=[WorkCreditCreate(person_id="fe9032cc-1b14-402b-b5f5-0151176b1d1c", role="composer")],
+            external_links=[WorkExternalLinkCreate(label="CNW", url="https://example.com/cnw/1")],
+        )
+        genre = Genre(id="0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d", name="Opera")
+
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(
+                data={
+                    "work_id": "work-uuid",
+                    "title": "Nested Work",
+                    "versions": [
+                        {
+                            "version_id": "version-uuid",
+                            "title": "Nested Work",
+                            "version_type": "original",
+                            "primary_artist": {
+                                "artist_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                                "artist_type": "solo",
+                                "display_name": "Carl Nielsen",
+                            },
+                            "completeness_level": "complete",
+                        }
+                    ],
+                    "work_genres": [{"genre_id": genre.id}],
+                    "credits": [
+                        {
+                            "credit_id": "credit-uuid",
+                            "person": {
+                                "person_id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c",
+                                "legal_name": "Carl Nielsen",
+                            },
+                            "role": "composer",
+                            "is_primary": False,
+                        }
+                    ],
+                    "external_links": [{"label": "CNW", "url": "https://example.com/cnw/1", "source_verified": False}],
+                }
+            )
+        )
+
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works.genres.resolve", AsyncMock(return_value=[genre])) as mock_resolve,
+            patch("music_catalogue.crud.works.get_by_id", new_callable=AsyncMock) as mock_get_by_id,
+        ):
             result = await works.create(work_data)
 
-            assert result is mock_work
-            mock_get_supabase.assert_awaited_once()
-            mock_supabase.table.assert_called_once_with("works")
-            works_table.insert.assert_called_once_with(expected_payload)
-            mock_parse.assert_called_once_with(Work, {"work_id": "work-uuid"})
-            mock_parse_list.assert_not_called()
+            assert result.id == "work-uuid"
+            assert result.versions[0].id == "version-uuid"
+            assert result.credits[0].person.legal_name == "Carl Nielsen"
+            assert result.genres == [genre]
+            assert result.external_links[0].label == "CNW"
+            mock_supabase.table.assert_not_called()
+            function_name, params = mock_supabase.rpc.call_args.args
+            assert function_name == "create_work"
+            assert params["payload"] == work_data.model_dump(mode="json", exclude_none=True)
+            assert params["added_by"]
+            mock_resolve.assert_awaited_once_with([genre.id])
+            mock_get_by_id.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_create_nested_work_success(self):
-        """Test successful creation of a complex work with nested relationships."""
-        work_data = MagicMock(spec=WorkCreate)
-        work_data.title = "Nested Work"
-        work_data.versions = [MagicMock(spec=WorkVersionCreate)]
-        work_data.credits = [MagicMock(spec=WorkCreditCreate)]
-        work_data.genre_ids = ["genre-1"]
-        work_data.external_links = [MagicMock(spec=WorkExternalLinkCreate)]
+    async def test_create_work_full_reads_back(self):
+        """Test the work is read back after creation when the full representation is requested."""
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(
+            return_value=MagicMock(data={"work_id": "work-uuid", "title": "Simple Work"})
+        )
+        mock_final_work = MagicMock(spec=Work)
+
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works.get_by_id", return_value=mock_final_work) as mock_get_by_id,
+        ):
+            result = await works.create(WorkCreate(title="Simple Work"), full=True)
 
+            assert result is mock_final_work
+            mock_get_by_id.assert_awaited_once_with("work-uuid")
+
+    @pytest.mark.asyncio
+    async def test_create_work_rpc_error(self):
+        """Test an RPC failure is raised as an APIError without any client-side rollback."""
         mock_supabase = MagicMock()
+        mock_supabase.rpc.return_value.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)):
+            with pytest.raises(APIError, match="boom"):
+                await works.create(WorkCreate(title="Failing Work"))
+
+        mock_supabase.table.assert_not_called()
+
+
+class TestWorksUpdate:
+    """Tests for partial work updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_single_write_with_representation(self):
+        """Test updating a work writes only the fields given and builds the response from the write."""
+        work_id = "fe9032cc-1b14-402b-b5f5-0151176b1d1c"
+        genre = Genre(id="0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d", name="Opera")
 
-        # Mock for works table insert
-        works_insert_builder = MagicMock()
-        works_insert_builder.execute = AsyncMock(return_value=MagicMock(data=[{"work_id": "work-uuid"}]))
+        mock_supabase = MagicMock()
         works_table = MagicMock()
-        works_table.insert.return_value = works_insert_builder
-
-        # Mock for versions table insert
-        versions_insert_builder = MagicMock()
-        versions_insert_builder.execute = AsyncMock(return_value=MagicMock(data=[]))
-        versions_table = MagicMock()
-        versions_table.insert.return_value = versions_insert_builder
-
-        # Mock for credits table insert
-        credits_insert_builder = MagicMock()
-        credits_insert_builder.execute = AsyncMock(return_value=MagicMock(data=[]))
-        credits_table = MagicMock()
-        credits_table.insert.return_value = credits_insert_builder
-
-        # Mock for work_genres table insert
-        work_genres_insert_builder = MagicMock()
-        work_genres_insert_builder.execute = AsyncMock(return_value=MagicMock(data=[]))
-        work_genres_table = MagicMock()
-        work_genres_table.insert.return_value = work_genres_insert_builder
-
-        # Mock for external_links table insert
-        external_links_insert_builder = MagicMock()
-        external_links_insert_builder.execute = AsyncMock(return_value=MagicMock(data=[]))
-        external_links_table = MagicMock()
-        external_links_table.insert.return_value = external_links_insert_builder
-
-        # Mock for get_by_id query
-        get_by_id_builder = MagicMock()
-        get_by_id_builder.select.return_value = get_by_id_builder
-        get_by_id_builder.eq.return_value = get_by_id_builder
-        get_by_id_builder.single.return_value = get_by_id_builder
-        get_by_id_builder.execute = AsyncMock(
-            return_value=MagicMock(data={"work_id": "work-uuid", "title": "Nested Work"})
+        works_table.update.return_value = works_table
+        works_table.eq.return_value = works_table
+        works_table.select.return_value = works_table
+        works_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[{"work_id": work_id, "title": "Maskarade", "work_genres": [{"genre_id": genre.id}]}]
+            )
         )
+        mock_supabase.table.return_value = works_table
 
-        # Set up table() to return appropriate mock based on table name
-        def table_side_effect(name):
-            if name == "works":
-                return works_table if mock_supabase.table.call_count == 1 else get_by_id_builder
-            elif name == "versions":
-                return versions_table
-            elif name == "credits":
-                return credits_table
-            elif name == "work_genres":
-                return work_genres_table
-            elif name == "external_links":
-                return external_links_table
-            return MagicMock()
-
-        mock_supabase.table.side_effect = table_side_effect
-
-        mock_work = MagicMock()
-        mock_work.id = "work-uuid"
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works.genres.resolve", AsyncMock(return_value=[genre])),
+            patch(
+                "music_catalogue.crud.works.assets.get_external_links_raw",
+                AsyncMock(return_value=[{"label": "CNW", "url": "https://example.com/cnw/1", "source_verified": True}]),
+            ),
+        ):
+            result = await works.update(work_id, WorkUpdate(title="Maskarade"))
 
-        mock_final_work = MagicMock(spec=Work)
+        works_table.update.assert_called_once_with({"title": "Maskarade"})
+        works_table.select.assert_called_once_with(works._WORK_DETAIL_SELECT)
+        assert result.title == "Maskarade"
+        assert result.genres == [genre]
+        assert result.external_links[0].label == "CNW"
 
-        expected_payload = work_data.model_dump(
-            exclude_none=True, exclude={"genre_ids", "versions", "credits", "external_links"}
-        )
+    @pytest.mark.asyncio
+    async def test_update_origin_years_out_of_order_with_stored_row(self):
+        """Test an origin year start after the stored end, rejected by the check, is invalid input."""
+        mock_supabase = MagicMock()
+        works_table = MagicMock()
+        works_table.update.return_value = works_table
+        works_table.eq.return_value = works_table
+        works_table.select.return_value = works_table
+        works_table.execute = AsyncMock(side_effect=PostgrestAPIError({"message": "violation", "code": "23514"}))
+        mock_supabase.table.return_value = works_table
 
         with (
-            patch("music_catalogue.crud.works.get_supabase", new_callable=AsyncMock) as mock_get_supabase,
-            patch("music_catalogue.crud.works._parse") as mock_parse,
-            patch("music_catalogue.crud.works.validate_uuid", return_value=None),
-            patch("music_catalogue.crud.works.get_by_id", return_value=mock_final_work),
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works.assets.get_external_links_raw", AsyncMock(return_value=[])),
         ):
-            mock_get_supabase.return_value = mock_supabase
-            mock_parse.side_effect = [mock_work, mock_final_work]
+            with pytest.raises(ValueError, match="Invalid years"):
+                await works.update("fe9032cc-1b14-402b-b5f5-0151176b1d1c", WorkUpdate(origin_year_start=1990))
 
-            result = await works.create(work_data)
+    @pytest.mark.asyncio
+    async def test_update_invalid_uuid(self):
+        """Test updating with an invalid UUID raises before calling Supabase."""
+        with pytest.raises(ValueError):
+            await works.update("not-a-uuid", WorkUpdate(title="Maskarade"))
+
+
+class TestWorksBulkCreate:
+    """Tests for bulk work creation."""
+
+    ARTIST_ID = "fe9032cc-1b14-402b-b5f5-0151176b1d1c"
+    GENRE_ID = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+
+    def _works_data(self):
+        return [
+            WorkCreate(
+                title="Saul og David",
+                genre_ids=[self.GENRE_ID],
+                versions=[WorkVersionCreate(title="Saul og David", primary_artist_id=self.ARTIST_ID)],
+                external_links=[WorkExternalLinkCreate(label="CNW", url="https://example.com/cnw/1")],
+            ),
+            WorkCreate(title="Maskarade", credits=[WorkCreditCreate(artist_id=self.ARTIST_ID, role="composer")]),
+        ]
 
-            assert result is mock_final_work
-            mock_get_supabase.assert_awaited_once()
-            works_table.insert.assert_called_once_with(expected_payload)
+    def _mock_supabase(self, error=None):
+        def rpc_side_effect(name, params):
+            # Return the created works in reverse so results have to be matched to inputs by index
+            rows = [
+                {
+                    "item_index": index,
+                    "work": {
+                        "work_id": f"work-{index}",
+                        **payload,
+                        "work_genres": [{"genre_id": genre_id} for genre_id in payload.get("genre_ids", [])],
+                        "versions": [
+                            {
+                                "version_id": f"version-{index}-{offset}",
+                                "title": version["title"],
+                                "version_type": "original",
+                                "completeness_level": "complete",
+                                "primary_artist": {
+                                    "artist_id": version["primary_artist_id"],
+                                    "artist_type": "solo",
+                                    "display_name": "Carl Nielsen",
+                                },
+                            }
+                            for offset, version in enumerate(payload.get("versions", []))
+                        ],
+                        "credits": [
+                            {"credit_id": f"credit-{index}-{offset}", **credit}
+                            for offset, credit in enumerate(payload.get("credits", []))
+                        ],
+                    },
+                }
+                for index, payload in reversed(list(enumerate(params["payload"])))
+            ]
+            execute = AsyncMock(side_effect=error) if error else AsyncMock(return_value=MagicMock(data=rows))
+            return MagicMock(execute=execute)
+
+        mock_supabase = MagicMock()
+        mock_supabase.rpc.side_effect = rpc_side_effect
+        return mock_supabase
+
+    @pytest.mark.asyncio
+    async def test_create_many_one_rpc_per_chunk(self):
+        """Test each chunk of works and their relationships is created with a single transactional RPC."""
+        mock_supabase = self._mock_supabase()
+
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch(
+                "music_catalogue.crud.works.genres.resolve",
+                AsyncMock(side_effect=lambda ids: [Genre(id=id, name="Opera") for id in ids]),
+            ),
+        ):
+            results = await works.create_many(self._works_data())
+
+        mock_supabase.rpc.assert_called_once()
+        name, params = mock_supabase.rpc.call_args.args
+        assert name == "create_works"
+        assert [payload["title"] for payload in params["payload"]] == ["Saul og David", "Maskarade"]
+        assert params["payload"][1]["credits"][0]["artist_id"] == self.ARTIST_ID
+        assert [result.status for result in results] == [BulkItemStatus.CREATED, BulkItemStatus.CREATED]
+        assert [result.result.id for result in results] == ["work-0", "work-1"]
+        assert results[0].result.genres == [Genre(id=self.GENRE_ID, name="Opera")]
+        assert results[0].result.external_links[0].label == "CNW"
+        assert results[1].result.title == "Maskarade"
+
+    @pytest.mark.asyncio
+    async def test_create_many_failed_chunk_reported_per_item(self):
+        """Test a chunk the database rejects reports each of its works as failed."""
+        mock_supabase = self._mock_supabase(error=PostgrestAPIError({"message": "boom"}))
+
+        with patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await works.create_many(self._works_data())
+
+        assert [result.status for result in results] == [BulkItemStatus.FAILED, BulkItemStatus.FAILED]
+        assert "boom" in results[0].error
+
+    @pytest.mark.asyncio
+    async def test_create_many_unexpected_error_reported_per_chunk(self):
+        """Test errors other than database errors, like timeouts, fail their chunk instead of the whole request."""
+        mock_supabase = self._mock_supabase(error=TimeoutError("read timed out"))
+
+        with patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)):
+            results = await works.create_many(self._works_data())
+
+        assert [result.error for result in results] == ["Chunk failed with TimeoutError: read timed out"] * 2
+
+    @pytest.mark.asyncio
+    async def test_create_many_chunks_rpcs(self):
+        """Test works are split into one RPC per chunk."""
+        mock_supabase = self._mock_supabase()
+
+        with (
+            patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)),
+            patch("music_catalogue.crud.works.genres.resolve", AsyncMock(return_value=[])),
+        ):
+            results = await works.create_many(self._works_data(), chunk_size=1)
+
+        assert mock_supabase.rpc.call_count == 2
+        assert [result.index for result in results] == [0, 1]
+        assert [result.result.title for result in results] == ["Saul og David", "Maskarade"]
+
+    @pytest.mark.asyncio
+    async def test_get_similar_reads_precomputed_rows(self):
+        """Test similar works are a single ranked lookup on the precomputed table."""
+        mock_supabase = MagicMock()
+        similarities_table = MagicMock()
+        similarities_table.select.return_value = similarities_table
+        similarities_table.eq.return_value = similarities_table
+        similarities_table.order.return_value = similarities_table
+        similarities_table.limit.return_value = similarities_table
+        similarities_table.execute = AsyncMock(
+            return_value=MagicMock(
+                data=[{"rank": 1, "score": 0.8, "similar": {"work_id": "work-2", "title": "Symphony No. 2"}}]
+            )
+        )
+        mock_supabase.table.return_value = similarities_table
+
+        with patch("music_catalogue.crud.works.get_supabase", AsyncMock(return_value=mock_supabase)):
+            similar = await works.get_similar("fe9032cc-1b14-402b-b5f5-0151176b1d1c", 3)
+
+        mock_supabase.table.assert_called_once_with("work_similarities")
+        similarities_table.eq.assert_called_once_with("work_id", "fe9032cc-1b14-402b-b5f5-0151176b1d1c")
+        similarities_table.limit.assert_called_once_with(3)
+        assert similar[0].work.title == "Symphony No. 2"
+        assert similar[0].score == 0.8
+
+    @pytest.mark.asyncio
+    async def test_get_similar_invalid_limit(self):
+        """Test limits over the number of stored similar works are rejected."""
+        with pytest.raises(ValueError, match="Invalid limit"):
+            await works.get_similar("fe9032cc-1b14-402b-b5f5-0151176b1d1c", 0)
@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from music_catalogue.models.inputs.entity_merge import MAX_MERGE_DUPLICATES, EntityMerge
+
+
+class TestEntityMergeValidation:
+    """Tests for EntityMerge.validate."""
+
+    def test_validate_drops_repeated_ids(self):
+        merge_data = EntityMerge(
+            duplicate_ids=["fe9032cc-1b14-402b-b5f5-0151176b1d1c", "fe9032cc-1b14-402b-b5f5-0151176b1d1c"]
+        )
+
+        assert merge_data.duplicate_ids == ["fe9032cc-1b14-402b-b5f5-0151176b1d1c"]
+
+    def test_validate_empty_ids_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            EntityMerge(duplicate_ids=[])
+
+        assert "At least one duplicate ID" in str(exc_info.value)
+
+    def test_validate_invalid_id_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            EntityMerge(duplicate_ids=["not-a-uuid"])
+
+        assert "Invalid UUID" in str(exc_info.value)
+
+    def test_validate_too_many_ids_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            EntityMerge(duplicate_ids=[f"fe9032cc-1b14-402b-b5f5-{i:012d}" for i in range(MAX_MERGE_DUPLICATES + 1)])
+
+        assert "Too many UUIDs" in str(exc_info.value)
@@ -0,0 +1,29 @@
+import pytest
+from pydantic import ValidationError
+
+from music_catalogue.models.inputs.live_search import LiveSearchQuery
+from music_catalogue.models.types import EntityType
+
+
+class TestLiveSearchQueryValidation:
+    """Tests for LiveSearchQuery parsing."""
+
+    def test_defaults(self):
+        search = LiveSearchQuery.model_validate_json('{"query": "nielsen"}')
+
+        assert search.entity_types == []
+        assert search.limit == 20
+        assert search.hydrate is None
+
+    def test_entity_types_parsed(self):
+        search = LiveSearchQuery.model_validate_json('{"query": "nielsen", "entity_types": ["work", "person"]}')
+
+        assert search.entity_types == [EntityType.WORK, EntityType.PERSON]
+
+    def test_short_query_raises(self):
+        with pytest.raises(ValidationError):
+            LiveSearchQuery.model_validate_json('{"query": "n"}')
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValidationError):
+            LiveSearchQuery.model_validate_json("nielsen")
@@ -0,0 +1,37 @@
+import pytest
+from pydantic import ValidationError
+
+from music_catalogue.models.inputs.person_resolve import MAX_RESOLVE_NAMES, PersonResolve
+
+
+class TestPersonResolveValidation:
+    """Tests for PersonResolve.validate."""
+
+    def test_validate_names_success(self):
+        resolve_data = PersonResolve(names=["Carl Nielsen", "Anne Marie Carl-Nielsen"])
+
+        assert resolve_data.candidate_limit == 5
+
+    def test_validate_empty_names_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            PersonResolve(names=[])
+
+        assert "At least one name" in str(exc_info.value)
+
+    def test_validate_blank_name_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            PersonResolve(names=["Carl Nielsen", "  "])
+
+        assert "can't be empty" in str(exc_info.value)
+
+    def test_validate_too_many_names_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            PersonResolve(names=["Carl Nielsen"] * (MAX_RESOLVE_NAMES + 1))
+
+        assert "Too many names" in str(exc_info.value)
+
+    def test_validate_candidate_limit_and_score_raise(self):
+        with pytest.raises(ValidationError):
+            PersonResolve(names=["Carl Nielsen"], candidate_limit=0)
+        with pytest.raises(ValidationError):
+            PersonResolve(names=["Carl Nielsen"], min_score=1.5)
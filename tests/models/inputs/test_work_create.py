@@ -7,6 +7,7 @@ from music_catalogue.models.inputs.work_create import (
     VersionType,
     WorkCreate,
     WorkCreditCreate,
+    WorkUpdate,
     WorkVersionCreate,
 )
 
@@ -114,3 +115,24 @@ class TestWorkCreate:
             )
 
         assert "Invalid UUID" in str(exc_info.value)
+
+
+class TestWorkUpdate:
+    """Tests for WorkUpdate.validate."""
+
+    def test_validate_partial_update_success(self):
+        work_data = WorkUpdate(title="Maskarade", notes=None)
+
+        assert work_data.model_dump(exclude_unset=True) == {"title": "Maskarade", "notes": None}
+
+    def test_validate_empty_update_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            WorkUpdate()
+
+        assert "At least one field" in str(exc_info.value)
+
+    def test_validate_clearing_title_raises(self):
+        with pytest.raises(ValidationError) as exc_info:
+            WorkUpdate(title=None)
+
+        assert "title can't be empty" in str(exc_info.value)
@@ -1,7 +1,13 @@
 import pytest
 
-from music_catalogue.models.responses.search import UnifiedSearchResult
-from music_catalogue.models.types import EntityType
+from music_catalogue.models.responses.search import (
+    PersonSummary,
+    ReleaseSummary,
+    UnifiedSearchResult,
+    VersionSummary,
+    WorkSummary,
+)
+from music_catalogue.models.types import EntityType, ReleaseCategory, VersionType
 
 
 class TestUnifiedSearchResult:
@@ -32,3 +38,50 @@ class TestUnifiedSearchResult:
 
         with pytest.raises(ValueError):
             UnifiedSearchResult.from_dict(payload)
+
+
+class TestEntitySummaries:
+    """Test the compact entity summary models"""
+
+    def test_work_summary_falls_back_to_any_composer_credit(self):
+        payload = {
+            "title": "Symphony No. 4",
+            "origin_year_end": 1916,
+            "credits": [{"role": "Composer", "is_primary": False, "artist": {"display_name": "Carl Nielsen"}}],
+        }
+
+        summary = WorkSummary.from_dict(payload)
+
+        assert summary.composer == "Carl Nielsen"
+        assert summary.year == 1916
+
+    def test_version_summary_from_dict(self):
+        payload = {
+            "title": "Live at Tivoli",
+            "version_type": "live",
+            "release_date": "1999-05-01",
+            "primary_artist": {"display_name": "Danish National Symphony Orchestra"},
+        }
+
+        summary = VersionSummary.from_dict(payload)
+
+        assert summary.version_type is VersionType.LIVE
+        assert summary.primary_artist == "Danish National Symphony Orchestra"
+        assert summary.release_year == 1999
+
+    def test_release_summary_from_dict(self):
+        payload = {"release_title": "Symphonies", "release_category": "album", "release_date": "2001-01-01"}
+
+        summary = ReleaseSummary.from_dict(payload)
+
+        assert summary.title == "Symphonies"
+        assert summary.release_category is ReleaseCategory.ALBUM
+        assert summary.release_year == 2001
+
+    def test_person_summary_from_dict(self):
+        payload = {"legal_name": "Carl Nielsen", "birth_date": "1865-06-09", "death_date": "1931-10-03"}
+
+        summary = PersonSummary.from_dict(payload)
+
+        assert summary.birth_year == 1865
+        assert summary.death_year == 1931
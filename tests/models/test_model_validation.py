@@ -6,6 +6,7 @@ from music_catalogue.models.validation import (
     validate_start_and_end_dates,
     validate_start_and_end_years,
     validate_uuid,
+    validate_uuid_list,
 )
 
 
@@ -22,6 +23,26 @@ class TestValidateUUID:
             validate_uuid("not-a-uuid")
 
 
+class TestValidateUUIDList:
+    """Tests for validate_uuid_list helper."""
+
+    def test_duplicates_removed_in_order(self):
+        """Duplicate UUIDs are dropped while keeping first-seen order."""
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+
+        assert validate_uuid_list([second, first, second]) == [second, first]
+
+    def test_invalid_uuid_raises_value_error(self):
+        """Any invalid UUID in the list raises ValueError."""
+        with pytest.raises(ValueError):
+            validate_uuid_list([str(uuid.uuid4()), "not-a-uuid"])
+
+    def test_too_many_uuids_raises_value_error(self):
+        """Lists longer than the maximum raise ValueError."""
+        with pytest.raises(ValueError):
+            validate_uuid_list([str(uuid.uuid4()) for _ in range(3)], max_length=2)
+
+
 class TestValidateStartAndEndDates:
     """Tests for validate_start_and_end_dates helper."""
 
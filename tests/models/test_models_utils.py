@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from music_catalogue.models.utils import (
     _parse,
     _parse_list,
+    _to_batch_result,
 )
 
 
@@ -14,6 +15,10 @@ class DummyModel(BaseModel):
         return cls(value=data["value"])
 
 
+class DummyIdModel(BaseModel):
+    id: str
+
+
 class TestModelParsers:
     """Test _parse and _parse_list functions"""
 
@@ -45,3 +50,21 @@ class TestModelParsers:
         result = _parse_list(DummyModel, items)
 
         assert [item.value for item in result] == ["first", "second"]
+
+
+class TestBatchResult:
+    """Test _to_batch_result function"""
+
+    def test_results_follow_requested_order(self):
+        items = [DummyIdModel(id="b"), DummyIdModel(id="a")]
+
+        result = _to_batch_result(DummyIdModel, ["a", "b"], items)
+
+        assert [item.id for item in result.results] == ["a", "b"]
+        assert result.missing_ids == []
+
+    def test_missing_ids_reported(self):
+        result = _to_batch_result(DummyIdModel, ["a", "missing"], [DummyIdModel(id="a")])
+
+        assert [item.id for item in result.results] == ["a"]
+        assert result.missing_ids == ["missing"]
@@ -2,8 +2,9 @@
 
 from unittest.mock import AsyncMock, patch
 
-from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.responses.artists import Artist
+from music_catalogue.models.exceptions import APIError, ConflictError
+from music_catalogue.models.responses.artists import Artist, ArtistMembership, DiscographyEntry, RelatedArtist
+from music_catalogue.models.responses.batch import BatchResult, Page
 from music_catalogue.models.responses.persons import Person
 from music_catalogue.models.types import ArtistType
 
@@ -45,6 +46,32 @@ class TestArtistsEndpoints:
             assert response.json() == [item.model_dump(exclude_none=True) for item in mock_results]
             mock_search.assert_awaited_once_with(query)
 
+    def test_get_artists_by_ids_success(self, test_client, sample_uuid):
+        """GET /artists?ids= returns the batch in order along with missing IDs."""
+        missing_id = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+        batch = BatchResult[Artist](
+            results=[Artist(id=sample_uuid, display_name="Carl Nielsen", artist_type=ArtistType.SOLO)],
+            missing_ids=[missing_id],
+        )
+
+        with patch("music_catalogue.routers.artists.artists.get_by_ids", new_callable=AsyncMock) as mock_get_by_ids:
+            mock_get_by_ids.return_value = batch
+
+            response = test_client.get("/artists", params={"ids": f"{sample_uuid},{missing_id}"})
+
+            assert response.status_code == 200
+            assert response.json() == batch.model_dump(exclude_none=True)
+            mock_get_by_ids.assert_awaited_once_with([sample_uuid, missing_id])
+
+    def test_get_artists_by_ids_invalid_id(self, test_client):
+        """Invalid IDs in a batch surface as 422 responses."""
+        with patch("music_catalogue.routers.artists.artists.get_by_ids", new_callable=AsyncMock) as mock_get_by_ids:
+            mock_get_by_ids.side_effect = ValueError("Invalid UUID")
+
+            response = test_client.get("/artists", params={"ids": ["not-a-uuid"]})
+
+            assert response.status_code == 422
+
     def test_search_artists_requires_query(self, test_client):
         """Query parameter is mandatory for artists search."""
         response = test_client.get("/artists")
@@ -96,3 +123,138 @@ class TestArtistsEndpoints:
 
             assert response.status_code == 500
             assert "Upstream failure" in response.json()["detail"]
+
+    def test_upsert_artists_success(self, test_client, sample_uuid):
+        """POST /artists/upsert returns the resolved or created artists in order."""
+        artist = Artist(id="artist-123", display_name="New Artist", artist_type=ArtistType.SOLO)
+
+        with patch("music_catalogue.routers.artists.artists.upsert_many", new_callable=AsyncMock) as mock_upsert:
+            mock_upsert.return_value = [artist]
+
+            response = test_client.post(
+                "/artists/upsert",
+                json=[{"display_name": "New Artist", "artist_type": ArtistType.SOLO, "person_id": sample_uuid}],
+            )
+
+            assert response.status_code == 200
+            assert response.json() == [artist.model_dump(exclude_none=True)]
+            mock_upsert.assert_awaited_once()
+
+    def test_upsert_artists_without_person(self, test_client):
+        """Artists that can't be upserted surface as 422 responses."""
+        with patch("music_catalogue.routers.artists.artists.upsert_many", new_callable=AsyncMock) as mock_upsert:
+            mock_upsert.side_effect = ValueError("Artist The Ensemble can't be upserted without a person ID")
+
+            response = test_client.post(
+                "/artists/upsert",
+                json=[{"display_name": "The Ensemble", "artist_type": ArtistType.SOLO, "person_id": "x"}],
+            )
+
+            assert response.status_code == 422
+
+    def test_update_artist_success(self, test_client, sample_uuid):
+        """PATCH /artists/{id} returns the updated artist."""
+        artist = Artist(id=sample_uuid, display_name="C. Nielsen", artist_type=ArtistType.SOLO)
+
+        with patch("music_catalogue.routers.artists.artists.update", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = artist
+
+            response = test_client.patch(f"/artists/{sample_uuid}", json={"display_name": "C. Nielsen"})
+
+            assert response.status_code == 200
+            assert response.json() == artist.model_dump(exclude_none=True)
+            mock_update.assert_awaited_once()
+            assert mock_update.await_args.args[1].model_fields_set == set({"display_name": "C. Nielsen"}.keys())
+
+    def test_update_artist_not_found(self, test_client, sample_uuid):
+        """PATCH /artists/{id} returns 404 when the artist doesn't exist."""
+        with patch("music_catalogue.routers.artists.artists.update", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = None
+
+            response = test_client.patch(f"/artists/{sample_uuid}", json={"display_name": "C. Nielsen"})
+
+            assert response.status_code == 404
+
+    def test_update_artist_conflict(self, test_client, sample_uuid):
+        """PATCH /artists/{id} returns 409 when the display name is taken by another artist of the same person."""
+        with patch("music_catalogue.routers.artists.artists.update", new_callable=AsyncMock) as mock_update:
+            mock_update.side_effect = ConflictError("taken")
+
+            response = test_client.patch(f"/artists/{sample_uuid}", json={"display_name": "C. Nielsen"})
+
+            assert response.status_code == 409
+
+    def test_get_artist_discography_success(self, test_client, sample_uuid):
+        """GET /artists/{id}/discography passes the filters through and returns the page."""
+        page = Page[DiscographyEntry](
+            results=[DiscographyEntry(id=sample_uuid, role="composer", year=1901)], next_cursor="next"
+        )
+
+        with patch(
+            "music_catalogue.routers.artists.artists.get_discography", new_callable=AsyncMock
+        ) as mock_get_discography:
+            mock_get_discography.return_value = page
+
+            response = test_client.get(
+                f"/artists/{sample_uuid}/discography",
+                params={"year_from": 1900, "role": ["composer", "arranger"], "limit": 10},
+            )
+
+            assert response.status_code == 200
+            assert response.json() == page.model_dump(exclude_none=True)
+            mock_get_discography.assert_awaited_once_with(
+                sample_uuid, year_from=1900, year_to=None, roles=["composer", "arranger"], cursor=None, page_size=10
+            )
+
+    def test_get_artist_discography_invalid_cursor(self, test_client, sample_uuid):
+        """GET /artists/{id}/discography returns 422 for invalid input."""
+        with patch(
+            "music_catalogue.routers.artists.artists.get_discography", new_callable=AsyncMock
+        ) as mock_get_discography:
+            mock_get_discography.side_effect = ValueError("Invalid cursor x")
+
+            response = test_client.get(f"/artists/{sample_uuid}/discography", params={"cursor": "x"})
+
+            assert response.status_code == 422
+
+    def test_get_artist_members_at_year(self, test_client, sample_uuid):
+        """GET /artists/{id}/members passes the year through."""
+        membership = ArtistMembership(id="membership-1", start_year=1962, end_year=1970)
+
+        with patch("music_catalogue.routers.artists.artists.get_members", new_callable=AsyncMock) as mock_get_members:
+            mock_get_members.return_value = [membership]
+
+            response = test_client.get(f"/artists/{sample_uuid}/members", params={"year": 1969})
+
+            assert response.status_code == 200
+            assert response.json() == [membership.model_dump(exclude_none=True)]
+            mock_get_members.assert_awaited_once_with(sample_uuid, 1969)
+
+    def test_get_related_artists_success(self, test_client, sample_uuid):
+        """GET /artists/{id}/related returns the ranked related artists."""
+        related = RelatedArtist(
+            artist=Artist(id=sample_uuid, display_name="The Band", artist_type=ArtistType.GROUP),
+            rank=1,
+            score=2.0,
+            shared_works=2,
+        )
+
+        with patch("music_catalogue.routers.artists.artists.get_related", new_callable=AsyncMock) as mock_get_related:
+            mock_get_related.return_value = [related]
+
+            response = test_client.get(f"/artists/{sample_uuid}/related", params={"limit": 5})
+
+            assert response.status_code == 200
+            assert response.json() == [related.model_dump(mode="json", exclude_none=True)]
+            mock_get_related.assert_awaited_once_with(sample_uuid, 5)
+
+    def test_merge_artists_missing_duplicate(self, test_client, sample_uuid):
+        """POST /artists/{id}/merge returns 422 when a duplicate doesn't exist."""
+        with patch("music_catalogue.routers.artists.artists.merge", new_callable=AsyncMock) as mock_merge:
+            mock_merge.side_effect = ValueError("Artists {x} not found")
+
+            response = test_client.post(
+                f"/artists/{sample_uuid}/merge", json={"duplicate_ids": ["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]}
+            )
+
+            assert response.status_code == 422
@@ -0,0 +1,103 @@
+"""Tests for cancelling request handlers when the client disconnects."""
+
+import asyncio
+
+import pytest
+
+from music_catalogue.main import DisconnectCancellationMiddleware
+
+
+def _scope(method: str = "GET") -> dict:
+    return {"type": "http", "method": method, "path": "/works/search", "headers": []}
+
+
+class TestDisconnectCancellationMiddleware:
+    """Tests for DisconnectCancellationMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_handler(self):
+        """A handler still waiting when the client disconnects is cancelled without sending a response."""
+        handler_started = asyncio.Event()
+        disconnect = asyncio.Event()
+        cancelled = []
+        sent = []
+
+        async def handler(scope, receive, send):
+            handler_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        middleware_task = asyncio.create_task(DisconnectCancellationMiddleware(handler)(_scope(), receive, send))
+        await handler_started.wait()
+        disconnect.set()
+        await asyncio.wait_for(middleware_task, 1)
+
+        assert cancelled == [True]
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_completed_response_is_not_cancelled(self):
+        """Disconnects reported after the response was sent don't cancel the rest of the handler."""
+        finished = []
+        sent = []
+
+        async def handler(scope, receive, send):
+            assert (await receive())["type"] == "http.request"
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"[]"})
+            # Give the watcher time to see the disconnect, like background work running after the response
+            await asyncio.sleep(0.01)
+            finished.append(True)
+
+        response_sent = asyncio.Event()
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            # Servers report a disconnect once the response is complete
+            await response_sent.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body":
+                response_sent.set()
+
+        await DisconnectCancellationMiddleware(handler)(_scope(), receive, send)
+
+        assert finished == [True]
+        assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+
+    @pytest.mark.asyncio
+    async def test_requests_with_body_are_not_watched(self):
+        """Write requests get the original receive channel and are never cancelled."""
+        received = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"{}", "more_body": False}
+
+        async def send(message):
+            pass
+
+        async def handler(scope, handler_receive, send):
+            received.append(handler_receive)
+
+        await DisconnectCancellationMiddleware(handler)(_scope("POST"), receive, send)
+
+        assert received == [receive]
@@ -0,0 +1,33 @@
+"""Integration tests for FastAPI endpoints matching the current API behavior for genres."""
+
+from unittest.mock import AsyncMock, patch
+
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.works import Genre
+
+
+class TestGenreEndpoints:
+    """Integration tests for genre endpoints."""
+
+    def test_list_genres_success(self, test_client):
+        """GET /genres returns every genre in the registry."""
+        genre_list = [Genre(id="genre-1", name="Classical"), Genre(id="genre-2", name="Jazz")]
+
+        with patch("music_catalogue.routers.genres.genres.get_all", new_callable=AsyncMock) as mock_get_all:
+            mock_get_all.return_value = genre_list
+
+            response = test_client.get("/genres")
+
+            assert response.status_code == 200
+            assert response.json() == [genre.model_dump(exclude_none=True) for genre in genre_list]
+            mock_get_all.assert_awaited_once()
+
+    def test_list_genres_api_error(self, test_client):
+        """API errors surface as 500 responses."""
+        with patch("music_catalogue.routers.genres.genres.get_all", new_callable=AsyncMock) as mock_get_all:
+            mock_get_all.side_effect = APIError("Upstream failure")
+
+            response = test_client.get("/genres")
+
+            assert response.status_code == 500
+            assert "Upstream failure" in response.json()["detail"]
@@ -3,7 +3,10 @@
 from unittest.mock import AsyncMock, patch
 
 from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.responses.persons import Person
+from music_catalogue.models.responses.batch import BatchResult, BulkItemResult, Page
+from music_catalogue.models.responses.persons import Person, PersonCandidate, PersonNameResolution, PersonWork
+from music_catalogue.models.types import BulkItemStatus, CreditPath, NameMatchType
+from music_catalogue.utils import idempotency
 
 
 class TestPersonEndpoints:
@@ -43,6 +46,31 @@ class TestPersonEndpoints:
             assert response.json() == [item.model_dump(exclude_none=True) for item in mock_results]
             mock_search.assert_awaited_once_with(query)
 
+    def test_get_persons_by_ids_success(self, test_client, sample_uuid):
+        """GET /persons?ids= returns the batch in order along with missing IDs."""
+        missing_id = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+        batch = BatchResult[Person](
+            results=[Person(id=sample_uuid, legal_name="Carl Nielsen")], missing_ids=[missing_id]
+        )
+
+        with patch("music_catalogue.routers.persons.persons.get_by_ids", new_callable=AsyncMock) as mock_get_by_ids:
+            mock_get_by_ids.return_value = batch
+
+            response = test_client.get("/persons", params={"ids": f"{sample_uuid},{missing_id}"})
+
+            assert response.status_code == 200
+            assert response.json() == batch.model_dump(exclude_none=True)
+            mock_get_by_ids.assert_awaited_once_with([sample_uuid, missing_id])
+
+    def test_get_persons_by_ids_invalid_id(self, test_client):
+        """Invalid IDs in a batch surface as 422 responses."""
+        with patch("music_catalogue.routers.persons.persons.get_by_ids", new_callable=AsyncMock) as mock_get_by_ids:
+            mock_get_by_ids.side_effect = ValueError("Invalid UUID")
+
+            response = test_client.get("/persons", params={"ids": ["not-a-uuid"]})
+
+            assert response.status_code == 422
+
     def test_search_persons_requires_query(self, test_client):
         """Query parameter is mandatory for persons search."""
         response = test_client.get("/persons")
@@ -94,31 +122,215 @@ class TestPersonEndpoints:
             assert "Upstream failure" in response.json()["detail"]
 
     def test_bulk_create_persons_success(self, test_client):
-        """POST /persons/bulk returns list of created persons."""
+        """POST /persons/bulk returns the outcome for each created person."""
         payload = [
             {"legal_name": "Member One"},
             {"legal_name": "Member Two", "birth_date": "1990-01-01"},
         ]
-        people = [
-            Person(id="person-1", legal_name="Member One"),
-            Person(id="person-2", legal_name="Member Two"),
+        results = [
+            BulkItemResult[Person](
+                index=0, status=BulkItemStatus.CREATED, result=Person(id="person-1", legal_name="Member One")
+            ),
+            BulkItemResult[Person](
+                index=1, status=BulkItemStatus.CREATED, result=Person(id="person-2", legal_name="Member Two")
+            ),
         ]
 
-        with patch("music_catalogue.routers.persons.persons.create", new_callable=AsyncMock) as mock_create:
-            mock_create.side_effect = people
+        with patch("music_catalogue.routers.persons.persons.create_many", new_callable=AsyncMock) as mock_create_many:
+            mock_create_many.return_value = results
 
-            response = test_client.post("/persons/bulk", json=payload)
+            response = test_client.post("/persons/bulk", json=payload, params={"chunk_size": 100})
 
             assert response.status_code == 201
-            assert response.json() == [person.model_dump(exclude_none=True) for person in people]
-            assert mock_create.await_count == len(payload)
+            assert response.json() == [result.model_dump(mode="json", exclude_none=True) for result in results]
+            people_data, chunk_size = mock_create_many.await_args.args
+            assert [person.legal_name for person in people_data] == ["Member One", "Member Two"]
+            assert chunk_size == 100
+
+    def test_bulk_create_persons_partial_failure(self, test_client):
+        """Failed items are reported per item with a 207 status."""
+        results = [
+            BulkItemResult[Person](
+                index=0, status=BulkItemStatus.CREATED, result=Person(id="person-1", legal_name="Member One")
+            ),
+            BulkItemResult[Person](index=1, status=BulkItemStatus.FAILED, error="Bulk failure"),
+        ]
 
-    def test_bulk_create_persons_api_error(self, test_client):
-        """API errors propagate during bulk create."""
-        with patch("music_catalogue.routers.persons.persons.create", new_callable=AsyncMock) as mock_create:
-            mock_create.side_effect = APIError("Bulk failure")
+        with patch("music_catalogue.routers.persons.persons.create_many", new_callable=AsyncMock) as mock_create_many:
+            mock_create_many.return_value = results
+
+            response = test_client.post(
+                "/persons/bulk",
+                json=[{"legal_name": "Member One"}, {"legal_name": "Member Two"}],
+                params={"chunk_size": 1},
+            )
+
+            assert response.status_code == 207
+            assert response.json()[1] == {"index": 1, "status": "failed", "error": "Bulk failure"}
+
+    def test_bulk_create_persons_validates_all_items_first(self, test_client):
+        """An invalid item rejects the whole request before anything is written."""
+        with patch("music_catalogue.routers.persons.persons.create_many", new_callable=AsyncMock) as mock_create_many:
+            response = test_client.post(
+                "/persons/bulk", json=[{"legal_name": "Person"}, {"legal_name": "Bad", "birth_date": "not-a-date"}]
+            )
+
+            assert response.status_code == 422
+            mock_create_many.assert_not_awaited()
+
+    def test_bulk_create_persons_idempotency_key_replay(self, test_client):
+        """Retrying POST /persons/bulk with the same Idempotency-Key replays the original outcomes."""
+        idempotency.clear()
+        results = [BulkItemResult[Person](index=0, status=BulkItemStatus.FAILED, error="Bulk failure")]
 
-            response = test_client.post("/persons/bulk", json=[{"legal_name": "Person"}])
+        with patch("music_catalogue.routers.persons.persons.create_many", new_callable=AsyncMock) as mock_create_many:
+            mock_create_many.return_value = results
+            headers = {"Idempotency-Key": "bulk-retry-1"}
+
+            first = test_client.post("/persons/bulk", json=[{"legal_name": "Carl Nielsen"}], headers=headers)
+            second = test_client.post("/persons/bulk", json=[{"legal_name": "Carl Nielsen"}], headers=headers)
+
+            assert first.status_code == second.status_code == 207
+            assert first.json() == second.json()
+            mock_create_many.assert_awaited_once()
+
+    def test_upsert_persons_success(self, test_client, sample_uuid):
+        """POST /persons/upsert returns the resolved or created persons in order."""
+        person = Person(id=sample_uuid, legal_name="Carl Nielsen")
+
+        with patch("music_catalogue.routers.persons.persons.upsert_many", new_callable=AsyncMock) as mock_upsert:
+            mock_upsert.return_value = [person, person]
+
+            response = test_client.post(
+                "/persons/upsert", json=[{"legal_name": "Carl Nielsen"}, {"legal_name": "carl nielsen"}]
+            )
+
+            assert response.status_code == 200
+            assert response.json() == [person.model_dump(exclude_none=True)] * 2
+            mock_upsert.assert_awaited_once()
+
+    def test_upsert_persons_api_error(self, test_client):
+        """API errors surface as 500 responses for upsert."""
+        with patch("music_catalogue.routers.persons.persons.upsert_many", new_callable=AsyncMock) as mock_upsert:
+            mock_upsert.side_effect = APIError("Upstream failure")
+
+            response = test_client.post("/persons/upsert", json=[{"legal_name": "Carl Nielsen"}])
 
             assert response.status_code == 500
-            assert "Bulk failure" in response.json()["detail"]
+            assert "Upstream failure" in response.json()["detail"]
+
+    def test_resolve_person_names_success(self, test_client, sample_uuid):
+        """POST /persons/resolve returns ranked candidates for each name."""
+        resolutions = [
+            PersonNameResolution(
+                name="carl nielsen",
+                candidates=[
+                    PersonCandidate(
+                        person=Person(id=sample_uuid, legal_name="Carl Nielsen"),
+                        match_type=NameMatchType.EXACT,
+                        score=1.0,
+                    )
+                ],
+            ),
+            PersonNameResolution(name="Unknown Person"),
+        ]
+
+        with patch("music_catalogue.routers.persons.persons.resolve_names", new_callable=AsyncMock) as mock_resolve:
+            mock_resolve.return_value = resolutions
+
+            response = test_client.post("/persons/resolve", json={"names": ["carl nielsen", "Unknown Person"]})
+
+            assert response.status_code == 200
+            assert response.json() == [
+                resolution.model_dump(mode="json", exclude_none=True) for resolution in resolutions
+            ]
+            mock_resolve.assert_awaited_once()
+
+    def test_resolve_person_names_validation_error(self, test_client):
+        """An empty list of names surfaces as a 422 response."""
+        with patch("music_catalogue.routers.persons.persons.resolve_names", new_callable=AsyncMock) as mock_resolve:
+            response = test_client.post("/persons/resolve", json={"names": []})
+
+            assert response.status_code == 422
+            mock_resolve.assert_not_awaited()
+
+    def test_update_person_success(self, test_client, sample_uuid):
+        """PATCH /persons/{id} returns the updated person."""
+        person = Person(id=sample_uuid, legal_name="Carl Nielsen")
+
+        with patch("music_catalogue.routers.persons.persons.update", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = person
+
+            response = test_client.patch(f"/persons/{sample_uuid}", json={"legal_name": "Carl Nielsen"})
+
+            assert response.status_code == 200
+            assert response.json() == person.model_dump(exclude_none=True)
+            mock_update.assert_awaited_once()
+            assert mock_update.await_args.args[1].model_fields_set == set({"legal_name": "Carl Nielsen"}.keys())
+
+    def test_update_person_not_found(self, test_client, sample_uuid):
+        """PATCH /persons/{id} returns 404 when the person doesn't exist."""
+        with patch("music_catalogue.routers.persons.persons.update", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = None
+
+            response = test_client.patch(f"/persons/{sample_uuid}", json={"legal_name": "Carl Nielsen"})
+
+            assert response.status_code == 404
+
+    def test_get_person_works_success(self, test_client, sample_uuid):
+        """GET /persons/{id}/works returns the page of works."""
+        page = Page[PersonWork](
+            results=[PersonWork(id=sample_uuid, title="Symphony No. 4", credited_as=[CreditPath.DIRECT])]
+        )
+
+        with patch("music_catalogue.routers.persons.persons.get_works", new_callable=AsyncMock) as mock_get_works:
+            mock_get_works.return_value = page
+
+            response = test_client.get(f"/persons/{sample_uuid}/works", params={"limit": 20})
+
+            assert response.status_code == 200
+            assert response.json() == page.model_dump(mode="json", exclude_none=True)
+            mock_get_works.assert_awaited_once_with(sample_uuid, cursor=None, page_size=20)
+
+    def test_get_person_works_invalid_limit(self, test_client, sample_uuid):
+        """GET /persons/{id}/works rejects page sizes over the maximum."""
+        response = test_client.get(f"/persons/{sample_uuid}/works", params={"limit": 10_000})
+
+        assert response.status_code == 422
+
+    def test_get_person_memberships_invalid_year(self, test_client, sample_uuid):
+        """GET /persons/{id}/memberships returns 422 for invalid years."""
+        with patch(
+            "music_catalogue.routers.persons.persons.get_memberships", new_callable=AsyncMock
+        ) as mock_get_memberships:
+            mock_get_memberships.side_effect = ValueError("Invalid year 0")
+
+            response = test_client.get(f"/persons/{sample_uuid}/memberships", params={"year": 0})
+
+            assert response.status_code == 422
+
+    def test_merge_persons_success(self, test_client, sample_uuid):
+        """POST /persons/{id}/merge returns the merged person."""
+        person = Person(id=sample_uuid, legal_name="Carl Nielsen", alternative_names=["Nielsen, Carl"])
+
+        with patch("music_catalogue.routers.persons.persons.merge", new_callable=AsyncMock) as mock_merge:
+            mock_merge.return_value = person
+
+            response = test_client.post(
+                f"/persons/{sample_uuid}/merge", json={"duplicate_ids": ["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]}
+            )
+
+            assert response.status_code == 200
+            assert response.json() == person.model_dump(mode="json", exclude_none=True)
+            assert mock_merge.await_args.args[1].duplicate_ids == ["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]
+
+    def test_merge_persons_not_found(self, test_client, sample_uuid):
+        """POST /persons/{id}/merge returns 404 when the person to keep doesn't exist."""
+        with patch("music_catalogue.routers.persons.persons.merge", new_callable=AsyncMock) as mock_merge:
+            mock_merge.return_value = None
+
+            response = test_client.post(
+                f"/persons/{sample_uuid}/merge", json={"duplicate_ids": ["0f5b2f5e-3c1a-4a0e-9a57-1e2f6c1d2b3a"]}
+            )
+
+            assert response.status_code == 404
@@ -1,8 +1,11 @@
 """Integration tests for FastAPI endpoints matching the current API behavior for search."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, patch
 
-from music_catalogue.models.responses.search import UnifiedSearchResult
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.search import ArtistSummary, Suggestion, UnifiedSearchResult, WorkSummary
 from music_catalogue.models.types import EntityType
 
 
@@ -63,6 +66,58 @@ class TestSearchEndpoints:
             assert response.json() == [item.model_dump(exclude_none=True) for item in mock_results]
             mock_unified_search.assert_awaited_once_with(query, [EntityType.WORK], 10)
 
+    def test_search_all_hydrated_summaries(self, test_client):
+        """Search with hydrate=summary attaches entity summaries inline."""
+        query = "nielsen"
+        mock_results = [
+            UnifiedSearchResult(
+                entity_type=EntityType.WORK,
+                entity_id="work-1",
+                display_text="Saul og David",
+                rank=0.9,
+            ),
+            UnifiedSearchResult(
+                entity_type=EntityType.ARTIST,
+                entity_id="artist-1",
+                display_text="Carl Nielsen",
+                rank=0.9,
+            ),
+        ]
+        hydrated_results = [
+            mock_results[0].model_copy(
+                update={"summary": WorkSummary(title="Saul og David", composer="Carl Nielsen", year=1898)}
+            ),
+            mock_results[1].model_copy(
+                update={"summary": ArtistSummary(display_name="Carl Nielsen", artist_type="solo", start_year=1879)}
+            ),
+        ]
+
+        with (
+            patch("music_catalogue.routers.search.unified_search", new_callable=AsyncMock) as mock_unified_search,
+            patch("music_catalogue.routers.search.hydrate_summaries", new_callable=AsyncMock) as mock_hydrate,
+        ):
+            mock_unified_search.return_value = mock_results
+            mock_hydrate.return_value = hydrated_results
+
+            response = test_client.get("/search", params={"query": query, "hydrate": "summary"})
+
+            assert response.status_code == 200
+            assert response.json() == [item.model_dump(mode="json", exclude_none=True) for item in hydrated_results]
+            mock_hydrate.assert_awaited_once_with(mock_results)
+
+    def test_search_all_not_hydrated_by_default(self, test_client):
+        """Search results aren't hydrated unless requested."""
+        with (
+            patch("music_catalogue.routers.search.unified_search", new_callable=AsyncMock) as mock_unified_search,
+            patch("music_catalogue.routers.search.hydrate_summaries", new_callable=AsyncMock) as mock_hydrate,
+        ):
+            mock_unified_search.return_value = []
+
+            response = test_client.get("/search", params={"query": "nielsen"})
+
+            assert response.status_code == 200
+            mock_hydrate.assert_not_awaited()
+
     def test_search_all_invalid_limit(self, test_client):
         """Requests exceeding limit validation are rejected."""
         response = test_client.get("/search", params={"query": "nielsen", "limit": 101})
@@ -92,3 +147,171 @@ class TestSearchEndpoints:
         response_long = test_client.get("/search", params={"query": "x" * 51})
 
         assert response_long.status_code == 422
+
+
+class TestSuggestEndpoints:
+    """Integration tests for typeahead suggestion endpoints."""
+
+    def test_suggest_success(self, test_client):
+        """Suggestions for a two letter prefix are returned."""
+        mock_results = [Suggestion(entity_type=EntityType.PERSON, entity_id="person-1", display_text="Carl Nielsen")]
+
+        with patch("music_catalogue.routers.suggest.suggest", new_callable=AsyncMock) as mock_suggest:
+            mock_suggest.return_value = mock_results
+
+            response = test_client.get("/suggest", params={"q": "ni", "limit": 5})
+
+            assert response.status_code == 200
+            assert response.json() == [item.model_dump() for item in mock_results]
+            mock_suggest.assert_awaited_once_with("ni", 5)
+
+    def test_suggest_validation(self, test_client):
+        """Empty queries and limits over the maximum are rejected."""
+        assert test_client.get("/suggest", params={"q": ""}).status_code == 422
+        assert test_client.get("/suggest", params={"q": "n"}).status_code == 422
+        assert test_client.get("/suggest", params={"q": "niel", "limit": 21}).status_code == 422
+
+    def test_suggest_timeout(self, test_client):
+        """Suggestions taking too long return a gateway timeout."""
+        with patch("music_catalogue.routers.suggest.suggest", new_callable=AsyncMock) as mock_suggest:
+            mock_suggest.side_effect = TimeoutError()
+
+            response = test_client.get("/suggest", params={"q": "niel"})
+
+            assert response.status_code == 504
+
+    def test_suggest_api_error(self, test_client):
+        """API errors return an internal server error."""
+        with patch("music_catalogue.routers.suggest.suggest", new_callable=AsyncMock) as mock_suggest:
+            mock_suggest.side_effect = APIError("boom")
+
+            response = test_client.get("/suggest", params={"q": "niel"})
+
+            assert response.status_code == 500
+            assert response.json()["detail"] == "Failed to get suggestions: boom"
+
+
+class TestLiveSearchEndpoints:
+    """Integration tests for the live search websocket."""
+
+    def test_live_search_pushes_results(self, test_client):
+        """Each query sent gets its results pushed back."""
+        mock_results = [
+            UnifiedSearchResult(
+                entity_type=EntityType.ARTIST, entity_id="artist-1", display_text="Carl Nielsen", rank=0.9
+            )
+        ]
+
+        with (
+            patch("music_catalogue.routers.search.LIVE_SEARCH_DEBOUNCE_SECONDS", 0),
+            patch("music_catalogue.routers.search.unified_search", new_callable=AsyncMock) as mock_unified_search,
+        ):
+            mock_unified_search.return_value = mock_results
+
+            with test_client.websocket_connect("/search/live") as websocket:
+                websocket.send_json({"query": "nielsen", "entity_types": ["artist"], "limit": 5})
+
+                assert websocket.receive_json() == {
+                    "query": "nielsen",
+                    "results": [item.model_dump(mode="json", exclude_none=True) for item in mock_results],
+                }
+
+            mock_unified_search.assert_awaited_once_with("nielsen", [EntityType.ARTIST], 5)
+
+    def test_live_search_new_query_cancels_previous(self, test_client):
+        """A query still running when the next one arrives is cancelled and its results never sent."""
+        started = threading.Event()
+        cancelled = []
+
+        async def search(query, entity_types, limit):
+            if query == "niel":
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(query)
+                    raise
+            return [UnifiedSearchResult(entity_type=EntityType.PERSON, entity_id="p-1", display_text=query, rank=1)]
+
+        with (
+            patch("music_catalogue.routers.search.LIVE_SEARCH_DEBOUNCE_SECONDS", 0),
+            patch("music_catalogue.routers.search.unified_search", side_effect=search),
+        ):
+            with test_client.websocket_connect("/search/live") as websocket:
+                websocket.send_json({"query": "niel"})
+                assert started.wait(1)
+                websocket.send_json({"query": "nielsen"})
+
+                assert websocket.receive_json()["query"] == "nielsen"
+
+        assert cancelled == ["niel"]
+
+    def test_live_search_debounces_bursts(self, test_client):
+        """Queries sent faster than the debounce delay only search for the last one."""
+        with (
+            patch("music_catalogue.routers.search.LIVE_SEARCH_DEBOUNCE_SECONDS", 0.2),
+            patch("music_catalogue.routers.search.unified_search", new_callable=AsyncMock) as mock_unified_search,
+        ):
+            mock_unified_search.return_value = []
+
+            with test_client.websocket_connect("/search/live") as websocket:
+                for query in ("ni", "nie", "niel"):
+                    websocket.send_json({"query": query})
+
+                assert websocket.receive_json() == {"query": "niel", "results": []}
+
+            mock_unified_search.assert_awaited_once_with("niel", [], 20)
+
+    def test_live_search_invalid_query(self, test_client):
+        """Invalid queries get an error message and keep the connection open."""
+        with (
+            patch("music_catalogue.routers.search.LIVE_SEARCH_DEBOUNCE_SECONDS", 0),
+            patch("music_catalogue.routers.search.unified_search", new_callable=AsyncMock) as mock_unified_search,
+        ):
+            mock_unified_search.return_value = []
+
+            with test_client.websocket_connect("/search/live") as websocket:
+                websocket.send_json({"query": "a"})
+                assert websocket.receive_json()["error"] == "Invalid search query"
+
+                websocket.send_json({"query": "ab"})
+                assert websocket.receive_json() == {"query": "ab", "results": []}
+
+    def test_live_search_api_error(self, test_client):
+        """API errors are pushed as error messages."""
+        with (
+            patch("music_catalogue.routers.search.LIVE_SEARCH_DEBOUNCE_SECONDS", 0),
+            patch("music_catalogue.routers.search.unified_search", new_callable=AsyncMock) as mock_unified_search,
+        ):
+            mock_unified_search.side_effect = APIError("boom")
+
+            with test_client.websocket_connect("/search/live") as websocket:
+                websocket.send_json({"query": "nielsen"})
+
+                assert websocket.receive_json() == {
+                    "query": "nielsen",
+                    "error": "Failed to search across entities: boom",
+                }
+
+    def test_live_search_unexpected_error_is_logged(self, test_client, caplog):
+        """Unexpected errors of a search are logged and the connection keeps serving queries."""
+        failed = threading.Event()
+
+        async def search(query, entity_types, limit):
+            if query == "niel":
+                failed.set()
+                raise RuntimeError("boom")
+            return []
+
+        with (
+            patch("music_catalogue.routers.search.LIVE_SEARCH_DEBOUNCE_SECONDS", 0),
+            patch("music_catalogue.routers.search.unified_search", side_effect=search),
+        ):
+            with test_client.websocket_connect("/search/live") as websocket:
+                websocket.send_json({"query": "niel"})
+                assert failed.wait(1)
+                websocket.send_json({"query": "nielsen"})
+
+                assert websocket.receive_json() == {"query": "nielsen", "results": []}
+
+        assert "Live search failed" in caplog.text
@@ -0,0 +1,55 @@
+"""Integration tests for FastAPI endpoints matching the current API behavior for versions."""
+
+from unittest.mock import AsyncMock, patch
+
+from music_catalogue.models.exceptions import APIError
+from music_catalogue.models.responses.versions import VersionEdge, VersionGraph, VersionNode
+from music_catalogue.models.types import VersionType
+
+
+class TestVersionEndpoints:
+    """Integration tests for version endpoints."""
+
+    def test_get_version_lineage_success(self, test_client, sample_uuid):
+        """GET /versions/{id}/lineage returns the derivation graph."""
+        graph = VersionGraph(
+            nodes=[
+                VersionNode(id="version-1", title="Original", depth=-1),
+                VersionNode(id=sample_uuid, title="Cover", version_type=VersionType.COVER),
+            ],
+            edges=[VersionEdge(based_on_version_id="version-1", version_id=sample_uuid)],
+        )
+
+        with patch("music_catalogue.routers.versions.versions.get_lineage", new_callable=AsyncMock) as mock_lineage:
+            mock_lineage.return_value = graph
+
+            response = test_client.get(f"/versions/{sample_uuid}/lineage", params={"max_depth": 3})
+
+            assert response.status_code == 200
+            assert response.json() == graph.model_dump(mode="json", exclude_none=True)
+            mock_lineage.assert_awaited_once_with(sample_uuid, 3)
+
+    def test_get_version_lineage_not_found(self, test_client, sample_uuid):
+        """GET /versions/{id}/lineage returns 404 when the version doesn't exist."""
+        with patch("music_catalogue.routers.versions.versions.get_lineage", new_callable=AsyncMock) as mock_lineage:
+            mock_lineage.return_value = None
+
+            response = test_client.get(f"/versions/{sample_uuid}/lineage")
+
+            assert response.status_code == 404
+
+    def test_get_version_lineage_depth_validation(self, test_client, sample_uuid):
+        """Depths outside the allowed range are rejected."""
+        response = test_client.get(f"/versions/{sample_uuid}/lineage", params={"max_depth": 0})
+
+        assert response.status_code == 422
+
+    def test_get_version_lineage_api_error(self, test_client, sample_uuid):
+        """API errors surface as 500 responses."""
+        with patch("music_catalogue.routers.versions.versions.get_lineage", new_callable=AsyncMock) as mock_lineage:
+            mock_lineage.side_effect = APIError("Upstream failure")
+
+            response = test_client.get(f"/versions/{sample_uuid}/lineage")
+
+            assert response.status_code == 500
+            assert "Upstream failure" in response.json()["detail"]
@@ -3,7 +3,12 @@
 from unittest.mock import AsyncMock, patch
 
 from music_catalogue.models.exceptions import APIError
-from music_catalogue.models.responses.works import Work
+from music_catalogue.models.inputs.work_create import WorkCreate
+from music_catalogue.models.responses.batch import BatchResult, BulkItemResult
+from music_catalogue.models.responses.versions import VersionGraph, VersionNode
+from music_catalogue.models.responses.works import SimilarWork, Work
+from music_catalogue.models.types import BulkItemStatus
+from music_catalogue.utils import idempotency
 
 
 class TestWorksEndpoints:
@@ -29,6 +34,39 @@ class TestWorksEndpoints:
             response = test_client.get("/works/missing")
             assert response.status_code == 404
 
+    def test_get_works_by_identifier_success(self, test_client):
+        """GET /works/by-identifier returns the works with the identifier instead of matching /works/{id}."""
+        works_list = [Work(id="work-1", title="Saul og David")]
+
+        with (
+            patch("music_catalogue.routers.works.works.get_by_identifier", new_callable=AsyncMock) as mock_lookup,
+            patch("music_catalogue.routers.works.works.get_by_id", new_callable=AsyncMock) as mock_get_by_id,
+        ):
+            mock_lookup.return_value = works_list
+
+            response = test_client.get("/works/by-identifier", params={"label": "CNW", "value": "27"})
+
+            assert response.status_code == 200
+            assert response.json() == [work.model_dump(exclude_none=True) for work in works_list]
+            mock_lookup.assert_awaited_once_with("CNW", "27")
+            mock_get_by_id.assert_not_awaited()
+
+    def test_get_works_by_identifier_requires_label_and_value(self, test_client):
+        """Both the identifier label and value are required."""
+        response = test_client.get("/works/by-identifier", params={"label": "CNW"})
+
+        assert response.status_code == 422
+
+    def test_get_works_by_identifier_api_error(self, test_client):
+        """API errors are surfaced as 500 responses."""
+        with patch("music_catalogue.routers.works.works.get_by_identifier", new_callable=AsyncMock) as mock_lookup:
+            mock_lookup.side_effect = APIError("boom")
+
+            response = test_client.get("/works/by-identifier", params={"label": "CNW", "value": "27"})
+
+            assert response.status_code == 500
+            assert response.json()["detail"] == "Failed to get works by identifier: boom"
+
     def test_search_works_success(self, test_client):
         """GET /works with valid query returns Work list."""
         query = "beethoven"
@@ -46,6 +84,29 @@ class TestWorksEndpoints:
             assert response.json() == [item.model_dump(exclude_none=True) for item in works_list]
             mock_search.assert_awaited_once_with(query)
 
+    def test_get_works_by_ids_success(self, test_client, sample_uuid):
+        """GET /works?ids= returns the batch in order along with missing IDs."""
+        missing_id = "0b6f1d2e-7f0a-4a6b-9a55-3f4d6a1b2c3d"
+        batch = BatchResult[Work](results=[Work(id=sample_uuid, title="Saul og David")], missing_ids=[missing_id])
+
+        with patch("music_catalogue.routers.works.works.get_by_ids", new_callable=AsyncMock) as mock_get_by_ids:
+            mock_get_by_ids.return_value = batch
+
+            response = test_client.get("/works", params={"ids": f"{sample_uuid},{missing_id}"})
+
+            assert response.status_code == 200
+            assert response.json() == batch.model_dump(exclude_none=True)
+            mock_get_by_ids.assert_awaited_once_with([sample_uuid, missing_id])
+
+    def test_get_works_by_ids_invalid_id(self, test_client):
+        """Invalid IDs in a batch surface as 422 responses."""
+        with patch("music_catalogue.routers.works.works.get_by_ids", new_callable=AsyncMock) as mock_get_by_ids:
+            mock_get_by_ids.side_effect = ValueError("Invalid UUID")
+
+            response = test_client.get("/works", params={"ids": ["not-a-uuid"]})
+
+            assert response.status_code == 422
+
     def test_search_works_requires_query(self, test_client):
         """Query parameter is mandatory and validated."""
         response = test_client.get("/works")
@@ -76,7 +137,19 @@ class TestWorksEndpoints:
 
             assert response.status_code == 201
             assert response.json() == work.model_dump(exclude_none=True)
-            mock_create.assert_awaited_once()
+            mock_create.assert_awaited_once_with(WorkCreate(title="New Work"), full=False)
+
+    def test_create_work_expand_full(self, test_client):
+        """POST /works?expand=full asks for the work to be read back after creation."""
+        work = Work(id="work-123", title="New Work")
+
+        with patch("music_catalogue.routers.works.works.create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = work
+
+            response = test_client.post("/works", params={"expand": "full"}, json={"title": "New Work"})
+
+            assert response.status_code == 201
+            mock_create.assert_awaited_once_with(WorkCreate(title="New Work"), full=True)
 
     def test_create_work_validation_error(self, test_client):
         """Domain validation errors surface as 422 responses."""
@@ -94,3 +167,122 @@ class TestWorksEndpoints:
 
             assert response.status_code == 500
             assert "Upstream failure" in response.json()["detail"]
+
+    def test_bulk_create_works_success(self, test_client):
+        """POST /works/bulk returns the outcome for each created work."""
+        results = [
+            BulkItemResult[Work](
+                index=0, status=BulkItemStatus.CREATED, result=Work(id="work-1", title="Saul og David")
+            ),
+            BulkItemResult[Work](index=1, status=BulkItemStatus.CREATED, result=Work(id="work-2", title="Maskarade")),
+        ]
+
+        with patch("music_catalogue.routers.works.works.create_many", new_callable=AsyncMock) as mock_create_many:
+            mock_create_many.return_value = results
+
+            response = test_client.post("/works/bulk", json=[{"title": "Saul og David"}, {"title": "Maskarade"}])
+
+            assert response.status_code == 201
+            assert response.json() == [result.model_dump(mode="json", exclude_none=True) for result in results]
+            mock_create_many.assert_awaited_once()
+
+    def test_bulk_create_works_partial_failure(self, test_client):
+        """Failed works are reported per item with a 207 status."""
+        results = [BulkItemResult[Work](index=0, status=BulkItemStatus.FAILED, error="Bulk failure")]
+
+        with patch("music_catalogue.routers.works.works.create_many", new_callable=AsyncMock) as mock_create_many:
+            mock_create_many.return_value = results
+
+            response = test_client.post("/works/bulk", json=[{"title": "Saul og David"}])
+
+            assert response.status_code == 207
+            assert response.json() == [{"index": 0, "status": "failed", "error": "Bulk failure"}]
+
+    def test_create_work_idempotency_key_replay(self, test_client):
+        """Retrying POST /works with the same Idempotency-Key returns the original work without creating again."""
+        idempotency.clear()
+        work = Work(id="work-123", title="New Work")
+
+        with patch("music_catalogue.routers.works.works.create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = work
+            headers = {"Idempotency-Key": "retry-1"}
+
+            first = test_client.post("/works", json={"title": "New Work"}, headers=headers)
+            second = test_client.post("/works", json={"title": "New Work"}, headers=headers)
+
+            assert first.status_code == second.status_code == 201
+            assert first.json() == second.json()
+            mock_create.assert_awaited_once()
+
+    def test_create_work_idempotency_key_reused(self, test_client):
+        """Reusing an Idempotency-Key with a different body surfaces as a 422 response."""
+        idempotency.clear()
+
+        with patch("music_catalogue.routers.works.works.create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = Work(id="work-123", title="New Work")
+            headers = {"Idempotency-Key": "retry-2"}
+
+            test_client.post("/works", json={"title": "New Work"}, headers=headers)
+            response = test_client.post("/works", json={"title": "Other Work"}, headers=headers)
+
+            assert response.status_code == 422
+            assert "retry-2" in response.json()["detail"]
+            mock_create.assert_awaited_once()
+
+    def test_update_work_success(self, test_client, sample_uuid):
+        """PATCH /works/{id} returns the updated work."""
+        work = Work(id=sample_uuid, title="Maskarade")
+
+        with patch("music_catalogue.routers.works.works.update", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = work
+
+            response = test_client.patch(f"/works/{sample_uuid}", json={"title": "Maskarade"})
+
+            assert response.status_code == 200
+            assert response.json() == work.model_dump(exclude_none=True)
+            mock_update.assert_awaited_once()
+            assert mock_update.await_args.args[1].model_fields_set == set({"title": "Maskarade"}.keys())
+
+    def test_update_work_not_found(self, test_client, sample_uuid):
+        """PATCH /works/{id} returns 404 when the work doesn't exist."""
+        with patch("music_catalogue.routers.works.works.update", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = None
+
+            response = test_client.patch(f"/works/{sample_uuid}", json={"title": "Maskarade"})
+
+            assert response.status_code == 404
+
+    def test_get_work_version_tree_success(self, test_client, sample_uuid):
+        """GET /works/{id}/version-tree returns every version of the work as a graph."""
+        graph = VersionGraph(nodes=[VersionNode(id="version-1", title="Original", work_id=sample_uuid)])
+
+        with patch("music_catalogue.routers.works.versions.get_work_tree", new_callable=AsyncMock) as mock_tree:
+            mock_tree.return_value = graph
+
+            response = test_client.get(f"/works/{sample_uuid}/version-tree")
+
+            assert response.status_code == 200
+            assert response.json() == graph.model_dump(mode="json", exclude_none=True)
+            mock_tree.assert_awaited_once_with(sample_uuid, 10)
+
+    def test_get_work_version_tree_not_found(self, test_client, sample_uuid):
+        """GET /works/{id}/version-tree returns 404 when the work doesn't exist."""
+        with patch("music_catalogue.routers.works.versions.get_work_tree", new_callable=AsyncMock) as mock_tree:
+            mock_tree.return_value = None
+
+            response = test_client.get(f"/works/{sample_uuid}/version-tree")
+
+            assert response.status_code == 404
+
+    def test_get_similar_works_success(self, test_client, sample_uuid):
+        """GET /works/{id}/similar returns the ranked similar works."""
+        similar = SimilarWork(work=Work(id="work-2", title="Symphony No. 2"), rank=1, score=0.8)
+
+        with patch("music_catalogue.routers.works.works.get_similar", new_callable=AsyncMock) as mock_get_similar:
+            mock_get_similar.return_value = [similar]
+
+            response = test_client.get(f"/works/{sample_uuid}/similar")
+
+            assert response.status_code == 200
+            assert response.json() == [similar.model_dump(mode="json", exclude_none=True)]
+            mock_get_similar.assert_awaited_once_with(sample_uuid, 20)
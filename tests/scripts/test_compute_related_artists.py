@@ -0,0 +1,65 @@
+"""
+Unit tests for the related artists job scoring.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from scripts.compute_related_artists import compute_related  # noqa: E402
+
+ARTIST_IDS = ["a", "b", "c", "d"]
+CREDITS = [
+    {"artist_id": "a", "work_id": "w1", "version_id": "v1"},
+    # Repeated credits on the same work only count once
+    {"artist_id": "a", "work_id": "w1", "version_id": "v1"},
+    {"artist_id": "b", "work_id": "w1", "version_id": "v1"},
+    {"artist_id": "a", "work_id": "w2", "version_id": None},
+    {"artist_id": "c", "work_id": "w2", "version_id": None},
+    {"artist_id": "unknown", "work_id": "w2", "version_id": None},
+]
+# The person behind solo artist a is a member of group c
+ARTIST_PERSONS = [("a", "p1"), ("c", "p1"), ("d", "p2")]
+
+
+class TestComputeRelated:
+    """Test compute_related"""
+
+    def test_weighted_scores_and_shared_counts(self):
+        related = compute_related(ARTIST_IDS, CREDITS, ARTIST_PERSONS, member_weight=2.0)
+
+        assert related["a"] == [
+            {
+                "artist_id": "a",
+                "related_artist_id": "c",
+                "rank": 1,
+                "score": 3.0,
+                "shared_works": 1,
+                "shared_versions": 0,
+                "shared_members": 1,
+            },
+            {
+                "artist_id": "a",
+                "related_artist_id": "b",
+                "rank": 2,
+                "score": 2.0,
+                "shared_works": 1,
+                "shared_versions": 1,
+                "shared_members": 0,
+            },
+        ]
+        assert [row["related_artist_id"] for row in related["b"]] == ["a"]
+        assert [row["related_artist_id"] for row in related["c"]] == ["a"]
+        # Artists sharing nothing with another artist get no related artists
+        assert "d" not in related
+
+    def test_keeps_top_k(self):
+        related = compute_related(ARTIST_IDS, CREDITS, ARTIST_PERSONS, top_k=1, member_weight=0.5)
+
+        # With members counting less, the shared work and version with b outrank the shared work and member with c
+        assert [row["related_artist_id"] for row in related["a"]] == ["b"]
+        assert related["a"][0]["score"] == 2.0
+
+    def test_no_shared_credits(self):
+        assert compute_related(ARTIST_IDS, [], []) == {}
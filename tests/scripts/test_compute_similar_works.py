@@ -0,0 +1,72 @@
+"""
+Unit tests for the similar works job scoring.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from scripts.compute_similar_works import compute_similar, works_entered_by  # noqa: E402
+
+WORKS = [
+    {"work_id": "w1", "title": "Night Song", "language": "en", "themes": ["love"], "origin_year_start": 1965},
+    {"work_id": "w2", "title": "Night Song", "language": "en", "themes": ["love"], "origin_year_start": 1968},
+    {"work_id": "w3", "title": "Night Train", "language": "en", "themes": ["travel"], "origin_year_start": 1990},
+    {"work_id": "w4", "title": "Canción", "language": "es", "themes": None, "origin_year_start": None},
+]
+WORK_GENRES = [
+    {"work_id": "w1", "genre_id": "jazz"},
+    {"work_id": "w2", "genre_id": "jazz"},
+    {"work_id": "w3", "genre_id": "blues"},
+]
+
+
+class TestComputeSimilar:
+    """Test compute_similar"""
+
+    def test_ranks_by_shared_features(self):
+        similar = compute_similar(WORKS, WORK_GENRES)
+
+        assert [row["similar_work_id"] for row in similar["w1"]] == ["w2", "w3"]
+        assert [row["rank"] for row in similar["w1"]] == [1, 2]
+        assert similar["w1"][0]["score"] == pytest.approx(1.0)
+        assert 0 < similar["w1"][1]["score"] < similar["w1"][0]["score"]
+        # Works sharing no feature get no similar works, and never list themselves
+        assert "w4" not in similar
+        assert all(row["similar_work_id"] != row["work_id"] for rows in similar.values() for row in rows)
+
+    def test_keeps_top_k(self):
+        similar = compute_similar(WORKS, WORK_GENRES, top_k=1, block_size=1)
+
+        assert {work_id: [row["similar_work_id"] for row in rows] for work_id, rows in similar.items()} == {
+            "w1": ["w2"],
+            "w2": ["w1"],
+            "w3": ["w1"],
+        }
+
+    def test_only_queried_works(self):
+        similar = compute_similar(WORKS, WORK_GENRES, query_ids=["w3", "missing"])
+
+        assert list(similar) == ["w3"]
+        assert [row["similar_work_id"] for row in similar["w3"]] == ["w1", "w2"]
+
+
+class TestWorksEnteredBy:
+    """Test works_entered_by"""
+
+    def test_works_a_changed_work_outscores(self):
+        # w1 only stores w3 at a low score, w2 already has a full list scoring above the new work
+        floors = {"w1": (2, 0.1), "w2": (1, 1.0)}
+
+        entered = works_entered_by(WORKS, WORK_GENRES, ["w3"], floors, top_k=1)
+
+        assert entered == ["w1"]
+
+    def test_works_with_room_take_any_similar_work(self):
+        entered = works_entered_by(WORKS, WORK_GENRES, ["w3"], {"w2": (1, 1.0)}, top_k=2)
+
+        assert entered == ["w1", "w2"]
+
+    def test_no_changed_works(self):
+        assert works_entered_by(WORKS, WORK_GENRES, ["missing"], {}) == []
@@ -0,0 +1,58 @@
+"""
+Unit tests for the duplicate persons job scoring.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from scripts.find_duplicate_persons import find_duplicates  # noqa: E402
+
+
+class TestFindDuplicates:
+    """Test find_duplicates"""
+
+    def test_matches_accents_case_and_name_order(self):
+        persons = [
+            {"person_id": "p1", "legal_name": "DVORAK, Antonin"},
+            {"person_id": "p2", "legal_name": "Antonín Dvořák", "birth_date": "1841-09-08"},
+        ]
+
+        suggestions = find_duplicates(persons)
+
+        # The person with more data is kept
+        assert suggestions == [
+            {
+                "person_id": "p2",
+                "duplicate_person_id": "p1",
+                "score": 1.0,
+                "legal_names": ["Antonín Dvořák", "DVORAK, Antonin"],
+            }
+        ]
+
+    def test_matches_alternative_names(self):
+        persons = [
+            {"person_id": "p1", "legal_name": "Pyotr Ilyich Tchaikovsky", "alternative_names": ["Peter Tschaikowsky"]},
+            {"person_id": "p2", "legal_name": "Peter Tschaikowsky"},
+        ]
+
+        assert [suggestion["duplicate_person_id"] for suggestion in find_duplicates(persons)] == ["p2"]
+
+    def test_rejects_different_birth_years(self):
+        persons = [
+            {"person_id": "p1", "legal_name": "Johann Strauss", "birth_date": "1804-03-14"},
+            {"person_id": "p2", "legal_name": "Johann Strauss", "birth_date": "1825-10-25"},
+        ]
+
+        assert find_duplicates(persons) == []
+        # Same names with different birth years still score above zero, just below the default threshold
+        assert find_duplicates(persons, min_score=0.5)[0]["score"] == 0.5
+
+    def test_rejects_different_names(self):
+        persons = [
+            {"person_id": "p1", "legal_name": "Carl Nielsen", "birth_date": "1865-06-09"},
+            {"person_id": "p2", "legal_name": "Carl Maria von Weber", "birth_date": "1865-06-09"},
+        ]
+
+        assert find_duplicates(persons) == []
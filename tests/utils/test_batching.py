@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from music_catalogue.utils.batching import chunked, gather_bounded
+
+
+class TestChunked:
+    """Test chunked helper"""
+
+    def test_splits_into_ordered_chunks(self):
+        assert list(chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+    def test_empty_input(self):
+        assert list(chunked([], 3)) == []
+
+    def test_invalid_size_raises(self):
+        with pytest.raises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestGatherBounded:
+    """Test gather_bounded helper"""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_order_and_respect_limit(self):
+        running = 0
+        max_running = 0
+
+        async def work(value):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return value * 2
+
+        result = await gather_bounded((work(value) for value in range(6)), limit=2)
+
+        assert result == [0, 2, 4, 6, 8, 10]
+        assert max_running == 2
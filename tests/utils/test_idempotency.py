@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from music_catalogue.models.exceptions import IdempotencyKeyReuseError
+from music_catalogue.utils import idempotency
+
+
+@pytest.fixture(autouse=True)
+def clear_idempotency_keys():
+    idempotency.clear()
+    yield
+    idempotency.clear()
+
+
+class TestIdempotency:
+    """Test idempotent write helper"""
+
+    @pytest.mark.asyncio
+    async def test_without_key_always_runs(self):
+        calls = []
+
+        async def operation():
+            calls.append(True)
+            return len(calls)
+
+        assert await idempotency.run(None, "POST /works", {"title": "A"}, operation) == 1
+        assert await idempotency.run(None, "POST /works", {"title": "A"}, operation) == 2
+
+    @pytest.mark.asyncio
+    async def test_replay_returns_stored_result(self):
+        calls = []
+
+        async def operation():
+            calls.append(True)
+            return {"id": "work-1"}
+
+        first = await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+        second = await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+
+        assert first == second == {"id": "work-1"}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_same_key_on_other_scope_runs(self):
+        calls = []
+
+        async def operation():
+            calls.append(True)
+
+        await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+        await idempotency.run("key-1", "POST /persons", {"title": "A"}, operation)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_wait_for_in_flight(self):
+        calls = []
+        release = asyncio.Event()
+
+        async def operation():
+            calls.append(True)
+            await release.wait()
+            return "created"
+
+        first = asyncio.create_task(idempotency.run("key-1", "POST /works", {"title": "A"}, operation))
+        second = asyncio.create_task(idempotency.run("key-1", "POST /works", {"title": "A"}, operation))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == ["created", "created"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_payload_raises(self):
+        async def operation():
+            return "created"
+
+        await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+
+        with pytest.raises(IdempotencyKeyReuseError):
+            await idempotency.run("key-1", "POST /works", {"title": "B"}, operation)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_stored(self):
+        calls = []
+
+        async def operation():
+            calls.append(True)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return "created"
+
+        with pytest.raises(ValueError):
+            await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+
+        assert await idempotency.run("key-1", "POST /works", {"title": "A"}, operation) == "created"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_keys_run_again(self, monkeypatch):
+        calls = []
+
+        async def operation():
+            calls.append(True)
+
+        monkeypatch.setattr(idempotency, "IDEMPOTENCY_TTL_SECONDS", 0)
+        await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+        await idempotency.run("key-1", "POST /works", {"title": "A"}, operation)
+
+        assert len(calls) == 2
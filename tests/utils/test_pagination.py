@@ -0,0 +1,31 @@
+import pytest
+
+from music_catalogue.utils.pagination import MAX_PAGE_SIZE, decode_cursor, encode_cursor, validate_page_size
+
+
+class TestCursor:
+    """Test cursor encoding helpers"""
+
+    def test_round_trip(self):
+        position = {"year": 1901, "id": "fe9032cc-1b14-402b-b5f5-0151176b1d1c"}
+        cursor = encode_cursor(position)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == position
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor({"year": 1})[:-2], "WzFd"])
+    def test_invalid_cursor_raises(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+
+class TestValidatePageSize:
+    """Test page size validation"""
+
+    def test_bounds(self):
+        validate_page_size(1)
+        validate_page_size(MAX_PAGE_SIZE)
+        with pytest.raises(ValueError):
+            validate_page_size(0)
+        with pytest.raises(ValueError):
+            validate_page_size(MAX_PAGE_SIZE + 1)
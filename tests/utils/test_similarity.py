@@ -0,0 +1,147 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from music_catalogue.utils.similarity import (  # noqa: E402
+    block_pairs,
+    blocked_max,
+    blocked_top_k,
+    cooccurrence,
+    incidence_matrix,
+    index_values,
+    normalize_rows,
+    one_hot_matrix,
+    pair_cosine,
+    tfidf_matrix,
+    top_k_per_row,
+)
+
+
+class TestIndexValues:
+    """Test index_values helper"""
+
+    def test_first_appearance_order(self):
+        assert index_values(["b", "a", "b", "c"]) == {"b": 0, "a": 1, "c": 2}
+
+
+class TestIncidenceMatrix:
+    """Test incidence_matrix helper"""
+
+    def test_binary_and_skips_unknown_rows(self):
+        matrix = incidence_matrix([("a", "x"), ("a", "x"), ("b", "y"), ("z", "x")], {"a": 0, "b": 1, "c": 2})
+
+        assert matrix.shape == (3, 2)
+        assert matrix.toarray().tolist() == [[1, 0], [0, 1], [0, 0]]
+
+
+class TestCooccurrence:
+    """Test cooccurrence helper"""
+
+    def test_counts_shared_columns_without_diagonal(self):
+        matrix = incidence_matrix(
+            [("a", "x"), ("a", "y"), ("b", "x"), ("b", "y"), ("c", "y")], {"a": 0, "b": 1, "c": 2}
+        )
+
+        assert cooccurrence(matrix).toarray().tolist() == [[0, 2, 1], [2, 0, 1], [1, 1, 0]]
+
+
+class TestTopKPerRow:
+    """Test top_k_per_row helper"""
+
+    def test_keeps_highest_scores_with_deterministic_ties(self):
+        matrix = incidence_matrix(
+            [("a", "x"), ("b", "x"), ("c", "x"), ("d", "x"), ("b", "y"), ("a", "y")], index_values("abcde")
+        )
+
+        top = {row: (cols.tolist(), scores.tolist()) for row, cols, scores in top_k_per_row(cooccurrence(matrix), 2)}
+
+        assert top[0] == ([1, 2], [2.0, 1.0])
+        assert top[3] == ([0, 1], [1.0, 1.0])
+        # Rows without any entry are skipped
+        assert 4 not in top
+
+    def test_invalid_k_raises(self):
+        with pytest.raises(ValueError):
+            list(top_k_per_row(cooccurrence(incidence_matrix([], {"a": 0})), 0))
+
+
+class TestFeatureMatrices:
+    """Test feature matrix helpers"""
+
+    def test_one_hot_counts_values_once(self):
+        matrix = one_hot_matrix([["a", "a"], [], ["b"]])
+
+        assert matrix.shape == (3, 2)
+        assert matrix.sum(axis=1).ravel().tolist() == [[1.0, 0.0, 1.0]]
+
+    def test_tfidf_weights_rare_terms_higher(self):
+        matrix = tfidf_matrix([["symphony", "helios"], ["symphony"], ["symphony"]]).toarray()
+
+        assert matrix[0, 1] > matrix[0, 0]
+
+    def test_normalize_rows_leaves_empty_rows(self):
+        matrix = normalize_rows(one_hot_matrix([["a", "b"], []]))
+
+        assert np.allclose(matrix.multiply(matrix).sum(axis=1).ravel(), [1, 0])
+
+
+class TestBlockedTopK:
+    """Test blocked_top_k helper"""
+
+    def test_matches_unblocked_and_excludes_self(self):
+        features = normalize_rows(one_hot_matrix([["a", "b"], ["a"], ["b"], ["c"]]))
+
+        blocked = {
+            row: cols.tolist()
+            for row, cols, _ in blocked_top_k(features, features, 2, block_size=1, self_columns=np.arange(4))
+        }
+
+        assert blocked == {0: [1, 2], 1: [0], 2: [0]}
+
+    def test_query_subset(self):
+        features = normalize_rows(one_hot_matrix([["a"], ["a"], ["b"]]))
+        query_rows = np.array([2, 0])
+
+        results = list(blocked_top_k(features[query_rows], features, 5, self_columns=query_rows))
+
+        assert [(row, cols.tolist()) for row, cols, _ in results] == [(1, [1])]
+
+
+class TestBlockedMax:
+    """Test blocked_max helper"""
+
+    def test_highest_score_per_query(self):
+        features = normalize_rows(one_hot_matrix([["a", "b"], ["a"], ["c"]]))
+
+        best = blocked_max(features, features[[1]], block_size=2)
+
+        assert np.allclose(best, [np.sqrt(0.5), 1, 0])
+
+
+class TestBlockPairs:
+    """Test block_pairs helper"""
+
+    def test_distinct_pairs_across_blocks(self):
+        pairs = block_pairs([[0, 1, 2], [2, 1], [3]], max_block_size=10)
+
+        assert pairs.tolist() == [[0, 1], [0, 2], [1, 2]]
+
+    def test_skips_oversized_blocks(self):
+        pairs = block_pairs([[0, 1, 2, 3], [4, 5]], max_block_size=3)
+
+        assert pairs.tolist() == [[4, 5]]
+
+    def test_no_pairs(self):
+        assert block_pairs([[0]], max_block_size=3).shape == (0, 2)
+
+
+class TestPairCosine:
+    """Test pair_cosine helper"""
+
+    def test_scores_each_pair(self):
+        features = normalize_rows(one_hot_matrix([["a", "b"], ["a", "b"], ["c"]]))
+
+        scores = pair_cosine(features, np.array([[0, 1], [0, 2]]))
+
+        assert np.allclose(scores, [1, 0])